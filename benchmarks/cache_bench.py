@@ -0,0 +1,120 @@
+"""
+공유 캐시 백엔드 비교 (DB 없이 여러 워커 프로세스로 실행)
+
+    python -m benchmarks.cache_bench [--workers 4] [--threads 8] [--keys 50] [--load-ms 20]
+    python -m benchmarks.cache_bench --backends memory sqlite redis --redis-url redis://localhost:6379/0
+
+워커 프로세스마다 스레드 여러 개가 같은 키 목록을 동시에 조회 (시험 시작 시 정답표/페이지 적재 폭주)
+- loads: 전체 워커에서 loader(=DB 조회)가 실행된 횟수. memory는 워커마다 따로, 공유 백엔드는 키당 1회가 목표
+- invalidate_ms: 한 워커에서 무효화한 뒤 다른 워커가 새 세대 번호를 보기까지 걸린 시간
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from common.cache.backends import MemoryBackend, RedisBackend, SQLiteBackend
+from common.cache.cache import Cache, InvalidationBus
+
+
+def make_backend(name: str, args):
+    if name == "memory":
+        return MemoryBackend()
+    if name == "sqlite":
+        return SQLiteBackend(os.path.join(args.tmpdir, "cache.sqlite3"), poll_interval=args.poll_interval)
+    return RedisBackend(args.redis_url)
+
+
+def worker(cache: Cache, keys: int, threads: int, load_ms: float, loads, start) -> None:
+    def loader(key: int):
+        with loads.get_lock():
+            loads.value += 1
+        time.sleep(load_ms / 1000)
+        return ("value", key)
+
+    def run() -> None:
+        start.wait()
+        for key in range(keys):
+            assert cache.get_or_load(key, lambda: loader(key), scope=f"quiz:{key}") == ("value", key)
+
+    pool = [threading.Thread(target=run) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+def watch_generation(bus: InvalidationBus, ready, seen) -> None:
+    bus.generation("quiz:bench")
+    ready.set()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if bus.generation("quiz:bench") > 0:
+            seen.value = time.time()
+            return
+        time.sleep(0.001)
+
+
+def run_backend(name: str, args) -> dict:
+    backend = make_backend(name, args)
+    bus = InvalidationBus(backend)
+    cache = Cache(f"bench_{os.getpid()}_{name}", args.keys, backend, bus)
+
+    ctx = multiprocessing.get_context("fork")
+    loads = ctx.Value("i", 0)
+    start = ctx.Event()
+    processes = [
+        ctx.Process(target=worker, args=(cache, args.keys, args.threads, args.load_ms, loads, start))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    began = time.perf_counter()
+    start.set()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - began
+
+    # 무효화 전파: 다른 프로세스가 세대 번호 변화를 보기까지 시간
+    ready, seen = ctx.Event(), ctx.Value("d", 0.0)
+    watcher = ctx.Process(target=watch_generation, args=(bus, ready, seen))
+    watcher.start()
+    ready.wait()
+    sent = time.time()
+    bus.invalidate("quiz:bench")
+    watcher.join()
+    invalidate_ms = (seen.value - sent) * 1000 if seen.value else None
+
+    return {
+        "backend": name,
+        "loads": loads.value,
+        "lookups": args.workers * args.threads * args.keys,
+        "seconds": round(elapsed, 3),
+        "invalidate_ms": round(invalidate_ms, 1) if invalidate_ms is not None else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["memory", "sqlite"], choices=["memory", "sqlite", "redis"])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--keys", type=int, default=50)
+    parser.add_argument("--load-ms", type=float, default=20, help="loader 1회 처리 시간 (DB 조회 대신)")
+    parser.add_argument("--poll-interval", type=float, default=0.05, help="sqlite 무효화 메시지 폴링 간격 (초)")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    args = parser.parse_args()
+
+    print(f"{'backend':8s} {'loads':>7s} {'lookups':>8s} {'seconds':>8s} {'invalidate_ms':>14s}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        args.tmpdir = tmpdir
+        for name in args.backends:
+            r = run_backend(name, args)
+            invalidate = "-" if r["invalidate_ms"] is None else f"{r['invalidate_ms']:.1f}"
+            print(f"{r['backend']:8s} {r['loads']:7d} {r['lookups']:8d} {r['seconds']:8.3f} {invalidate:>14s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+벤치마크 요청 드라이버 (같은 인터페이스로 in-process ASGI / 실제 HTTP 서버 호출)
+
+- ASGIClient: src.main:app을 같은 프로세스의 이벤트 루프에서 직접 호출 (네트워크/uvicorn 비용 제외)
+- HTTPClient: 실행 중인 서버에 keep-alive 연결로 요청 (스레드별 연결)
+- 응답의 Server-Timing 헤더(SERVER_TIMING=true)에서 요청당 SQL 문장 수/시간을 읽음
+"""
+import asyncio
+import http.client
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+SQL_TIMING = re.compile(r'sql;dur=([0-9.]+);desc="(\d+)"')
+
+
+class Result(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+    def sql(self) -> Optional[Tuple[int, float]]:
+        """(SQL 문장 수, SQL 실행 시간 ms). Server-Timing이 꺼져 있으면 None"""
+        match = SQL_TIMING.search(self.headers.get("server-timing", ""))
+        if match is None:
+            return None
+        return int(match.group(2)), float(match.group(1))
+
+
+def _request_headers(token: Optional[str], body: Optional[dict], headers: Optional[dict]) -> Tuple[dict, Optional[bytes]]:
+    merged = dict(headers or {})
+    if token:
+        merged["Authorization"] = f"Bearer {token}"
+    payload = None
+    if body is not None:
+        payload = json.dumps(body).encode()
+        merged["Content-Type"] = "application/json"
+    return merged, payload
+
+
+class ASGIClient:
+    """ASGI 앱 직접 호출 (lifespan startup/shutdown 포함)"""
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_task = None
+        self._lifespan_receive: Optional[asyncio.Queue] = None
+        self._lifespan_send: Optional[asyncio.Queue] = None
+
+    async def start(self) -> None:
+        self._lifespan_receive, self._lifespan_send = asyncio.Queue(), asyncio.Queue()
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan_task = asyncio.create_task(
+            self.app(scope, self._lifespan_receive.get, self._lifespan_send.put)
+        )
+        await self._lifespan("startup")
+
+    async def close(self) -> None:
+        if self._lifespan_task is not None:
+            await self._lifespan("shutdown")
+            await self._lifespan_task
+            self._lifespan_task = None
+
+    async def _lifespan(self, event: str) -> None:
+        await self._lifespan_receive.put({"type": f"lifespan.{event}"})
+        message = await self._lifespan_send.get()
+        if message["type"] != f"lifespan.{event}.complete":
+            raise RuntimeError(f"lifespan {event} 실패: {message.get('message')}")
+
+    async def request(self, method: str, path: str, token: Optional[str] = None,
+                      body: Optional[dict] = None, headers: Optional[dict] = None) -> Result:
+        headers, payload = _request_headers(token, body, headers)
+        raw_path, _, query = path.partition("?")
+        raw_headers = [(b"host", b"bench")] + [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+        if payload is not None:
+            raw_headers.append((b"content-length", str(len(payload)).encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": raw_path,
+            "raw_path": raw_path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+        }
+
+        status = 500
+        response_headers: Dict[str, str] = {}
+        chunks = []
+        request_sent = False
+        done = asyncio.Event()
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": payload or b"", "more_body": False}
+            # 응답이 끝날 때까지 연결 유지
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for key, value in message.get("headers", []):
+                    response_headers[key.decode().lower()] = value.decode()
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            done.set()
+        return Result(status, response_headers, b"".join(chunks))
+
+
+class HTTPClient:
+    """실행 중인 서버 호출 (블로킹 http.client를 스레드풀에서 실행, 스레드별 keep-alive 연결)"""
+
+    def __init__(self, base_url: str, concurrency: int):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench-http")
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def request(self, method: str, path: str, token: Optional[str] = None,
+                      body: Optional[dict] = None, headers: Optional[dict] = None) -> Result:
+        headers, payload = _request_headers(token, body, headers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._request, method, path, headers, payload)
+
+    def _request(self, method: str, path: str, headers: dict, payload: Optional[bytes]) -> Result:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=120)
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            self._local.conn = None
+            raise
+        return Result(response.status, {k.lower(): v for k, v in response.getheaders()}, data)
@@ -0,0 +1,335 @@
+"""
+시험 시나리오 벤치마크 (로그인 폭주 -> 응시 시작 -> 페이지 조회 & 임시 저장 -> 제출 -> 결과 조회 + 관리자 조회)
+
+    # 일회성 PostgreSQL에 마이그레이션 & 적재 후 in-process 실행
+    python -m benchmarks.exam --temp-postgres --seed --json before.json
+    # 로컬 DB (python -m benchmarks.seed로 적재해 둔 데이터), 이전 결과와 비교
+    python -m benchmarks.exam --json after.json --baseline before.json
+    # 실행 중인 서버 대상 (SERVER_TIMING=true로 띄워야 요청당 SQL 측정)
+    SERVER_TIMING=true uvicorn src.main:app --workers 4 &
+    python -m benchmarks.exam --driver http --url http://127.0.0.1:8000 --json http.json
+
+- 단계마다 모든 응시자가 동시에 시작 (--concurrency로 동시 요청 수 제한), 답안 선택은 --rng-seed로 고정
+- 결과 JSON: 엔드포인트(라우트 템플릿)별 p50/p95/p99/max 지연 시간, 처리량, 상태 코드, 요청당 SQL 문장 수/시간
+  + 단계별 소요 시간 + 실행 환경(커밋, 드라이버, 적재 규모). 커밋 간 결과 파일을 그대로 diff 가능
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.client import ASGIClient, HTTPClient, Result
+from benchmarks.temp_postgres import migrate, temporary_postgres
+
+# 엔드포인트 라벨 (보고서 출력 순서)
+LOGIN = "POST /user/login"
+START = "POST /quiz/user/{quiz_id}/attempt"
+PAGE = "GET /quiz/user/{quiz_id}"
+PROGRESS = "PUT /quiz/user/{quiz_id}/attempt/{attempt_id}/progress"
+SUBMIT = "POST /quiz/user/{quiz_id}/attempt/{attempt_id}/submit"
+RECORD = "GET /quiz/user/attempt/{attempt_id}"
+USER_LIST = "GET /quiz/user/list"
+ADMIN_LIST = "GET /quiz/list"
+ADMIN_DETAIL = "GET /quiz/{quiz_id}"
+ADMIN_STATS = "GET /quiz/{quiz_id}/stats"
+ENDPOINTS = (LOGIN, START, PAGE, PROGRESS, SUBMIT, RECORD, USER_LIST, ADMIN_LIST, ADMIN_DETAIL, ADMIN_STATS)
+
+# (시작 시각, 종료 시각, 상태 코드, (SQL 문장 수, SQL ms) 또는 None)
+Sample = Tuple[float, float, int, Optional[Tuple[int, float]]]
+
+
+class Recorder:
+    """엔드포인트별 요청 기록"""
+
+    def __init__(self, client):
+        self.client = client
+        self.samples: Dict[str, List[Sample]] = defaultdict(list)
+
+    async def call(self, label: str, method: str, path: str, *expected: int, **kwargs) -> Result:
+        start = time.perf_counter()
+        result = await self.client.request(method, path, **kwargs)
+        self.samples[label].append((start, time.perf_counter(), result.status, result.sql()))
+        if expected and result.status not in expected:
+            raise RuntimeError(f"{method} {path} -> {result.status}: {result.body[:300]!r}")
+        return result
+
+    def report(self) -> Dict[str, dict]:
+        return {label: summarize(self.samples[label]) for label in ENDPOINTS if self.samples.get(label)}
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    return sorted_values[max(0, math.ceil(p * len(sorted_values)) - 1)]
+
+
+def summarize(samples: List[Sample]) -> dict:
+    latencies = sorted((end - start) * 1000 for start, end, _, _ in samples)
+    span = max(end for _, end, _, _ in samples) - min(start for start, _, _, _ in samples)
+    statuses = Counter(status for _, _, status, _ in samples)
+    summary = {
+        "requests": len(samples),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "max_ms": round(latencies[-1], 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "throughput_rps": round(len(samples) / span, 1) if span > 0 else None,
+        "sql_per_request": None,
+        "sql_per_request_max": None,
+        "sql_ms_mean": None,
+    }
+    sql = [timing for _, _, _, timing in samples if timing is not None]
+    if sql:
+        summary["sql_per_request"] = round(statistics.fmean(count for count, _ in sql), 2)
+        summary["sql_per_request_max"] = max(count for count, _ in sql)
+        summary["sql_ms_mean"] = round(statistics.fmean(ms for _, ms in sql), 2)
+    return summary
+
+
+class Examinee:
+    """가상 응시자 1명의 상태"""
+
+    def __init__(self, email: str, quiz_id: int, rng: random.Random):
+        self.email = email
+        self.quiz_id = quiz_id
+        self.rng = rng
+        self.token: Optional[str] = None
+        self.attempt_id: Optional[int] = None
+        self.answers: Dict[int, int] = {}
+
+
+async def run_scenario(recorder: Recorder, examinees: List[Examinee], admin_email: Optional[str],
+                       password: str, concurrency: int, save_progress: bool, admin_reads: int) -> Dict[str, dict]:
+    """단계별로 모든 응시자를 동시에 진행. 단계별 소요 시간 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    phases: Dict[str, dict] = {}
+
+    async def phase(name: str, step, items) -> None:
+        async def bounded(item):
+            async with semaphore:
+                await step(item)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(bounded(item) for item in items))
+        phases[name] = {"seconds": round(time.perf_counter() - start, 3), "users": len(items)}
+
+    async def login(user: Examinee) -> None:
+        result = await recorder.call(
+            LOGIN, "POST", "/user/login", 200, body={"email": user.email, "password": password}
+        )
+        user.token = result.json()["access_token"]
+
+    async def start(user: Examinee) -> None:
+        result = await recorder.call(START, "POST", f"/quiz/user/{user.quiz_id}/attempt", 200, token=user.token)
+        user.attempt_id = result.json()["id"]
+
+    async def take_exam(user: Examinee) -> None:
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            result = await recorder.call(
+                PAGE, "GET", f"/quiz/user/{user.quiz_id}?page={page}&attempt_id={user.attempt_id}", 200,
+                token=user.token,
+            )
+            detail = result.json()
+            total_pages = detail["total_pages"]
+            answers = [
+                {"question_id": question["id"], "choice_id": user.rng.choice(question["choices"])["id"]}
+                for question in detail["questions"] if question["choices"]
+            ]
+            user.answers.update((a["question_id"], a["choice_id"]) for a in answers)
+            if save_progress and answers:
+                await recorder.call(
+                    PROGRESS, "PUT", f"/quiz/user/{user.quiz_id}/attempt/{user.attempt_id}/progress", 202,
+                    token=user.token, body={"answers": answers},
+                )
+            page += 1
+
+    async def submit(user: Examinee) -> None:
+        answers = [{"question_id": q, "choice_id": c} for q, c in sorted(user.answers.items())]
+        await recorder.call(
+            SUBMIT, "POST", f"/quiz/user/{user.quiz_id}/attempt/{user.attempt_id}/submit", 200, 202,
+            token=user.token, body={"answers": answers},
+        )
+
+    async def review(user: Examinee) -> None:
+        await recorder.call(RECORD, "GET", f"/quiz/user/attempt/{user.attempt_id}", 200, token=user.token)
+        await recorder.call(USER_LIST, "GET", "/quiz/user/list?completed=true", 200, token=user.token)
+
+    await phase("login_storm", login, examinees)
+    await phase("attempt_start", start, examinees)
+    await phase("page_reads", take_exam, examinees)
+    await phase("submit", submit, examinees)
+    await phase("review", review, examinees)
+
+    if admin_email and admin_reads > 0:
+        admin = Examinee(admin_email, 0, random.Random(0))
+        await login(admin)
+        quiz_ids = sorted({user.quiz_id for user in examinees})
+
+        async def admin_read(i: int) -> None:
+            quiz_id = quiz_ids[i % len(quiz_ids)]
+            await recorder.call(ADMIN_LIST, "GET", "/quiz/list?page=1&page_size=20", 200, token=admin.token)
+            await recorder.call(ADMIN_DETAIL, "GET", f"/quiz/{quiz_id}?page=1&page_size=10", 200, token=admin.token)
+            await recorder.call(ADMIN_STATS, "GET", f"/quiz/{quiz_id}/stats", 200, token=admin.token)
+
+        await phase("admin_reads", admin_read, range(admin_reads))
+    return phases
+
+
+def git_revision() -> Optional[str]:
+    """현재 커밋 (작업 트리에 변경이 있으면 -dirty)"""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def compare(baseline: dict, result: dict) -> None:
+    """이전 결과 대비 변화 출력 (지연 시간 & 요청당 SQL)"""
+    print(f"\n{'endpoint':58s} {'p50_ms':>18s} {'p95_ms':>18s} {'sql/req':>14s}")
+    for label, current in result["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(label)
+        if before is None:
+            continue
+        cells = []
+        for key, width in (("p50_ms", 18), ("p95_ms", 18), ("sql_per_request", 14)):
+            old, new = before.get(key), current.get(key)
+            if old is None or new is None:
+                cells.append(f"{'-':>{width}s}")
+            elif old:
+                cells.append(f"{f'{old}->{new} ({(new - old) / old * 100:+.0f}%)':>{width}s}")
+            else:
+                cells.append(f"{f'{old}->{new}':>{width}s}")
+        print(f"{label:58s} {' '.join(cells)}")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    # common.db.database는 import 시점에 DATABASE_URL을 읽으므로 (--temp-postgres) 여기서 import
+    from benchmarks.seed import BENCH_PASSWORD, bench_ids, bench_users, seed
+    from common.db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.seed:
+            seed(db, args.users, args.quizzes, args.questions, args.choices, args.attempts)
+        ids = bench_ids(db)
+        users = bench_users(db)
+    finally:
+        db.close()
+    if not ids["quiz"]:
+        raise RuntimeError("벤치마크 데이터가 없습니다. --seed 또는 python -m benchmarks.seed로 먼저 적재하세요.")
+
+    admin_email = next((email for email, is_admin in users if is_admin), None)
+    emails = [email for email, is_admin in users if not is_admin][:args.examinees]
+    quiz_ids = ids["quiz"][:args.exam_quizzes]
+    examinees = [
+        Examinee(email, quiz_ids[i % len(quiz_ids)], random.Random(args.rng_seed + i))
+        for i, email in enumerate(emails)
+    ]
+
+    if args.driver == "asgi":
+        from common.middleware import metrics
+        from src.main import app
+
+        metrics.SERVER_TIMING = True
+        client = ASGIClient(app)
+    else:
+        client = HTTPClient(args.url, args.concurrency)
+
+    recorder = Recorder(client)
+    await client.start()
+    try:
+        start = time.perf_counter()
+        phases = await run_scenario(
+            recorder, examinees, admin_email, BENCH_PASSWORD, args.concurrency, not args.no_progress, args.admin_reads
+        )
+        total = time.perf_counter() - start
+    finally:
+        await client.close()
+
+    requests = sum(len(samples) for samples in recorder.samples.values())
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "driver": args.driver,
+            "url": args.url if args.driver == "http" else None,
+            "examinees": len(examinees),
+            "exam_quizzes": len(quiz_ids),
+            "concurrency": args.concurrency,
+            "save_progress": not args.no_progress,
+            "seeded": {
+                "users": args.users, "quizzes": args.quizzes, "questions": args.questions,
+                "choices": args.choices, "attempts": args.attempts,
+            } if args.seed else None,
+        },
+        "total": {
+            "seconds": round(total, 3),
+            "requests": requests,
+            "throughput_rps": round(requests / total, 1) if total > 0 else None,
+        },
+        "phases": phases,
+        "endpoints": recorder.report(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--driver", choices=("asgi", "http"), default="asgi",
+                        help="asgi: src.main:app을 같은 프로세스에서 호출 / http: --url 서버 호출")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--temp-postgres", action="store_true",
+                        help="일회성 PostgreSQL을 띄워 마이그레이션 후 사용 (--seed 함께 사용)")
+    parser.add_argument("--seed", action="store_true", help="실행 전 벤치마크 데이터 재적재")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--quizzes", type=int, default=100)
+    parser.add_argument("--questions", type=int, default=50, help="퀴즈당 문제 수")
+    parser.add_argument("--choices", type=int, default=4, help="문제당 선택지 수")
+    parser.add_argument("--attempts", type=int, default=10000, help="기존 응시 기록 수")
+    parser.add_argument("--examinees", type=int, default=200, help="시나리오를 진행할 응시자 수")
+    parser.add_argument("--exam-quizzes", type=int, default=1, help="응시자를 나눠 배정할 퀴즈 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--no-progress", action="store_true", help="페이지별 답안 임시 저장 생략")
+    parser.add_argument("--admin-reads", type=int, default=50, help="관리자 목록/상세/통계 조회 횟수")
+    parser.add_argument("--rng-seed", type=int, default=42)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    if args.temp_postgres:
+        if args.driver == "http":
+            parser.error("--temp-postgres는 --driver asgi에서만 사용할 수 있습니다.")
+        with temporary_postgres() as url:
+            migrate(url)
+            os.environ["DATABASE_URL"] = url
+            args.seed = True
+            result = asyncio.run(run(args))
+    else:
+        result = asyncio.run(run(args))
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(json.load(f), result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+인덱스 유무에 따른 엔드포인트별 DB 조회 지연 시간 비교 (로컬 PostgreSQL 전용, DATABASE_URL 사용)
+
+    python -m benchmarks.index_bench [--seed] [--iterations 200] [--json result.json]
+
+1. (--seed) benchmarks.seed로 대량 데이터 적재
+2. without: 모델에 선언된 조회 인덱스(마이그레이션 0003)를 모두 DROP 후 측정
+3. with: 인덱스를 다시 만들고 ANALYZE 후 측정
+각 엔드포인트가 실행하는 repository 함수를 직접 호출하며, 매 호출마다 인프로세스 캐시를 비워 항상 DB를 조회
+벤치마크가 끝나면 인덱스는 생성된 상태로 남음
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy.orm import Session
+
+from common.db.database import SessionLocal, engine
+from src.quiz.model.answer import Answer
+from src.quiz.model.choice import Choice
+from src.quiz.model.question import Question
+from src.quiz.model.quiz import Quiz
+from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.repository.cache import answer_key_cache, quiz_content_cache, quiz_page_cache
+from src.quiz.repository.repository import check_existing_quiz, get_quiz_by_id, get_quiz_detail
+from src.quiz.repository.user_repository import (get_answer_key, get_user_quiz_detail,
+                                                 get_user_quiz_list, iter_quiz_results)
+
+from benchmarks.seed import analyze, bench_ids, seed
+
+
+def lookup_indexes() -> list:
+    """__table_args__로 선언한 조회 인덱스 (기본 키 컬럼의 index=True 인덱스 제외)"""
+    indexes = []
+    for model in (Quiz, Question, Choice, QuizRecord, Answer):
+        for index in model.__table__.indexes:
+            columns = list(index.columns)
+            if len(columns) == 1 and columns[0].primary_key:
+                continue
+            indexes.append(index)
+    return sorted(indexes, key=lambda index: index.name)
+
+
+def drop_indexes() -> None:
+    for index in lookup_indexes():
+        index.drop(engine, checkfirst=True)
+
+
+def create_indexes() -> None:
+    for index in lookup_indexes():
+        index.create(engine, checkfirst=True)
+
+
+def endpoints(ids: Dict[str, List[int]]) -> Dict[str, Callable[[Session, random.Random], object]]:
+    quiz_ids, user_ids = ids["quiz"], ids["user"]
+
+    def create_quiz(db, rng):
+        return check_existing_quiz(db, f"bench-quiz-{rng.randint(1, len(quiz_ids))}")
+
+    def admin_detail(db, rng):
+        return get_quiz_detail(db, rng.choice(quiz_ids), page=1, page_size=10)
+
+    def user_detail(db, rng):
+        return get_user_quiz_detail(db, get_quiz_by_id(db, rng.choice(quiz_ids)), page=2)
+
+    def submit(db, rng):
+        return get_answer_key(db, rng.choice(quiz_ids))
+
+    def completed_list(db, rng):
+        return get_user_quiz_list(db, rng.choice(user_ids), completed=True)
+
+    def uncompleted_list(db, rng):
+        return get_user_quiz_list(db, rng.choice(user_ids), completed=False)
+
+    def export(db, rng):
+        return sum(len(batch) for batch in iter_quiz_results(db, rng.choice(quiz_ids)))
+
+    return {
+        "POST /quiz/create (제목 중복 확인)": create_quiz,
+        "GET /quiz/{quiz_id}": admin_detail,
+        "GET /quiz/user/{quiz_id}": user_detail,
+        "POST .../submit (정답표 로드)": submit,
+        "GET /quiz/user/list?completed=true": completed_list,
+        "GET /quiz/user/list?completed=false": uncompleted_list,
+        "GET /quiz/results/export?quiz_id=": export,
+    }
+
+
+def clear_caches() -> None:
+    answer_key_cache.clear()
+    quiz_page_cache.clear()
+    quiz_content_cache.clear()
+
+
+def measure(scenarios: dict, iterations: int, seed_value: int) -> Dict[str, dict]:
+    results = {}
+    db = SessionLocal()
+    try:
+        for name, fn in scenarios.items():
+            rng = random.Random(seed_value)  # 두 단계에서 같은 id 순서로 호출
+            fn(db, rng)  # 워밍업
+            db.rollback()
+            samples = []
+            for _ in range(iterations):
+                clear_caches()
+                start = time.perf_counter()
+                fn(db, rng)
+                samples.append((time.perf_counter() - start) * 1000)
+                db.rollback()
+            samples.sort()
+            results[name] = {
+                "p50_ms": round(statistics.median(samples), 3),
+                "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+                "mean_ms": round(statistics.fmean(samples), 3),
+            }
+    finally:
+        db.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", action="store_true", help="측정 전에 benchmarks.seed 기본값으로 데이터 적재")
+    parser.add_argument("--iterations", type=int, default=200, help="엔드포인트별 호출 횟수")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.seed:
+            seed(db, progress=lambda table, rows, s: print(f"seed {table}: {rows} rows {s:.1f}s", file=sys.stderr))
+        ids = bench_ids(db)
+    finally:
+        db.close()
+    if not ids["quiz"] or not ids["user"]:
+        print("벤치마크 데이터가 없습니다. --seed 옵션으로 먼저 적재하세요.", file=sys.stderr)
+        return 1
+
+    scenarios = endpoints(ids)
+    report = {}
+    for phase, prepare in (("without", drop_indexes), ("with", create_indexes)):
+        print(f"[{phase}] 인덱스 준비 중...", file=sys.stderr)
+        prepare()
+        db = SessionLocal()
+        try:
+            analyze(db)
+        finally:
+            db.close()
+        report[phase] = measure(scenarios, args.iterations, seed_value=42)
+
+    print(f"{'endpoint':40s} {'p50 without':>12s} {'p50 with':>10s} {'p95 without':>12s} {'p95 with':>10s} {'speedup':>8s}")
+    for name in scenarios:
+        before, after = report["without"][name], report["with"][name]
+        speedup = before["p50_ms"] / after["p50_ms"] if after["p50_ms"] else float("inf")
+        print(
+            f"{name:40s} {before['p50_ms']:10.2f}ms {after['p50_ms']:8.2f}ms "
+            f"{before['p95_ms']:10.2f}ms {after['p95_ms']:8.2f}ms {speedup:7.1f}x"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
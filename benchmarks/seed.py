@@ -0,0 +1,176 @@
+"""
+벤치마크용 대량 데이터 적재 (로컬 PostgreSQL 전용, DATABASE_URL 사용)
+
+    python -m benchmarks.seed [--users 10000] [--quizzes 2000] [--questions 50] [--choices 4] [--attempts 100000]
+
+- 모든 데이터는 generate_series로 DB 안에서 생성 (클라이언트 왕복 없음)
+- 벤치마크 데이터는 'bench-' 접두사로 구분하며, 다시 실행하면 기존 벤치마크 데이터를 지우고 새로 적재
+- 사용자 비밀번호는 모두 BENCH_PASSWORD, 첫 번째 사용자는 관리자
+"""
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from common.db.database import SessionLocal
+from util.password import pwd_context
+
+BENCH_PREFIX = "bench-"
+BENCH_PASSWORD = "bench-password"
+
+STEPS = (
+    (
+        "user",
+        """
+        INSERT INTO "user" (username, email, password_hash, is_admin)
+        SELECT 'bench-user-' || g, 'bench-' || g || '@example.com', :password_hash, g = 1
+        FROM generate_series(1, :users) AS g
+        """,
+    ),
+    (
+        "quiz",
+        """
+        INSERT INTO quiz (title, description, questions_per_page, num_questions)
+        SELECT 'bench-quiz-' || g, 'benchmark quiz ' || g, 10, :questions
+        FROM generate_series(1, :quizzes) AS g
+        """,
+    ),
+    (
+        "question",
+        """
+        INSERT INTO question (quiz_id, question_text)
+        SELECT q.id, 'question ' || g
+        FROM quiz AS q, generate_series(1, :questions) AS g
+        WHERE q.title LIKE 'bench-%'
+        ORDER BY q.id, g
+        """,
+    ),
+    (
+        "choice",
+        """
+        INSERT INTO choice (question_id, choice_text, is_correct)
+        SELECT qu.id, 'choice ' || g, g = 1 + qu.id % :choices
+        FROM question AS qu
+        JOIN quiz AS q ON q.id = qu.quiz_id
+        CROSS JOIN generate_series(1, :choices) AS g
+        WHERE q.title LIKE 'bench-%'
+        ORDER BY qu.id, g
+        """,
+    ),
+    (
+        "quiz_record",
+        """
+        INSERT INTO quiz_record (quiz_id, user_id, score, status)
+        SELECT q.ids[1 + g % array_length(q.ids, 1)],
+               u.ids[1 + (g * 7919) % array_length(u.ids, 1)],
+               (g * 37) % 101,
+               'submitted'
+        FROM generate_series(1, :attempts) AS g,
+             (SELECT array_agg(id ORDER BY id) AS ids FROM quiz WHERE title LIKE 'bench-%') AS q,
+             (SELECT array_agg(id ORDER BY id) AS ids FROM "user" WHERE email LIKE 'bench-%') AS u
+        """,
+    ),
+    (
+        "answer",
+        """
+        INSERT INTO answer (quiz_record_id, question_id, choice_id)
+        SELECT r.id, qu.id, c.id
+        FROM quiz_record AS r
+        JOIN quiz AS q ON q.id = r.quiz_id
+        JOIN question AS qu ON qu.quiz_id = r.quiz_id
+        JOIN choice AS c ON c.question_id = qu.id
+        WHERE q.title LIKE 'bench-%'
+          AND c.choice_text = 'choice ' || (1 + (r.id + qu.id) % :choices)
+        """,
+    ),
+)
+
+
+def reset(db: Session) -> None:
+    """기존 벤치마크 데이터 삭제 (문제/선택지/응시 기록/답안은 ON DELETE CASCADE)"""
+    db.execute(text("DELETE FROM quiz WHERE title LIKE 'bench-%'"))
+    db.execute(text("""DELETE FROM "user" WHERE email LIKE 'bench-%'"""))
+    db.commit()
+
+
+def seed(
+    db: Session,
+    users: int = 10000,
+    quizzes: int = 2000,
+    questions: int = 50,
+    choices: int = 4,
+    attempts: int = 100000,
+    progress: Callable[[str, int, float], None] = None
+) -> Dict[str, int]:
+    """벤치마크 데이터 적재 후 ANALYZE. 테이블별 적재 행 수 반환"""
+    params = {
+        "users": users,
+        "quizzes": quizzes,
+        "questions": questions,
+        "choices": choices,
+        "attempts": attempts,
+        "password_hash": pwd_context.hash(BENCH_PASSWORD),
+    }
+
+    reset(db)
+    counts = {}
+    for table, sql in STEPS:
+        start = time.perf_counter()
+        counts[table] = db.execute(text(sql), params).rowcount
+        db.commit()
+        if progress:
+            progress(table, counts[table], time.perf_counter() - start)
+
+    analyze(db)
+    return counts
+
+
+def analyze(db: Session) -> None:
+    """플래너 통계 갱신"""
+    for table in ("user", "quiz", "question", "choice", "quiz_record", "answer"):
+        db.execute(text(f'ANALYZE "{table}"'))
+    db.commit()
+
+
+def bench_ids(db: Session) -> Dict[str, List[int]]:
+    """시나리오에서 사용할 벤치마크 퀴즈/사용자 id 목록"""
+    quiz_ids = db.execute(text("SELECT id FROM quiz WHERE title LIKE 'bench-%' ORDER BY id")).scalars().all()
+    user_ids = db.execute(
+        text("""SELECT id FROM "user" WHERE email LIKE 'bench-%' ORDER BY id""")
+    ).scalars().all()
+    return {"quiz": list(quiz_ids), "user": list(user_ids)}
+
+
+def bench_users(db: Session) -> List[Tuple[str, bool]]:
+    """벤치마크 사용자 (email, is_admin) 목록. 비밀번호는 모두 BENCH_PASSWORD"""
+    rows = db.execute(
+        text("""SELECT email, is_admin FROM "user" WHERE email LIKE 'bench-%' ORDER BY id""")
+    ).all()
+    return [(email, is_admin) for email, is_admin in rows]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--quizzes", type=int, default=2000)
+    parser.add_argument("--questions", type=int, default=50, help="퀴즈당 문제 수")
+    parser.add_argument("--choices", type=int, default=4, help="문제당 선택지 수")
+    parser.add_argument("--attempts", type=int, default=100000, help="응시 기록 수 (답안은 응시 기록 x 문제 수)")
+    args = parser.parse_args()
+
+    def progress(table: str, rows: int, seconds: float) -> None:
+        print(f"{table:12s} {rows:>10d} rows {seconds:8.2f}s", file=sys.stderr)
+
+    db = SessionLocal()
+    try:
+        seed(db, args.users, args.quizzes, args.questions, args.choices, args.attempts, progress)
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
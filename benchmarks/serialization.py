@@ -0,0 +1,172 @@
+"""
+퀴즈 페이지 응답 직렬화 비용 비교 (DB 없이 in-process ASGI 호출)
+
+    python -m benchmarks.serialization [--sizes 10 100 1000] [--iterations 200]
+
+같은 내용의 페이지를 response_model이 같은 세 라우트로 응답해 요청당 처리 시간 비교
+- model: 중첩 Pydantic 모델 생성 후 FastAPI가 response_model로 다시 검증 (기존 방식)
+- dict: 결과 행에서 만든 dict를 response_model로 한 번만 검증 (기본값)
+- fast: dict를 검증 없이 ORJSONResponse로 바로 직렬화 (FAST_SERIALIZATION=true)
+세 방식의 응답 본문이 같은지도 함께 확인
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from benchmarks.client import ASGIClient
+from src.quiz.schema.schema import (ChoiceResponse, QuestionResponse,
+                                    QuizDetailResponse)
+from src.quiz.schema.user_schema import (UserChoiceResponse,
+                                         UserQuestionResponse,
+                                         UserQuizDetailResponse)
+
+CHOICES_PER_QUESTION = 4
+CREATED_AT = datetime(2025, 3, 1, 9, 30, 15, 123456)
+
+
+def page_rows(size: int) -> list:
+    """(문제 id, 문제 내용, ((선택지 id, 선택지 내용, 정답 여부), ...)) 목록"""
+    return [
+        (
+            q,
+            f"question {q}: " + "본문 " * 20,
+            tuple((q * 10 + c, f"choice {c} of question {q}", c == 0) for c in range(CHOICES_PER_QUESTION)),
+        )
+        for q in range(1, size + 1)
+    ]
+
+
+def user_models(rows: list) -> UserQuizDetailResponse:
+    return UserQuizDetailResponse(
+        id=1, title="bench", description="serialization bench", current_page=1, total_pages=1,
+        questions=[
+            UserQuestionResponse(
+                id=question_id, question_text=text,
+                choices=[UserChoiceResponse(id=choice_id, choice_text=choice_text)
+                         for choice_id, choice_text, _ in choices],
+            )
+            for question_id, text, choices in rows
+        ],
+    )
+
+
+def user_dict(rows: list) -> dict:
+    return {
+        "id": 1, "title": "bench", "description": "serialization bench", "current_page": 1, "total_pages": 1,
+        "questions": [
+            {
+                "id": question_id, "question_text": text,
+                "choices": [{"id": choice_id, "choice_text": choice_text} for choice_id, choice_text, _ in choices],
+            }
+            for question_id, text, choices in rows
+        ],
+    }
+
+
+def admin_models(rows: list) -> QuizDetailResponse:
+    return QuizDetailResponse(
+        id=1, title="bench", description="serialization bench", created_at=CREATED_AT, updated_at=CREATED_AT,
+        total_questions=len(rows), next_cursor=None,
+        questions=[
+            QuestionResponse(
+                id=question_id, question_text=text,
+                choices=[ChoiceResponse(id=choice_id, choice_text=choice_text, is_correct=is_correct)
+                         for choice_id, choice_text, is_correct in choices],
+            )
+            for question_id, text, choices in rows
+        ],
+    )
+
+
+def admin_dict(rows: list) -> dict:
+    return {
+        "id": 1, "title": "bench", "description": "serialization bench", "created_at": CREATED_AT,
+        "updated_at": CREATED_AT, "total_questions": len(rows), "next_cursor": None,
+        "questions": [
+            {
+                "id": question_id, "question_text": text,
+                "choices": [
+                    {"id": choice_id, "choice_text": choice_text, "is_correct": is_correct}
+                    for choice_id, choice_text, is_correct in choices
+                ],
+            }
+            for question_id, text, choices in rows
+        ],
+    }
+
+
+def build_app(rows_by_size: dict) -> FastAPI:
+    """/{endpoint}/{mode}/{size} 라우트 (응답 내용 생성 비용 포함)"""
+    app = FastAPI()
+    for endpoint, model, to_models, to_dict in (
+        ("user", UserQuizDetailResponse, user_models, user_dict),
+        ("admin", QuizDetailResponse, admin_models, admin_dict),
+    ):
+        def register(to_models=to_models, to_dict=to_dict, model=model, endpoint=endpoint):
+            @app.get(f"/{endpoint}/model/{{size}}", response_model=model)
+            async def as_models(size: int):
+                return to_models(rows_by_size[size])
+
+            @app.get(f"/{endpoint}/dict/{{size}}", response_model=model)
+            async def as_dict(size: int):
+                return to_dict(rows_by_size[size])
+
+            @app.get(f"/{endpoint}/fast/{{size}}", response_model=model)
+            async def as_fast(size: int):
+                return ORJSONResponse(to_dict(rows_by_size[size]))
+
+        register()
+    return app
+
+
+async def run(sizes: list, iterations: int) -> list:
+    client = ASGIClient(build_app({size: page_rows(size) for size in sizes}))
+    results = []
+    for endpoint in ("user", "admin"):
+        for size in sizes:
+            bodies = {}
+            for mode in ("model", "dict", "fast"):
+                path = f"/{endpoint}/{mode}/{size}"
+                response = await client.request("GET", path)
+                assert response.status == 200, response.body
+                bodies[mode] = response.body
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    await client.request("GET", path)
+                elapsed = (time.perf_counter() - start) / iterations
+                results.append({
+                    "endpoint": endpoint, "questions": size, "mode": mode,
+                    "us_per_request": round(elapsed * 1e6, 1), "bytes": len(response.body),
+                })
+            parsed = [json.loads(body) for body in bodies.values()]
+            if any(body != parsed[0] for body in parsed[1:]):
+                print(f"경고: {endpoint} {size}문항 응답 본문이 방식마다 다릅니다.")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="페이지당 문제 수")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.sizes, args.iterations))
+    baseline = {(r["endpoint"], r["questions"]): r["us_per_request"] for r in results if r["mode"] == "model"}
+    print(f"{'endpoint':8s} {'questions':>9s} {'mode':6s} {'us/request':>12s} {'vs model':>9s} {'bytes':>9s}")
+    for r in results:
+        ratio = baseline[(r["endpoint"], r["questions"])] / r["us_per_request"]
+        print(f"{r['endpoint']:8s} {r['questions']:9d} {r['mode']:6s} {r['us_per_request']:12.1f} "
+              f"{ratio:8.2f}x {r['bytes']:9d}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
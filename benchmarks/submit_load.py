@@ -0,0 +1,186 @@
+"""
+시험 종료 직후 제출 폭주 부하 테스트 (실행 중인 서버 대상, HTTP)
+
+    python -m benchmarks.seed --attempts 0                      # 최초 1회
+    SUBMIT_MODE=sync  uvicorn src.main:app --workers 4 &         # 1) 즉시 채점
+    python -m benchmarks.submit_load --users 2000 --json sync.json
+    SUBMIT_MODE=queue uvicorn src.main:app --workers 4 &         # 2) 대기열 채점
+    python -m benchmarks.submit_load --users 2000 --json queue.json
+
+1. 벤치마크 사용자 --users명의 토큰을 서버와 같은 키로 직접 발급 (로그인 bcrypt 비용 제외)
+2. 사용자마다 응시 시작 (측정 제외)
+3. 모든 사용자가 동시에 전체 답안 제출 -> 제출 응답 지연 시간 p50/p95/p99/max
+4. 202(대기열 모드)면 모든 응시 기록이 graded가 될 때까지 폴링해 전체 채점 완료 시간도 측정
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from sqlalchemy import text
+
+from common.db.database import SessionLocal
+from util.security import create_access_token
+
+from benchmarks.seed import bench_ids
+
+
+class Client:
+    """스레드별 keep-alive HTTP 연결"""
+
+    def __init__(self, base_url: str):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, token: str, body: Optional[dict] = None) -> Tuple[int, dict]:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=120)
+        headers = {"Authorization": f"Bearer {token}"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            self._local.conn = None
+            raise
+        return response.status, json.loads(data) if data else {}
+
+
+def percentile(samples: List[float], p: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def load_quiz(quiz_id: int) -> Tuple[Dict[int, List[int]], list]:
+    """(문제 id -> 선택지 id 목록, 벤치마크 일반 사용자 (id, email) 목록)"""
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            text(
+                "SELECT c.question_id, c.id FROM choice AS c JOIN question AS q ON q.id = c.question_id "
+                "WHERE q.quiz_id = :quiz_id ORDER BY c.question_id, c.id"
+            ),
+            {"quiz_id": quiz_id},
+        ).all()
+        users = db.execute(
+            text("""SELECT id, email FROM "user" WHERE email LIKE 'bench-%' AND NOT is_admin ORDER BY id""")
+        ).all()
+    finally:
+        db.close()
+    choices: Dict[int, List[int]] = {}
+    for question_id, choice_id in rows:
+        choices.setdefault(question_id, []).append(choice_id)
+    return choices, users
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=1000, help="동시에 제출하는 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=0, help="동시 연결 수 (기본값: --users)")
+    parser.add_argument("--quiz-id", type=int, help="기본값: 첫 번째 벤치마크 퀴즈")
+    parser.add_argument("--timeout", type=float, default=600, help="대기열 채점 완료 대기 시간 (초)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ids = bench_ids(db)
+    finally:
+        db.close()
+    if not ids["quiz"]:
+        print("벤치마크 데이터가 없습니다. python -m benchmarks.seed로 먼저 적재하세요.", file=sys.stderr)
+        return 1
+    quiz_id = args.quiz_id or ids["quiz"][0]
+    choices, users = load_quiz(quiz_id)
+    users = users[:args.users]
+
+    client = Client(args.url)
+    tokens = [
+        create_access_token({"sub": email, "user_id": user_id, "is_admin": False})
+        for user_id, email in users
+    ]
+    concurrency = args.concurrency or len(tokens)
+    rng = random.Random(42)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, 64)) as pool:
+        started = list(pool.map(lambda token: client.request("POST", f"/quiz/user/{quiz_id}/attempt", token), tokens))
+    attempt_ids = [body["id"] for _, body in started]
+    payloads = [
+        {"answers": [{"question_id": q, "choice_id": rng.choice(c)} for q, c in choices.items()]}
+        for _ in tokens
+    ]
+
+    # 모든 스레드가 준비되면 동시에 제출 (시험 종료 시점 재현)
+    barrier = threading.Barrier(concurrency)
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    lock = threading.Lock()
+
+    def submit(i: int) -> None:
+        if i < concurrency:
+            barrier.wait()
+        start = time.perf_counter()
+        status, _ = client.request(
+            "POST", f"/quiz/user/{quiz_id}/attempt/{attempt_ids[i]}/submit", tokens[i], payloads[i]
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    burst_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(submit, range(len(tokens))))
+    burst_seconds = time.perf_counter() - burst_start
+
+    # 대기열 모드면 전체 채점 완료까지 폴링
+    graded_seconds = None
+    if statuses.get(202):
+        remaining = set(range(len(tokens)))
+        deadline = time.perf_counter() + args.timeout
+        while remaining and time.perf_counter() < deadline:
+            for i in list(remaining):
+                _, body = client.request("GET", f"/quiz/user/attempt/{attempt_ids[i]}", tokens[i])
+                if body.get("grading_status") in ("graded", "failed"):
+                    remaining.discard(i)
+            if remaining:
+                time.sleep(0.2)
+        graded_seconds = round(time.perf_counter() - burst_start, 3)
+        if remaining:
+            print(f"시간 초과: 채점 미완료 {len(remaining)}건", file=sys.stderr)
+
+    latencies.sort()
+    result = {
+        "users": len(tokens),
+        "questions": len(choices),
+        "statuses": statuses,
+        "submit_p50_ms": round(statistics.median(latencies), 2),
+        "submit_p95_ms": round(percentile(latencies, 0.95), 2),
+        "submit_p99_ms": round(percentile(latencies, 0.99), 2),
+        "submit_max_ms": round(latencies[-1], 2),
+        "burst_seconds": round(burst_seconds, 3),
+        "all_graded_seconds": graded_seconds,
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+벤치마크용 일회성 PostgreSQL 인스턴스 (컨테이너 없이 로컬 initdb/pg_ctl 사용)
+
+    with temporary_postgres() as url:
+        os.environ["DATABASE_URL"] = url   # common.db.database import 전에 설정
+        migrate(url)
+
+- 임시 디렉터리에 클러스터를 만들고 유닉스 소켓으로만 접속 (TCP 포트를 열지 않음)
+- 속도를 위해 fsync/synchronous_commit을 끄므로, 절대값보다 커밋 간 상대 비교 용도
+- initdb는 root로 실행할 수 없으므로 일반 사용자로 실행해야 함
+- 종료 시 서버를 멈추고 디렉터리 삭제
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+DB_NAME = "quiz_db"
+DB_USER = "postgres"
+PORT = 5432  # 소켓 파일 이름에만 쓰이므로 다른 인스턴스와 겹쳐도 무방
+
+SERVER_OPTIONS = (
+    "-c listen_addresses='' -c fsync=off -c synchronous_commit=off -c full_page_writes=off "
+    "-c max_connections=300 -c shared_buffers=256MB"
+)
+
+
+def find_bindir() -> str:
+    """initdb/pg_ctl 위치 (PATH 또는 pg_config --bindir)"""
+    initdb = shutil.which("initdb")
+    if initdb:
+        return os.path.dirname(initdb)
+    pg_config = shutil.which("pg_config")
+    if pg_config:
+        bindir = subprocess.run([pg_config, "--bindir"], check=True, capture_output=True, text=True).stdout.strip()
+        if os.path.exists(os.path.join(bindir, "initdb")):
+            return bindir
+    raise RuntimeError("initdb를 찾을 수 없습니다. PostgreSQL 서버 패키지를 설치하거나 PATH에 추가하세요.")
+
+
+@contextmanager
+def temporary_postgres(bindir: Optional[str] = None) -> Iterator[str]:
+    """임시 클러스터를 띄우고 빈 quiz_db의 접속 URL 반환"""
+    bindir = bindir or find_bindir()
+    root = tempfile.mkdtemp(prefix="quiz-bench-pg-")
+    data = os.path.join(root, "data")
+
+    def run(*args: str) -> None:
+        subprocess.run([os.path.join(bindir, args[0]), *args[1:]], check=True, capture_output=True)
+
+    try:
+        run("initdb", "-D", data, "-U", DB_USER, "-A", "trust", "-E", "UTF8", "--no-sync")
+        run("pg_ctl", "-D", data, "-l", os.path.join(root, "server.log"), "-w",
+            "-o", f"-k {root} -p {PORT} {SERVER_OPTIONS}", "start")
+        try:
+            run("createdb", "-h", root, "-p", str(PORT), "-U", DB_USER, DB_NAME)
+            yield f"postgresql://{DB_USER}@/{DB_NAME}?host={root}&port={PORT}"
+        finally:
+            run("pg_ctl", "-D", data, "-m", "fast", "-w", "stop")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def migrate(url: str) -> None:
+    """alembic upgrade head (migrations/env.py는 DATABASE_URL 환경 변수를 사용)"""
+    os.environ["DATABASE_URL"] = url
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(["alembic", "-c", os.path.join(root, "alembic.ini"), "upgrade", "head"], check=True, cwd=root)
@@ -0,0 +1,302 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+# 공유 캐시 백엔드 설정
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # memory / sqlite / redis
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "/tmp/quiz-cache.sqlite3")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+# sqlite 백엔드의 무효화 메시지 폴링 간격 (초)
+CACHE_POLL_INTERVAL = float(os.getenv("CACHE_POLL_INTERVAL", "0.2"))
+# sqlite 백엔드에서 만료 항목 & 오래된 무효화 메시지를 정리하는 주기 (쓰기 횟수) & 메시지 보관 시간 (초)
+SQLITE_PURGE_EVERY = 1000
+SQLITE_EVENT_RETENTION = 3600
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str], None]
+
+
+class CacheBackend(ABC):
+    """
+    캐시 저장소 인터페이스 (키: str, 값: bytes)
+    shared가 True면 여러 프로세스가 같은 저장소를 보며, Cache는 로컬 LRU 뒤의 2차 캐시로 사용
+    """
+
+    shared = False
+    name = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없거나 만료됐으면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """저장 (ttl초 후 만료, None이면 만료 없음)"""
+
+    @abstractmethod
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """키가 없을 때만 저장 (프로세스 간 single-flight 잠금). 저장했으면 True"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """삭제 (없으면 무시)"""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """정수 카운터 1 증가 후 값 반환 (만료 없음)"""
+
+    @abstractmethod
+    def publish(self, channel: str, message: str) -> None:
+        """channel을 구독 중인 모든 프로세스에 메시지 전송"""
+
+    @abstractmethod
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        """이 프로세스에서 channel 메시지 수신 시작 (다른 프로세스가 보낸 메시지 포함)"""
+
+
+class MemoryBackend(CacheBackend):
+    """프로세스 내 저장소 (워커 간 공유 없음, 기본값)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._data: Dict[str, tuple] = {}
+        self._handlers: Dict[str, List[MessageHandler]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        with self._lock:
+            if self._live(key) is not None:
+                return False
+            self._data[key] = (value, time.monotonic() + ttl)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._live(key) or 0) + 1
+            self._data[key] = (str(value).encode(), None)
+            return value
+
+    def publish(self, channel: str, message: str) -> None:
+        for handler in list(self._handlers.get(channel, ())):
+            handler(message)
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    한 호스트의 여러 워커 프로세스가 공유하는 SQLite 파일 저장소 (WAL)
+    무효화 메시지는 events 테이블에 쌓고, 구독 스레드가 CACHE_POLL_INTERVAL마다 새 행을 읽음
+    따라서 무효화는 결과적 일관성: 다른 워커는 최대 poll_interval 동안 이전 세대 항목(정답표 등)을 사용할 수 있음
+    연결은 (프로세스, 스레드)마다 따로 열어 fork 후에도 공유하지 않음
+    """
+
+    shared = True
+    name = "sqlite"
+
+    def __init__(self, path: str = CACHE_SQLITE_PATH, poll_interval: float = CACHE_POLL_INTERVAL):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS events "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, message TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connect().execute(
+            "SELECT value FROM kv WHERE key = ? AND (expires IS NULL OR expires > ?)", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl if ttl else None),
+        )
+        self._writes += 1
+        if self._writes % SQLITE_PURGE_EVERY == 0:
+            now = time.time()
+            conn.execute("DELETE FROM kv WHERE expires <= ?", (now,))
+            conn.execute("DELETE FROM events WHERE created < ?", (now - SQLITE_EVENT_RETENTION,))
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM kv WHERE key = ? AND expires <= ?", (key, now))
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO kv (key, value, expires) VALUES (?, ?, ?)", (key, value, now + ttl)
+            ).rowcount == 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return inserted
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM kv WHERE key = ?", (key,))
+
+    def incr(self, key: str) -> int:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+            value = int(row[0]) + 1 if row else 1
+            conn.execute("INSERT OR REPLACE INTO kv (key, value, expires) VALUES (?, ?, NULL)",
+                         (key, str(value).encode()))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def publish(self, channel: str, message: str) -> None:
+        self._connect().execute(
+            "INSERT INTO events (channel, message, created) VALUES (?, ?, ?)", (channel, message, time.time())
+        )
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        last_id = self._connect().execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+
+        def poll() -> None:
+            nonlocal last_id
+            while True:
+                time.sleep(self.poll_interval)
+                try:
+                    rows = self._connect().execute(
+                        "SELECT id, message FROM events WHERE channel = ? AND id > ? ORDER BY id", (channel, last_id)
+                    ).fetchall()
+                except sqlite3.Error:
+                    continue
+                for event_id, message in rows:
+                    last_id = event_id
+                    handler(message)
+
+        threading.Thread(target=poll, name=f"cache-subscriber-{channel}", daemon=True).start()
+        logger.info(
+            "sqlite cache invalidation is polled every %.2fs: this worker may serve stale entries for up to that long",
+            self.poll_interval,
+        )
+
+
+class RedisBackend(CacheBackend):
+    """
+    Redis(또는 Redis 프로토콜 호환 서버) 저장소. 무효화 메시지는 PUBLISH/SUBSCRIBE
+    client를 넘기면 그대로 사용 (예: 테스트에서 fakeredis.FakeRedis())
+    """
+
+    shared = True
+    name = "redis"
+
+    def __init__(self, url: str = CACHE_REDIS_URL, client=None):
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError("CACHE_BACKEND=redis에는 redis 설치가 필요합니다.")
+            client = redis.Redis.from_url(url)
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.client.set(key, value, px=int(ttl * 1000) if ttl else None)
+
+    def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(self.client.set(key, value, nx=True, px=int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(key))
+
+    def publish(self, channel: str, message: str) -> None:
+        self.client.publish(channel, message)
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+
+        def listen() -> None:
+            while True:
+                try:
+                    message = pubsub.get_message(timeout=1.0)
+                except Exception:
+                    # 연결이 끊기면 잠시 후 다시 구독 (그 사이 메시지는 유실, 키 TTL로 복구)
+                    time.sleep(1.0)
+                    continue
+                if message and message.get("type") == "message":
+                    data = message["data"]
+                    handler(data.decode() if isinstance(data, bytes) else data)
+
+        threading.Thread(target=listen, name=f"cache-subscriber-{channel}", daemon=True).start()
+
+
+CACHE_BACKENDS = {
+    "memory": MemoryBackend,
+    "sqlite": SQLiteBackend,
+    "redis": RedisBackend,
+}
+
+
+def create_backend(backend: str = CACHE_BACKEND) -> CacheBackend:
+    try:
+        return CACHE_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(f"지원하지 않는 CACHE_BACKEND: {backend}")
+
+
+def encode_message(scope: str, generation: int) -> str:
+    return json.dumps({"scope": scope, "generation": generation})
+
+
+def decode_message(message: str) -> tuple:
+    data = json.loads(message)
+    return data["scope"], int(data["generation"])
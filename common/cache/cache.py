@@ -0,0 +1,247 @@
+import asyncio
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, TypeVar
+
+from common.cache.backends import (CacheBackend, create_backend,
+                                   decode_message, encode_message)
+
+# 공유 저장소 키 접두사 (같은 Redis/SQLite를 여러 배포가 쓸 때 구분)
+CACHE_PREFIX = os.getenv("CACHE_PREFIX", "quiz")
+# 공유 저장소 항목 만료 시간 (초). 무효화 메시지가 유실돼도 이 시간 뒤에는 다시 적재
+CACHE_TTL = float(os.getenv("CACHE_TTL", "3600"))
+# 다른 프로세스가 같은 키를 계산 중일 때 기다리는 최대 시간 (초). 넘으면 직접 계산
+CACHE_LOCK_TIMEOUT = float(os.getenv("CACHE_LOCK_TIMEOUT", "2"))
+CACHE_LOCK_POLL = 0.01
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """크기 제한이 있는 프로세스 내 LRU 캐시 (hit/miss/eviction 카운터 포함)"""
+
+    def __init__(self, name: str, max_size: int):
+        self.name = name
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[object]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class InvalidationBus:
+    """
+    scope(예: "quiz:12")별 세대 번호 관리
+    invalidate()는 공유 카운터를 올리고 메시지를 보내며, 각 프로세스는 메시지를 받아 로컬 세대 번호를 갱신
+    캐시 키에 세대 번호가 들어가므로 이전 세대 항목은 지우지 않아도 더는 조회되지 않음 (LRU/TTL로 정리)
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.channel = f"{CACHE_PREFIX}:invalidate"
+        self._generations: Dict[str, int] = {}
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _listen(self) -> None:
+        # 구독 스레드는 fork 후 자식에 남지 않으므로 프로세스마다 처음 사용할 때 시작
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._generations.clear()
+                self.backend.subscribe(self.channel, self._on_message)
+                self._pid = os.getpid()
+
+    def _on_message(self, message: str) -> None:
+        scope, generation = decode_message(message)
+        self._advance(scope, generation)
+
+    def _advance(self, scope: str, generation: int) -> int:
+        with self._lock:
+            current = self._generations.get(scope)
+            if current is None or generation > current:
+                self._generations[scope] = current = generation
+            return current
+
+    def generation(self, scope: str) -> int:
+        self._listen()
+        generation = self._generations.get(scope)
+        if generation is None:
+            # 구독 시작 후 공유 카운터를 읽으므로 그 사이 무효화도 놓치지 않음
+            generation = self._advance(scope, int(self.backend.get(f"{CACHE_PREFIX}:gen:{scope}") or 0))
+        return generation
+
+    def invalidate(self, scope: str) -> None:
+        self._listen()
+        generation = self.backend.incr(f"{CACHE_PREFIX}:gen:{scope}")
+        self._advance(scope, generation)
+        self.backend.publish(self.channel, encode_message(scope, generation))
+
+
+def _can_block() -> bool:
+    # DB_ASYNC 모드의 저장소 코드는 이벤트 루프 스레드에서 실행되므로 대기하면 워커 전체가 멈춤
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+class Cache:
+    """
+    로컬 LRU(1차) + 공유 저장소(2차, backend.shared일 때만) 캐시
+    - 키: (이름, scope 세대 번호, key). scope를 주면 InvalidationBus.invalidate(scope)로 한 번에 무효화
+    - get_or_load: 같은 키를 동시에 적재하면 한 번만 계산 (프로세스 내 스레드 간 + 공유 저장소 잠금으로 프로세스 간)
+    공유 저장소 값은 pickle로 저장하므로 값 객체는 pickle 가능해야 함
+    """
+
+    def __init__(self, name: str, max_size: int, backend: CacheBackend, bus: InvalidationBus, ttl: float = CACHE_TTL):
+        self.name = name
+        self.local = LRUCache(name, max_size)
+        self.backend = backend
+        self.bus = bus
+        self.ttl = ttl
+        self.shared_hits = 0
+        self._flights: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, key: Hashable, scope: Optional[str]) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        generation = self.bus.generation(scope) if scope is not None else 0
+        return f"{self.name}:{generation}:" + ":".join(map(str, parts))
+
+    def _shared_get(self, full_key: str) -> Optional[object]:
+        data = self.backend.get(f"{CACHE_PREFIX}:{full_key}")
+        if data is None:
+            return None
+        self.shared_hits += 1
+        return pickle.loads(data)
+
+    def _shared_set(self, full_key: str, value: object) -> None:
+        self.backend.set(f"{CACHE_PREFIX}:{full_key}", pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self.ttl)
+
+    def get(self, key: Hashable, scope: Optional[str] = None) -> Optional[object]:
+        full_key = self._key(key, scope)
+        value = self.local.get(full_key)
+        if value is None and self.backend.shared:
+            value = self._shared_get(full_key)
+            if value is not None:
+                self.local.set(full_key, value)
+        return value
+
+    def set(self, key: Hashable, value: object, scope: Optional[str] = None) -> None:
+        full_key = self._key(key, scope)
+        self.local.set(full_key, value)
+        if self.backend.shared:
+            self._shared_set(full_key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T], scope: Optional[str] = None) -> T:
+        """캐시에 없으면 loader()로 계산해 저장 (None은 저장하지 않음)"""
+        full_key = self._key(key, scope)
+        value = self.local.get(full_key)
+        if value is not None:
+            return value
+
+        thread = threading.get_ident()
+        with self._lock:
+            flight = self._flights.get(full_key)
+            if flight is None:
+                self._flights[full_key] = (thread, threading.Event())
+        if flight is not None:
+            leader, done = flight
+            # 같은 스레드(비동기 모드의 다른 요청)면 기다릴 수 없으므로 직접 계산
+            if leader != thread and done.wait(CACHE_LOCK_TIMEOUT):
+                value = self.local.get(full_key)
+                if value is not None:
+                    return value
+            return loader()
+
+        try:
+            value = self._load_shared(full_key, loader) if self.backend.shared else loader()
+            if value is not None:
+                self.local.set(full_key, value)
+            return value
+        finally:
+            with self._lock:
+                _, done = self._flights.pop(full_key)
+            done.set()
+
+    def _load_shared(self, full_key: str, loader: Callable[[], T]) -> T:
+        value = self._shared_get(full_key)
+        if value is not None:
+            return value
+
+        lock_key = f"{CACHE_PREFIX}:{full_key}:lock"
+        locked = self.backend.add(lock_key, b"1", CACHE_LOCK_TIMEOUT)
+        if not locked and _can_block():
+            # 다른 프로세스가 계산 중이면 결과가 올라올 때까지 대기
+            deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(CACHE_LOCK_POLL)
+                value = self._shared_get(full_key)
+                if value is not None:
+                    return value
+        try:
+            value = loader()
+            if value is not None:
+                self._shared_set(full_key, value)
+            return value
+        finally:
+            if locked:
+                self.backend.delete(lock_key)
+
+    def clear(self) -> None:
+        """로컬 캐시만 비움 (공유 저장소 항목은 TTL로 정리)"""
+        self.local.clear()
+
+    def stats(self) -> dict:
+        stats = self.local.stats()
+        stats["backend"] = self.backend.name
+        stats["shared_hits"] = self.shared_hits
+        return stats
+
+
+backend = create_backend()
+invalidation = InvalidationBus(backend)
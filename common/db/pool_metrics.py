@@ -0,0 +1,79 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 커넥션 체크아웃 대기 시간 히스토그램 구간 (ms, 누적)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 대기 시간 & 타임아웃 집계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_time_ms_sum = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS_MS)
+
+    def observe_wait(self, seconds: float) -> None:
+        wait_ms = seconds * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_ms_sum += wait_ms
+            for i, bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.wait_buckets[i] += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        """현재 풀 상태 + 누적 지표"""
+        with self._lock:
+            histogram = {str(bound): count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)}
+            histogram["+Inf"] = self.checkouts
+            return {
+                "name": self.name,
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "wait_time_ms_sum": round(self.wait_time_ms_sum, 3),
+                "wait_time_ms_histogram": histogram,
+            }
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+
+class _InstrumentedPoolMixin:
+    """체크아웃(_do_get) 대기 시간 측정. engine.dispose()로 풀이 재생성돼도 클래스 속성의 지표는 유지"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.observe_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics = sync_pool_metrics
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = async_pool_metrics
@@ -17,19 +17,32 @@ CREATE TABLE quiz (
     is_random_questions BOOLEAN DEFAULT FALSE, -- 문제 랜덤 여부
     is_random_choices BOOLEAN DEFAULT FALSE, -- 선택지 랜덤 여부
     questions_per_page INT DEFAULT 10, -- 한 페이지 당 문제 개수
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, -- 생성일시
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 수정일시
+    num_questions INT NOT NULL DEFAULT 0, -- 문제 개수 카운터 (문제 추가 시 같은 트랜잭션에서 갱신)
+    version INT NOT NULL DEFAULT 1, -- 문제/설정 변경 시 증가하는 버전 (캐시 & ETag 키)
+    published_at TIMESTAMP,         -- 게시 시각 (게시 후 문제/설정 변경 불가)
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, -- 생성일시
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP  -- 수정일시
 );
 
+-- 퀴즈 목록 keyset 페이지네이션용 인덱스 (정렬 컬럼, id)
+CREATE INDEX ix_quiz_created_at_id ON quiz (created_at, id);
+CREATE INDEX ix_quiz_updated_at_id ON quiz (updated_at, id);
+CREATE INDEX ix_quiz_title_id ON quiz (title, id); -- 제목 중복 확인에도 사용
+
 -- 문제 테이블
 CREATE TABLE question (
     id SERIAL PRIMARY KEY,
     quiz_id INT REFERENCES quiz(id) ON DELETE CASCADE, -- 퀴즈와 연결
     question_text TEXT NOT NULL,  -- 문제 내용
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- 생성일시
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 수정일시
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,  -- 생성일시
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP  -- 수정일시
 );
 
+-- 퀴즈별 문제 keyset 페이지네이션용 인덱스 (quiz_id, 정렬 컬럼, id)
+CREATE INDEX ix_question_quiz_id_id ON question (quiz_id, id);
+CREATE INDEX ix_question_quiz_id_created_at_id ON question (quiz_id, created_at, id);
+CREATE INDEX ix_question_quiz_id_updated_at_id ON question (quiz_id, updated_at, id);
+
 -- 선택지 테이블
 CREATE TABLE choice (
     id SERIAL PRIMARY KEY,
@@ -40,16 +53,25 @@ CREATE TABLE choice (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 수정일시
 );
 
+-- 문제별 선택지 조회 & 정답표 로드용 인덱스 (is_correct 포함 -> index-only scan)
+CREATE INDEX ix_choice_question_id_id ON choice (question_id, id) INCLUDE (is_correct);
+
 -- 퀴즈 응시 기록 테이블
 CREATE TABLE quiz_record (
     id SERIAL PRIMARY KEY,
     quiz_id INT REFERENCES quiz(id) ON DELETE CASCADE, -- 퀴즈와 연결
     user_id INT REFERENCES "user"(id) ON DELETE CASCADE, -- 사용자와 연결
     score INT DEFAULT 0,           -- 최종 점수
+    status VARCHAR(16) NOT NULL DEFAULT 'started', -- started / submitted (제출 시 조건부 UPDATE로 전환)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- 생성일시
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 수정일시
 );
 
+-- 사용자별 응시 여부/점수 조회용 인덱스
+CREATE INDEX ix_quiz_record_user_id_quiz_id ON quiz_record (user_id, quiz_id);
+-- 퀴즈별 응시 기록 조회용 인덱스 (내보내기, 통계 재계산)
+CREATE INDEX ix_quiz_record_quiz_id ON quiz_record (quiz_id);
+
 -- 사용자의 답안 정보 테이블
 CREATE TABLE answer (
     id SERIAL PRIMARY KEY,
@@ -57,5 +79,83 @@ CREATE TABLE answer (
     question_id INT REFERENCES question(id) ON DELETE CASCADE, -- 문제와 연결
     choice_id INT REFERENCES choice(id) ON DELETE CASCADE, -- 선택지와 연결
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- 생성일시
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- 수정일시
+    -- 응시 기록당 문제별 답안 1행 (임시 저장/제출 upsert 대상, 응시 기록별 답안 조회에도 사용)
+    CONSTRAINT uq_answer_quiz_record_id_question_id UNIQUE (quiz_record_id, question_id)
+);
+
+-- 비동기 채점 대기열 (SUBMIT_MODE=queue, 응시 기록당 1건)
+CREATE TABLE submission_queue (
+    id SERIAL PRIMARY KEY,
+    quiz_record_id INT NOT NULL UNIQUE REFERENCES quiz_record(id) ON DELETE CASCADE, -- 응시 기록과 연결
+    payload JSONB NOT NULL,        -- 제출 답안 {"answers": [{"question_id": ..., "choice_id": ...}]}
+    status VARCHAR(16) NOT NULL DEFAULT 'pending', -- pending / done / failed
+    attempts INT NOT NULL DEFAULT 0, -- 채점 시도 횟수
+    error TEXT,                    -- 실패 사유
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- 생성일시
+    processed_at TIMESTAMP         -- 채점 완료(또는 실패) 시각
+);
+-- 채점 워커가 대기 중인 작업만 id 순으로 가져가도록 부분 인덱스
+CREATE INDEX ix_submission_queue_pending ON submission_queue (id) WHERE status = 'pending';
+
+-- Idempotency-Key로 처리된 요청의 최초 응답 (응시 시작, 답안 제출 재시도용)
+CREATE TABLE idempotency_key (
+    id SERIAL PRIMARY KEY,
+    user_id INT NOT NULL,            -- 요청한 사용자
+    scope VARCHAR(64) NOT NULL,      -- 요청 대상 (attempt:{quiz_id}, submit:{attempt_id})
+    key VARCHAR(255) NOT NULL,       -- 클라이언트가 보낸 Idempotency-Key
+    request_hash VARCHAR(64) NOT NULL, -- 요청 본문 해시
+    status_code INT,                 -- 최초 응답 상태 코드
+    response JSONB,                  -- 최초 응답 본문
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- 생성일시
+    CONSTRAINT uq_idempotency_key_user_id_scope_key UNIQUE (user_id, scope, key)
+);
+
+-- 퀴즈별 응시 통계 (제출 시점에 증분 갱신, backfill-stats 명령으로 재계산)
+CREATE TABLE quiz_stats (
+    quiz_id INT PRIMARY KEY REFERENCES quiz(id) ON DELETE CASCADE,
+    attempts INT NOT NULL DEFAULT 0,  -- 제출된 응시 수
+    score_sum INT NOT NULL DEFAULT 0, -- 점수 합계
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP  -- 수정일시
 );
+
+-- 퀴즈별 점수 분포 (10점 단위 구간)
+CREATE TABLE quiz_score_bucket (
+    quiz_id INT REFERENCES quiz(id) ON DELETE CASCADE,
+    bucket INT NOT NULL,              -- 0 ~ 9 (90~100점은 9)
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (quiz_id, bucket)
+);
+
+-- 문제별 정답률 집계
+CREATE TABLE question_stats (
+    question_id INT PRIMARY KEY REFERENCES question(id) ON DELETE CASCADE,
+    quiz_id INT NOT NULL REFERENCES quiz(id) ON DELETE CASCADE,
+    answered INT NOT NULL DEFAULT 0,  -- 응답 수
+    correct INT NOT NULL DEFAULT 0    -- 정답 수
+);
+CREATE INDEX ix_question_stats_quiz_id ON question_stats (quiz_id);
+
+-- 선택지별 선택 횟수 집계
+CREATE TABLE choice_stats (
+    choice_id INT PRIMARY KEY REFERENCES choice(id) ON DELETE CASCADE,
+    question_id INT NOT NULL REFERENCES question(id) ON DELETE CASCADE,
+    quiz_id INT NOT NULL REFERENCES quiz(id) ON DELETE CASCADE,
+    picks INT NOT NULL DEFAULT 0      -- 선택 횟수
+);
+CREATE INDEX ix_choice_stats_quiz_id ON choice_stats (quiz_id);
+
+-- 게시된 퀴즈의 불변 스냅샷 (게시 후 사용자 조회 & 채점은 이 행만 사용)
+CREATE TABLE quiz_snapshot (
+    quiz_id INT PRIMARY KEY REFERENCES quiz(id) ON DELETE CASCADE,
+    version INT NOT NULL,             -- 게시 시점의 quiz.version
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    is_random_questions BOOLEAN NOT NULL,
+    is_random_choices BOOLEAN NOT NULL,
+    questions_per_page INT NOT NULL,
+    content BYTEA NOT NULL,           -- 문제 id 순으로 직렬화한 문제 JSON 객체들
+    offsets INT[] NOT NULL,           -- 문제별 content 시작 바이트 위치 (마지막 원소는 content 길이)
+    answer_key JSONB NOT NULL,        -- 정답표 (사용자 응답 본문과 분리)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -1,3 +1,9 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
@@ -5,6 +11,58 @@ from jose import jwt, JWTError
 SECRET_KEY = "3f9dbf1a0a921f713ef57cac46ce3653cf9a0c88a6233d20817c99de2f8c0a3e"  # 실제로는 .env 등에서 관리
 ALGORITHM = "HS256"
 
+# 검증된 토큰 캐시 (토큰 -> claims). 항목은 토큰의 exp와 TTL 중 이른 시점에 만료
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = int(os.getenv("TOKEN_CACHE_TTL", "300"))  # 초
+
+class VerifiedTokenCache:
+    """검증이 끝난 JWT의 claims를 보관하는 크기 제한 TTL 캐시"""
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._data.get(token)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[token]
+                return None
+            self._data.move_to_end(token)
+            return claims
+
+    def set(self, token: str, claims: dict) -> None:
+        expires_at = time.time() + self.ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+        with self._lock:
+            self._data[token] = (claims, expires_at)
+            self._data.move_to_end(token)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+token_cache = VerifiedTokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL)
+
+def decode_token(token: str) -> Optional[dict]:
+    """JWT 검증 후 claims 반환 (캐시 hit이면 서명 검증 생략). 유효하지 않으면 None"""
+    claims = token_cache.get(token)
+    if claims is not None:
+        return claims
+    try:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    token_cache.set(token, claims)
+    return claims
+
 class JWTBearer(HTTPBearer):
     """HTTP Bearer 헤더에서 JWT 토큰을 추출하고 검증하는 클래스"""
     def __init__(self, auto_error: bool = True):
@@ -15,11 +73,14 @@ class JWTBearer(HTTPBearer):
         if credentials:
             if credentials.scheme.lower() == "bearer":
                 token = credentials.credentials
-                if not self.verify_jwt(token):
+                claims = decode_token(token)
+                if claims is None:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
                         detail="Invalid or expired token."
                     )
+                # get_current_user가 다시 디코딩하지 않도록 요청에 claims 보관
+                request.state.jwt_claims = claims
                 return token
             else:
                 raise HTTPException(
@@ -34,24 +95,18 @@ class JWTBearer(HTTPBearer):
 
     def verify_jwt(self, token: str) -> bool:
         """JWT가 유효한지 검증"""
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            # payload에서 user_id 등을 가져와서 추가 검증도 가능
-        except JWTError:
-            return False
-        return True
-
-def get_current_user(token: str = Depends(JWTBearer())):
-    """토큰에서 사용자 정보 추출"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        # 여기서 user_id 꺼내 DB 조회 후 유저 객체 반환도 가능
-        return payload
-    except JWTError:
+        return decode_token(token) is not None
+
+def get_current_user(request: Request, token: str = Depends(JWTBearer())):
+    """토큰에서 사용자 정보 추출 (JWTBearer가 검증한 claims 재사용)"""
+    payload = getattr(request.state, "jwt_claims", None) or decode_token(token)
+    if payload is None:
         raise HTTPException(status_code=401, detail="Token is invalid or has expired")
+    # 여기서 user_id 꺼내 DB 조회 후 유저 객체 반환도 가능
+    return payload
 
 def get_current_admin(current_user: dict = Depends(get_current_user)):
     """관리자 권한이 있는지 확인"""
     if not current_user.get("is_admin", False):
         raise HTTPException(status_code=403, detail="Admin access required")
-    return current_user
\ No newline at end of file
+    return current_user
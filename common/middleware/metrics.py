@@ -0,0 +1,282 @@
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+# 이 시간(ms) 이상 걸린 요청은 실행한 SQL과 함께 WARNING 로그 (0이면 끔)
+SLOW_REQUEST_LOG_MS = float(os.getenv("SLOW_REQUEST_LOG_MS", "0"))
+# true면 응답에 Server-Timing 헤더로 SQL 실행 시간/문장 수 노출 (벤치마크용, 운영에서는 끔)
+SERVER_TIMING = os.getenv("SERVER_TIMING", "false").lower() in ("1", "true", "yes")
+# 느린 요청 로그에 남길 SQL 문장 수 & 문장 길이 상한
+SLOW_REQUEST_MAX_STATEMENTS = 50
+SLOW_REQUEST_MAX_SQL_LENGTH = 500
+
+# 히스토그램 구간 (초 / 요청당 SQL 문장 수)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestStats:
+    """요청 1건 동안 누적되는 지표 (contextvar로 전달, 스레드풀/run_sync 안의 SQL도 같은 객체에 기록)"""
+
+    __slots__ = (
+        "method", "route", "sql_count", "sql_time", "statements",
+        "handler_start", "endpoint_start", "endpoint_end", "serialization_time", "dependency_time",
+    )
+
+    def __init__(self, method: str):
+        self.method = method
+        self.route = UNMATCHED_ROUTE
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.statements: Optional[List[Tuple[float, str]]] = [] if SLOW_REQUEST_LOG_MS > 0 else None
+        self.handler_start = None
+        self.endpoint_start = None
+        self.endpoint_end = None
+        self.serialization_time = 0.0
+        self.dependency_time = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+class Histogram:
+    """라벨별 누적 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...], labels: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.labels = labels
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, label_values: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            # [구간별 개수..., 합계, 전체 개수]
+            series = self._series[label_values] = [0] * len(self.buckets) + [0.0, 0]
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, series in sorted(self._series.items()):
+            labels = format_labels(zip(self.labels, label_values))
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                yield f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+            yield f'{self.name}_bucket{{{labels},le="+Inf"}} {series[-1]}'
+            yield f"{self.name}_sum{{{labels}}} {series[-2]}"
+            yield f"{self.name}_count{{{labels}}} {series[-1]}"
+
+
+def format_labels(pairs: Iterable[Tuple[str, object]]) -> str:
+    def escape(value: object) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    return ",".join(f'{key}="{escape(value)}"' for key, value in pairs)
+
+
+def render_gauge(name: str, help_text: str, samples: Iterable[Tuple[dict, float]], kind: str = "gauge") -> List[str]:
+    """{라벨: 값} 목록 -> Prometheus gauge/counter 텍스트"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        label_text = format_labels(labels.items())
+        lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return lines
+
+
+class MetricsRegistry:
+    """라우트별 요청 지표 (워커 프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.duration = Histogram(
+            "http_request_duration_seconds", "요청 처리 시간", LATENCY_BUCKETS, ("method", "route"))
+        self.sql_statements = Histogram(
+            "http_request_sql_statements", "요청당 SQL 문장 수", COUNT_BUCKETS, ("method", "route"))
+        self.sql_duration = Histogram(
+            "http_request_sql_duration_seconds", "요청당 SQL 실행 시간 합계", LATENCY_BUCKETS, ("method", "route"))
+        self.serialization = Histogram(
+            "http_request_serialization_seconds", "응답 검증 & 직렬화 시간", LATENCY_BUCKETS, ("method", "route"))
+        self.dependencies = Histogram(
+            "http_request_dependency_seconds", "의존성(인증, 세션 등) 처리 시간", LATENCY_BUCKETS, ("method", "route"))
+
+    def observe(self, stats: RequestStats, status: int, duration: float) -> None:
+        key = (stats.method, stats.route)
+        with self._lock:
+            counter_key = (stats.method, stats.route, str(status))
+            self.requests[counter_key] = self.requests.get(counter_key, 0) + 1
+            self.duration.observe(key, duration)
+            self.sql_statements.observe(key, stats.sql_count)
+            self.sql_duration.observe(key, stats.sql_time)
+            self.serialization.observe(key, stats.serialization_time)
+            self.dependencies.observe(key, stats.dependency_time)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            lines = render_gauge(
+                "http_requests_total",
+                "라우트/상태 코드별 요청 수",
+                [({"method": m, "route": r, "status": s}, count) for (m, r, s), count in sorted(self.requests.items())],
+                kind="counter",
+            )
+            for histogram in (self.duration, self.sql_statements, self.sql_duration,
+                              self.serialization, self.dependencies):
+                lines.extend(histogram.render())
+        return lines
+
+
+registry = MetricsRegistry()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats.sql_count += 1
+    stats.sql_time += elapsed
+    if stats.statements is not None and len(stats.statements) < SLOW_REQUEST_MAX_STATEMENTS:
+        stats.statements.append((elapsed, statement[:SLOW_REQUEST_MAX_SQL_LENGTH]))
+
+
+class MetricsRoute(APIRoute):
+    """
+    라우트 템플릿 기록 & 의존성/직렬화 시간 측정
+    엔드포인트 함수 실행 구간을 기준으로, 그 전은 의존성 처리, 그 후(응답 검증 & JSON 직렬화)는 직렬화 시간으로 집계
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route = self.path_format
+
+        async def timed_handler(request):
+            stats = _current.get()
+            if stats is None:
+                return await handler(request)
+            stats.route = route
+            stats.handler_start = time.perf_counter()
+            response = await handler(request)
+            if stats.endpoint_end is not None:
+                stats.serialization_time = time.perf_counter() - stats.endpoint_end
+                stats.dependency_time = stats.endpoint_start - stats.handler_start
+            return response
+
+        return timed_handler
+
+
+def _timed_endpoint(endpoint: Callable) -> Callable:
+    """엔드포인트 실행 시작/종료 시각 기록 (시그니처는 functools.wraps로 유지되어 FastAPI 의존성 분석에 영향 없음)"""
+    if getattr(endpoint, "__metrics_timed__", False):
+        # include_router가 prefix를 붙여 라우트를 다시 만들 때 이중으로 감싸지 않도록
+        return endpoint
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            stats = _current.get()
+            if stats is not None:
+                stats.endpoint_start = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if stats is not None:
+                    stats.endpoint_end = time.perf_counter()
+        wrapper.__metrics_timed__ = True
+        return wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        stats = _current.get()
+        if stats is not None:
+            stats.endpoint_start = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            if stats is not None:
+                stats.endpoint_end = time.perf_counter()
+    sync_wrapper.__metrics_timed__ = True
+    return sync_wrapper
+
+
+class MetricsMiddleware:
+    """요청별 지표 수집 (순수 ASGI 미들웨어, 스트리밍 응답은 본문 전송 완료까지 측정)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope["method"])
+        token = _current.set(stats)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING:
+                    # 스트리밍 응답은 응답 시작 전까지 실행한 SQL만 포함
+                    timing = f'sql;dur={stats.sql_time * 1000:.3f};desc="{stats.sql_count}"'
+                    message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            _current.reset(token)
+            registry.observe(stats, status, duration)
+            if SLOW_REQUEST_LOG_MS > 0 and duration * 1000 >= SLOW_REQUEST_LOG_MS:
+                log_slow_request(stats, scope.get("path", ""), status, duration)
+
+
+def log_slow_request(stats: RequestStats, path: str, status: int, duration: float) -> None:
+    statements = "\n".join(
+        f"  [{elapsed * 1000:.2f}ms] {statement}" for elapsed, statement in stats.statements or ()
+    )
+    logger.warning(
+        "slow request %s %s (%s) status=%s %.1fms sql=%d/%.1fms serialization=%.1fms dependencies=%.1fms\n%s",
+        stats.method, path, stats.route, status, duration * 1000, stats.sql_count, stats.sql_time * 1000,
+        stats.serialization_time * 1000, stats.dependency_time * 1000, statements,
+    )
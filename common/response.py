@@ -0,0 +1,25 @@
+import os
+from typing import Optional
+
+from fastapi.responses import ORJSONResponse
+
+# true면 대용량 조회 응답(퀴즈 상세/응시 페이지)을 response_model 재검증 없이 orjson으로 한 번만 직렬화
+# OpenAPI 스키마는 라우트의 response_model을 그대로 사용
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "false").lower() in ("1", "true", "yes")
+
+if FAST_SERIALIZATION:
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        raise RuntimeError("FAST_SERIALIZATION=true에는 orjson 설치가 필요합니다.")
+
+
+def fast_json(content: dict, headers: Optional[dict] = None):
+    """
+    FAST_SERIALIZATION이면 내부에서 만든 dict를 ORJSONResponse로 바로 직렬화 (응답 검증 생략)
+    아니면 그대로 반환해 FastAPI가 response_model로 검증 & 직렬화
+    응답 객체를 직접 반환하면 라우트의 Response 파라미터 헤더는 적용되지 않으므로 headers로 전달
+    """
+    if not FAST_SERIALIZATION:
+        return content
+    return ORJSONResponse(content, headers=headers)
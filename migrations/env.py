@@ -0,0 +1,45 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from common.db.database import DATABASE_URL, Base
+# autogenerate가 모든 테이블을 인식하도록 모델 모듈 import
+from src.quiz.model import (answer, choice, idempotency_key,  # noqa: F401
+                            question, quiz, quiz_record, quiz_snapshot,
+                            stats, submission_queue)
+from src.user.model.user import Base as UserBase
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# 사용자 모델은 별도 declarative Base를 사용
+target_metadata = [Base.metadata, UserBase.metadata]
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # 마이그레이션은 앱 커넥션 풀 설정/statement_timeout과 무관하게 단일 연결로 실행
+    connectable = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
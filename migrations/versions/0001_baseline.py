@@ -0,0 +1,81 @@
+"""baseline: 최초 schema.sql 테이블
+
+schema.sql로 이미 만든 DB는 이 리비전으로 stamp 후 업그레이드
+    alembic stamp 0001
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-02-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return (
+        sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.TIMESTAMP, server_default=sa.func.now()),
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("username", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("is_admin", sa.Boolean, server_default=sa.false()),
+        *_timestamps(),
+    )
+    op.create_table(
+        "quiz",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text),
+        sa.Column("is_random_questions", sa.Boolean, server_default=sa.false()),
+        sa.Column("is_random_choices", sa.Boolean, server_default=sa.false()),
+        sa.Column("questions_per_page", sa.Integer, server_default="10"),
+        *_timestamps(),
+    )
+    op.create_table(
+        "question",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE")),
+        sa.Column("question_text", sa.Text, nullable=False),
+        *_timestamps(),
+    )
+    op.create_table(
+        "choice",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("question_id", sa.Integer, sa.ForeignKey("question.id", ondelete="CASCADE")),
+        sa.Column("choice_text", sa.Text, nullable=False),
+        sa.Column("is_correct", sa.Boolean, server_default=sa.false()),
+        *_timestamps(),
+    )
+    op.create_table(
+        "quiz_record",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE")),
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("user.id", ondelete="CASCADE")),
+        sa.Column("score", sa.Integer, server_default="0"),
+        *_timestamps(),
+    )
+    op.create_table(
+        "answer",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("quiz_record_id", sa.Integer, sa.ForeignKey("quiz_record.id", ondelete="CASCADE")),
+        sa.Column("question_id", sa.Integer, sa.ForeignKey("question.id", ondelete="CASCADE")),
+        sa.Column("choice_id", sa.Integer, sa.ForeignKey("choice.id", ondelete="CASCADE")),
+        *_timestamps(),
+    )
+
+
+def downgrade() -> None:
+    for table in ("answer", "quiz_record", "choice", "question", "quiz", "user"):
+        op.drop_table(table)
@@ -0,0 +1,61 @@
+"""quiz 카운터/버전 컬럼 & 통계 집계 테이블
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-02-24
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("quiz", sa.Column("num_questions", sa.Integer, nullable=False, server_default="0"))
+    op.add_column("quiz", sa.Column("version", sa.Integer, nullable=False, server_default="1"))
+    # 기존 퀴즈의 문제 개수 카운터 채우기
+    op.execute(
+        "UPDATE quiz SET num_questions = counts.n "
+        "FROM (SELECT quiz_id, COUNT(*) AS n FROM question GROUP BY quiz_id) AS counts "
+        "WHERE quiz.id = counts.quiz_id"
+    )
+
+    op.create_table(
+        "quiz_stats",
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("score_sum", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.TIMESTAMP, server_default=sa.func.now()),
+    )
+    op.create_table(
+        "quiz_score_bucket",
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("bucket", sa.Integer, primary_key=True),
+        sa.Column("count", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "question_stats",
+        sa.Column("question_id", sa.Integer, sa.ForeignKey("question.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("answered", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("correct", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_index("ix_question_stats_quiz_id", "question_stats", ["quiz_id"])
+    op.create_table(
+        "choice_stats",
+        sa.Column("choice_id", sa.Integer, sa.ForeignKey("choice.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("question_id", sa.Integer, sa.ForeignKey("question.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("picks", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_index("ix_choice_stats_quiz_id", "choice_stats", ["quiz_id"])
+
+
+def downgrade() -> None:
+    for table in ("choice_stats", "question_stats", "quiz_score_bucket", "quiz_stats"):
+        op.drop_table(table)
+    op.drop_column("quiz", "version")
+    op.drop_column("quiz", "num_questions")
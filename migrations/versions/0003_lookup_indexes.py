@@ -0,0 +1,63 @@
+"""조회 경로 인덱스 (keyset 페이지네이션, 외래 키 조회, 제목 중복 확인)
+
+운영 중인 DB에서 쓰기를 막지 않도록 CREATE INDEX CONCURRENTLY로 생성
+CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit_block 사용
+schema.sql로 이미 만든 인덱스는 건너뛰고, 이전 실행이 중간에 실패해 남은 INVALID 인덱스는 지운 뒤 다시 생성
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-03-03
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (인덱스 이름, 테이블, 컬럼, INCLUDE 컬럼)
+INDEXES = (
+    ("ix_quiz_created_at_id", "quiz", ["created_at", "id"], None),
+    ("ix_quiz_updated_at_id", "quiz", ["updated_at", "id"], None),
+    ("ix_quiz_title_id", "quiz", ["title", "id"], None),
+    ("ix_question_quiz_id_id", "question", ["quiz_id", "id"], None),
+    ("ix_question_quiz_id_created_at_id", "question", ["quiz_id", "created_at", "id"], None),
+    ("ix_question_quiz_id_updated_at_id", "question", ["quiz_id", "updated_at", "id"], None),
+    ("ix_choice_question_id_id", "choice", ["question_id", "id"], ["is_correct"]),
+    ("ix_quiz_record_user_id_quiz_id", "quiz_record", ["user_id", "quiz_id"], None),
+    ("ix_quiz_record_quiz_id", "quiz_record", ["quiz_id"], None),
+    ("ix_answer_quiz_record_id", "answer", ["quiz_record_id"], None),
+)
+
+
+def _is_invalid(name: str) -> bool:
+    """CONCURRENTLY 생성이 중간에 실패해 남은 인덱스인지 확인"""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first() is not None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            if _is_invalid(name):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_include=include or [],
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
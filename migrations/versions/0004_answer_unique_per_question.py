@@ -0,0 +1,47 @@
+"""answer (quiz_record_id, question_id) 유니크 제약 (답안 임시 저장 upsert용)
+
+중복 답안은 가장 마지막 행만 남기고 삭제한 뒤 유니크 인덱스를 CONCURRENTLY로 만들고 제약으로 전환
+새 유니크 인덱스가 quiz_record_id 조회도 처리하므로 ix_answer_quiz_record_id는 삭제
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-03-10
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+CONSTRAINT = "uq_answer_quiz_record_id_question_id"
+
+
+def upgrade() -> None:
+    op.execute(
+        "DELETE FROM answer AS a USING answer AS b "
+        "WHERE a.quiz_record_id = b.quiz_record_id AND a.question_id = b.question_id AND a.id < b.id"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            CONSTRAINT,
+            "answer",
+            ["quiz_record_id", "question_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.execute(f"ALTER TABLE answer ADD CONSTRAINT {CONSTRAINT} UNIQUE USING INDEX {CONSTRAINT}")
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_answer_quiz_record_id", table_name="answer", if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_answer_quiz_record_id",
+            "answer",
+            ["quiz_record_id"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint(CONSTRAINT, "answer", type_="unique")
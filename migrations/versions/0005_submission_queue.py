@@ -0,0 +1,44 @@
+"""비동기 채점 대기열 (submission_queue)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-03-14
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "submission_queue",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "quiz_record_id",
+            sa.Integer,
+            sa.ForeignKey("quiz_record.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("payload", JSONB, nullable=False),
+        sa.Column("status", sa.String(16), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("error", sa.Text),
+        sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+        sa.Column("processed_at", sa.TIMESTAMP),
+    )
+    op.create_index(
+        "ix_submission_queue_pending",
+        "submission_queue",
+        ["id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("submission_queue")
@@ -0,0 +1,45 @@
+"""quiz_record.status (started/submitted) & idempotency_key
+
+기존 응시 기록은 채점으로 수정된 적이 있거나(updated_at > created_at) 대기열에 들어갔거나
+저장된 답안이 있는 경우 submitted로 채움
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-03-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("quiz_record", sa.Column("status", sa.String(16), nullable=False, server_default="started"))
+    op.execute(
+        "UPDATE quiz_record AS r SET status = 'submitted' "
+        "WHERE r.updated_at > r.created_at "
+        "OR EXISTS (SELECT 1 FROM submission_queue AS s WHERE s.quiz_record_id = r.id) "
+        "OR EXISTS (SELECT 1 FROM answer AS a WHERE a.quiz_record_id = r.id)"
+    )
+
+    op.create_table(
+        "idempotency_key",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("user_id", sa.Integer, nullable=False),
+        sa.Column("scope", sa.String(64), nullable=False),
+        sa.Column("key", sa.String(255), nullable=False),
+        sa.Column("request_hash", sa.String(64), nullable=False),
+        sa.Column("status_code", sa.Integer),
+        sa.Column("response", JSONB),
+        sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+        sa.UniqueConstraint("user_id", "scope", "key", name="uq_idempotency_key_user_id_scope_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("idempotency_key")
+    op.drop_column("quiz_record", "status")
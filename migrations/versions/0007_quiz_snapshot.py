@@ -0,0 +1,37 @@
+"""quiz.published_at & quiz_snapshot (게시된 퀴즈의 불변 스냅샷)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-03-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("quiz", sa.Column("published_at", sa.TIMESTAMP))
+    op.create_table(
+        "quiz_snapshot",
+        sa.Column("quiz_id", sa.Integer, sa.ForeignKey("quiz.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("version", sa.Integer, nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text),
+        sa.Column("is_random_questions", sa.Boolean, nullable=False),
+        sa.Column("is_random_choices", sa.Boolean, nullable=False),
+        sa.Column("questions_per_page", sa.Integer, nullable=False),
+        sa.Column("content", sa.LargeBinary, nullable=False),
+        sa.Column("offsets", ARRAY(sa.Integer), nullable=False),
+        sa.Column("answer_key", JSONB, nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("quiz_snapshot")
+    op.drop_column("quiz", "published_at")
@@ -0,0 +1,35 @@
+"""quiz/question created_at & updated_at NOT NULL
+
+keyset 페이지네이션의 (정렬 컬럼, id) 비교는 NULL 행을 건너뛰므로 정렬에 쓰는 시각 컬럼에 NULL을 허용하지 않음
+기존 NULL은 다른 쪽 시각(없으면 현재 시각)으로 채움
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-03-20
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+TABLES = ("quiz", "question")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"UPDATE {table} SET created_at = COALESCE(created_at, updated_at, now()), "
+            "updated_at = COALESCE(updated_at, created_at, now()) "
+            "WHERE created_at IS NULL OR updated_at IS NULL"
+        )
+        for column in ("created_at", "updated_at"):
+            op.alter_column(table, column, existing_type=sa.TIMESTAMP, nullable=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(table, column, existing_type=sa.TIMESTAMP, nullable=True)
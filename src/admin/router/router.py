@@ -0,0 +1,22 @@
+from typing import List
+
+from common.middleware.auth import get_current_user
+from common.middleware.metrics import MetricsRoute
+from fastapi import APIRouter, Depends
+from src.admin.schema.schema import PoolStatsResponse
+from src.admin.service.service import get_pool_stats_service
+from src.user.model import User
+
+router = APIRouter(route_class=MetricsRoute)
+
+@router.get("/db/pool", response_model=List[PoolStatsResponse])
+async def get_pool_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **DB 커넥션 풀 상태 조회 API**  
+    - **관리자만 호출 가능**  
+    - 현재 워커 프로세스의 사용 중/대기 커넥션 수, overflow 사용량  
+    - 체크아웃 대기 시간 히스토그램 및 체크아웃 타임아웃 횟수  
+    """
+    return get_pool_stats_service(current_user)
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class PoolStatsResponse(BaseModel):
+    """DB 커넥션 풀 상태 (현재 워커 프로세스 기준)"""
+    name: str
+    size: int
+    checked_out: int  # 사용 중인 커넥션
+    idle: int  # 풀에 반납되어 대기 중인 커넥션
+    overflow: int  # pool_size를 넘어 추가로 열린 커넥션
+    max_overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    wait_time_ms_sum: float
+    wait_time_ms_histogram: Dict[str, int]  # 체크아웃 대기 시간 누적 히스토그램 (le, ms)
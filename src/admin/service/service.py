@@ -0,0 +1,71 @@
+from typing import List
+
+from common.db.database import async_engine, engine
+from common.db.pool_metrics import async_pool_metrics, sync_pool_metrics
+from common.middleware.metrics import registry, render_gauge
+from fastapi import HTTPException
+from src.admin.schema.schema import PoolStatsResponse
+from src.quiz.repository.answer_buffer import answer_flusher
+from src.quiz.repository.cache import get_cache_stats
+from src.quiz.repository.submission_queue import submission_workers
+from src.user.model import User
+from src.warmup import startup_report
+
+
+def pool_snapshots() -> List[dict]:
+    snapshots = [sync_pool_metrics.snapshot(engine.pool)]
+    if async_engine is not None:
+        snapshots.append(async_pool_metrics.snapshot(async_engine.sync_engine.pool))
+    return snapshots
+
+def get_pool_stats_service(current_user: User) -> List[PoolStatsResponse]:
+    """관리자만 커넥션 풀 상태 조회 가능"""
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=403, detail="관리자만 커넥션 풀 상태를 조회할 수 있습니다.")
+
+    return [PoolStatsResponse(**snapshot) for snapshot in pool_snapshots()]
+
+def get_metrics_service() -> str:
+    """요청 지표 + 커넥션 풀/캐시/답안 버퍼/채점 워커 상태 (Prometheus 텍스트 형식, 워커 프로세스 단위)"""
+    lines = registry.render()
+
+    pools = pool_snapshots()
+    for field, kind, help_text in (
+        ("size", "gauge", "커넥션 풀 크기"),
+        ("checked_out", "gauge", "사용 중인 커넥션 수"),
+        ("idle", "gauge", "대기 중인 커넥션 수"),
+        ("overflow", "gauge", "사용 중인 overflow 커넥션 수"),
+        ("checkouts", "counter", "커넥션 체크아웃 횟수"),
+        ("checkout_timeouts", "counter", "커넥션 체크아웃 타임아웃 횟수"),
+    ):
+        name = f"db_pool_{field}_total" if kind == "counter" else f"db_pool_{field}"
+        lines += render_gauge(name, help_text, [({"pool": p["name"]}, p[field]) for p in pools], kind)
+    lines += ["# HELP db_pool_checkout_wait_ms 커넥션 체크아웃 대기 시간", "# TYPE db_pool_checkout_wait_ms histogram"]
+    for p in pools:
+        for bound, count in p["wait_time_ms_histogram"].items():
+            lines.append(f'db_pool_checkout_wait_ms_bucket{{pool="{p["name"]}",le="{bound}"}} {count}')
+        lines.append(f'db_pool_checkout_wait_ms_sum{{pool="{p["name"]}"}} {p["wait_time_ms_sum"]}')
+        lines.append(f'db_pool_checkout_wait_ms_count{{pool="{p["name"]}"}} {p["checkouts"]}')
+
+    caches = get_cache_stats()
+    lines += render_gauge("cache_size", "캐시 항목 수", [({"cache": c["name"]}, c["size"]) for c in caches])
+    for field in ("hits", "misses", "evictions", "shared_hits"):
+        lines += render_gauge(
+            f"cache_{field}_total", f"캐시 {field}", [({"cache": c["name"]}, c[field]) for c in caches], "counter"
+        )
+
+    buffer = answer_flusher.stats()
+    lines += render_gauge("answer_buffer_pending", "DB에 반영 대기 중인 임시 저장 답안 수", [({}, buffer["pending"])])
+    lines += render_gauge("answer_buffer_flushed_total", "DB에 반영한 임시 저장 답안 수", [({}, buffer["flushed"])], "counter")
+    lines += render_gauge("answer_buffer_flush_failures_total", "임시 저장 답안 flush 실패 횟수",
+                          [({}, buffer["failures"])], "counter")
+
+    workers = submission_workers.stats()
+    lines += render_gauge("submission_workers", "실행 중인 채점 워커 스레드 수", [({}, workers["workers"])])
+    lines += render_gauge("submission_processed_total", "채점 워커가 처리한 제출 수",
+                          [({}, workers["processed"])], "counter")
+    phases = [(name[:-len("_seconds")], value) for name, value in startup_report.items() if name.endswith("_seconds")]
+    if phases:
+        lines += render_gauge("worker_startup_seconds", "워커 시작 단계별 소요 시간 (초)",
+                              [({"phase": phase}, value) for phase, value in phases])
+    return "\n".join(lines) + "\n"
@@ -1,12 +1,40 @@
+from contextlib import asynccontextmanager
+
+from common.middleware.metrics import MetricsMiddleware
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.openapi.utils import get_openapi
 from fastapi.security.oauth2 import OAuth2PasswordBearer
 
+from src.admin.router.router import router as admin_router
+from src.admin.service.service import get_metrics_service
+from src.quiz.repository.answer_buffer import answer_flusher
+from src.quiz.repository.submission_queue import (SUBMIT_MODE, SUBMIT_WORKERS,
+                                                  submission_workers)
 from src.quiz.router.router import router as quiz_router
 from src.quiz.router.user_router import router as quiz_user_router
 from src.user.router.router import router as user_router
+from src.warmup import WARM_UP, warm_up
+from util.password import shutdown_password_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """워커 시작/종료 시 백그라운드 작업 관리"""
+    # 요청을 받기 전에 커넥션/캐시/해시 프로세스 준비 (uvicorn은 lifespan 시작이 끝난 뒤 소켓에서 accept)
+    if WARM_UP:
+        await warm_up()
+    answer_flusher.start()
+    # 대기열 채점 모드: SUBMIT_WORKERS=0이면 웹 워커에서는 채점하지 않음 (python -m src.quiz.cli grade-worker로 별도 실행)
+    if SUBMIT_MODE == "queue" and SUBMIT_WORKERS > 0:
+        submission_workers.start()
+    yield
+    # 진행 중인 채점 배치를 마치고, 임시 저장 답안을 모두 DB에 반영한 뒤 해시 프로세스 종료
+    submission_workers.stop()
+    answer_flusher.stop()
+    shutdown_password_pool()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
@@ -32,7 +60,7 @@ def custom_openapi():
 
     for path in openapi_schema["paths"]:
         for method in openapi_schema["paths"][path]:
-            if path.startswith("/quiz"):
+            if path.startswith(("/quiz", "/admin")):
                 openapi_schema["paths"][path][method]["security"] = [{"BearerAuth": []}]
 
     app.openapi_schema = openapi_schema
@@ -40,9 +68,18 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# 라우트별 지연 시간 & 요청당 SQL 문장 수/시간 & 직렬화 시간 수집
+app.add_middleware(MetricsMiddleware)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 수집용 지표 (현재 워커 프로세스 기준)"""
+    return PlainTextResponse(get_metrics_service(), media_type="text/plain; version=0.0.4")
+
 app.include_router(user_router, prefix="/user", tags=["user"])
 app.include_router(quiz_router, prefix="/quiz", tags=["[관리자용] quiz"]) 
 app.include_router(quiz_user_router, prefix="/quiz/user", tags=["[사용자용] quiz-user"]) 
+app.include_router(admin_router, prefix="/admin", tags=["[관리자용] admin"])
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,160 @@
+"""
+퀴즈 관리용 CLI
+
+    python -m src.quiz.cli repair-counters [--dry-run]
+    python -m src.quiz.cli import --quiz-id 1 --format jsonl questions.jsonl
+    python -m src.quiz.cli export --quiz-id 1 --format csv -o results.csv
+    python -m src.quiz.cli backfill-stats [--quiz-id 1] [--chunk-size 10000]
+    python -m src.quiz.cli grade-worker [--workers 4] [--batch-size 50]
+    python -m src.quiz.cli purge-idempotency-keys [--older-than-hours 24]
+"""
+import argparse
+import signal
+import sys
+import threading
+from datetime import datetime
+
+from common.db.database import SessionLocal
+from src.quiz.repository.idempotency import IDEMPOTENCY_KEY_TTL_HOURS, purge_keys
+from src.quiz.repository.repository import repair_question_counts
+from src.quiz.repository.stats_repository import rebuild_stats
+from src.quiz.repository.submission_queue import (SUBMIT_BATCH_SIZE,
+                                                  SUBMIT_WORKERS,
+                                                  SubmissionWorkerPool)
+from src.quiz.service.export_service import (EXPORT_MEDIA_TYPES,
+                                             check_export_format, iter_export)
+from src.quiz.service.import_service import (IMPORT_FORMATS,
+                                             import_questions_from_file)
+
+
+def repair_counters(args: argparse.Namespace) -> int:
+    """quiz.num_questions 카운터 점검 & 복구"""
+    db = SessionLocal()
+    try:
+        drifted = repair_question_counts(db, fix=not args.dry_run)
+    finally:
+        db.close()
+
+    for quiz_id, stored, actual in drifted:
+        print(f"quiz_id={quiz_id}: num_questions={stored} -> {actual}")
+    action = "발견" if args.dry_run else "복구"
+    print(f"카운터 불일치 {len(drifted)}건 {action}")
+    return 0
+
+
+def import_questions(args: argparse.Namespace) -> int:
+    """JSONL/CSV 문제 은행을 스트리밍으로 일괄 등록"""
+    def progress(status: dict) -> None:
+        print(
+            f"chunk {status['chunk']}: {status['lines']} lines, "
+            f"imported={status['imported']} failed={status['failed']}",
+            file=sys.stderr,
+        )
+
+    db = SessionLocal()
+    try:
+        with open(args.path, encoding="utf-8", newline="") as f:
+            result = import_questions_from_file(db, args.quiz_id, args.format, f, progress)
+    finally:
+        db.close()
+
+    for error in result.errors:
+        print(f"line {error.line}: {error.error}")
+    print(f"등록 {result.imported}건, 실패 {result.failed}건")
+    return 1 if result.failed else 0
+
+
+def export_results(args: argparse.Namespace) -> int:
+    """응시 기록 & 답안을 파일(또는 표준 출력)로 스트리밍 내보내기"""
+    check_export_format(args.format)
+    chunks = iter_export(args.format, args.quiz_id, args.start, args.end)
+    if args.output == "-":
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+    return 0
+
+
+def backfill_stats(args: argparse.Namespace) -> int:
+    """기존 응시 기록 & 답안으로 통계 테이블 재계산"""
+    db = SessionLocal()
+    try:
+        for quiz_id, processed in rebuild_stats(db, args.quiz_id, args.chunk_size):
+            print(f"quiz_id={quiz_id}: 응시 기록 {processed}건 집계", file=sys.stderr)
+    finally:
+        db.close()
+    return 0
+
+
+def grade_worker(args: argparse.Namespace) -> int:
+    """채점 대기열 워커 실행 (SIGINT/SIGTERM을 받으면 진행 중인 배치를 마치고 종료)"""
+    pool = SubmissionWorkerPool(workers=args.workers, batch_size=args.batch_size)
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    pool.start()
+    print(f"채점 워커 {args.workers}개 시작", file=sys.stderr)
+    stop.wait()
+    pool.stop()
+    print(f"채점 {pool.processed}건 처리 후 종료", file=sys.stderr)
+    return 0
+
+
+def purge_idempotency_keys(args: argparse.Namespace) -> int:
+    """보관 기간이 지난 Idempotency-Key 삭제"""
+    db = SessionLocal()
+    try:
+        deleted = purge_keys(db, args.older_than_hours)
+    finally:
+        db.close()
+    print(f"Idempotency-Key {deleted}건 삭제")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.quiz.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    repair = subparsers.add_parser("repair-counters", help="quiz.num_questions 카운터 점검 & 복구")
+    repair.add_argument("--dry-run", action="store_true", help="복구하지 않고 불일치만 출력")
+    repair.set_defaults(func=repair_counters)
+
+    importer = subparsers.add_parser("import", help="JSONL/CSV 문제 은행 일괄 등록")
+    importer.add_argument("--quiz-id", type=int, required=True)
+    importer.add_argument("--format", choices=IMPORT_FORMATS, default="jsonl")
+    importer.add_argument("path")
+    importer.set_defaults(func=import_questions)
+
+    exporter = subparsers.add_parser("export", help="응시 기록 & 답안 내보내기")
+    exporter.add_argument("--quiz-id", type=int)
+    exporter.add_argument("--start", type=datetime.fromisoformat, help="응시 시작 시각 하한 (ISO 8601)")
+    exporter.add_argument("--end", type=datetime.fromisoformat, help="응시 시작 시각 상한 (ISO 8601, 미포함)")
+    exporter.add_argument("--format", choices=tuple(EXPORT_MEDIA_TYPES), default="csv")
+    exporter.add_argument("-o", "--output", default="-", help="출력 파일 (기본값: 표준 출력)")
+    exporter.set_defaults(func=export_results)
+
+    backfill = subparsers.add_parser("backfill-stats", help="통계 테이블 재계산")
+    backfill.add_argument("--quiz-id", type=int, help="지정하지 않으면 전체 퀴즈")
+    backfill.add_argument("--chunk-size", type=int, default=10000, help="한 번에 집계할 응시 기록 수")
+    backfill.set_defaults(func=backfill_stats)
+
+    worker = subparsers.add_parser("grade-worker", help="채점 대기열 워커 실행 (SUBMIT_MODE=queue)")
+    worker.add_argument("--workers", type=int, default=max(SUBMIT_WORKERS, 1))
+    worker.add_argument("--batch-size", type=int, default=SUBMIT_BATCH_SIZE)
+    worker.set_defaults(func=grade_worker)
+
+    purge = subparsers.add_parser("purge-idempotency-keys", help="보관 기간이 지난 Idempotency-Key 삭제")
+    purge.add_argument("--older-than-hours", type=int, default=IDEMPOTENCY_KEY_TTL_HOURS)
+    purge.set_defaults(func=purge_idempotency_keys)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
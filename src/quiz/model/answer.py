@@ -1,11 +1,15 @@
 from common.db.database import Base
-from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer
+from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 
 class Answer(Base):
     __tablename__ = "answer"
+    __table_args__ = (
+        # 응시 기록당 문제별 답안 1행 (임시 저장/제출 upsert 대상, 응시 기록별 답안 조회에도 사용)
+        UniqueConstraint("quiz_record_id", "question_id", name="uq_answer_quiz_record_id_question_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     quiz_record_id = Column(Integer, ForeignKey("quiz_record.id", ondelete="CASCADE"), nullable=False)
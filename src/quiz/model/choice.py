@@ -1,11 +1,15 @@
 from common.db.database import Base
-from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, Text
+from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 
 class Choice(Base):
     __tablename__ = "choice"
+    __table_args__ = (
+        # 문제별 선택지 조회 & 정답표 로드용 (is_correct 포함 -> index-only scan)
+        Index("ix_choice_question_id_id", "question_id", "id", postgresql_include=["is_correct"]),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     question_id = Column(Integer, ForeignKey("question.id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,21 @@
+from common.db.database import Base
+from sqlalchemy import TIMESTAMP, Column, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+
+class IdempotencyKey(Base):
+    """Idempotency-Key 헤더로 보낸 요청의 최초 응답 (같은 키로 재시도하면 이 응답을 그대로 반환)"""
+    __tablename__ = "idempotency_key"
+    __table_args__ = (
+        UniqueConstraint("user_id", "scope", "key", name="uq_idempotency_key_user_id_scope_key"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    scope = Column(String(64), nullable=False)  # 요청 대상 (예: attempt:{quiz_id}, submit:{attempt_id})
+    key = Column(String(255), nullable=False)  # 클라이언트가 보낸 Idempotency-Key
+    request_hash = Column(String(64), nullable=False)  # 요청 본문 해시 (같은 키로 다른 요청 방지)
+    status_code = Column(Integer)
+    response = Column(JSONB)
+    created_at = Column(TIMESTAMP, server_default=func.now())
@@ -1,16 +1,22 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Index, Integer, Text, ForeignKey, TIMESTAMP
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from common.db.database import Base
 
 class Question(Base):
     __tablename__ = "question"
+    __table_args__ = (
+        # 퀴즈별 문제 keyset 페이지네이션용 (quiz_id, 정렬 컬럼, id)
+        Index("ix_question_quiz_id_id", "quiz_id", "id"),
+        Index("ix_question_quiz_id_created_at_id", "quiz_id", "created_at", "id"),
+        Index("ix_question_quiz_id_updated_at_id", "quiz_id", "updated_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), nullable=False)
     question_text = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    created_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now())
 
     quiz = relationship("Quiz", back_populates="questions")
-    choices = relationship("Choice", back_populates="question")
+    choices = relationship("Choice", back_populates="question", order_by="Choice.id")
@@ -1,5 +1,5 @@
 from common.db.database import Base
-from sqlalchemy import TIMESTAMP, Column, Integer, String, Text
+from sqlalchemy import TIMESTAMP, Column, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.sql.sqltypes import Boolean
@@ -7,6 +7,12 @@ from sqlalchemy.sql.sqltypes import Boolean
 
 class Quiz(Base):
     __tablename__ = "quiz"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션용 (정렬 컬럼, id)
+        Index("ix_quiz_created_at_id", "created_at", "id"),
+        Index("ix_quiz_updated_at_id", "updated_at", "id"),
+        Index("ix_quiz_title_id", "title", "id"),  # 제목 중복 확인(check_existing_quiz)도 이 인덱스 사용
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)  # 퀴즈 제목
@@ -14,7 +20,10 @@ class Quiz(Base):
     is_random_questions = Column(Boolean, default=False)
     is_random_choices = Column(Boolean, default=False)
     questions_per_page = Column(Integer, default=10)
-    created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    num_questions = Column(Integer, nullable=False, default=0, server_default="0")  # 문제 개수 카운터
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 문제/설정 변경 시 증가
+    published_at = Column(TIMESTAMP)  # 게시 시각. 게시 후에는 문제/설정 변경 불가 (quiz_snapshot 사용)
+    created_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now())
 
     questions = relationship("Question", back_populates="quiz")
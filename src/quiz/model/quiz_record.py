@@ -1,5 +1,5 @@
 from common.db.database import Base
-from sqlalchemy import Boolean, Column, ForeignKey, Integer
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.sql.sqltypes import TIMESTAMP
@@ -7,11 +7,19 @@ from sqlalchemy.sql.sqltypes import TIMESTAMP
 
 class QuizRecord(Base):
     __tablename__ = "quiz_record"
+    __table_args__ = (
+        # 사용자별 응시 여부/점수 조회용
+        Index("ix_quiz_record_user_id_quiz_id", "user_id", "quiz_id"),
+        # 퀴즈별 응시 기록 조회용 (내보내기, 통계 재계산)
+        Index("ix_quiz_record_quiz_id", "quiz_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, nullable=False)  # 사용자 식별
     score = Column(Integer, default=0)         # 최종 점수
+    # started -> submitted (제출 시 조건부 UPDATE 한 번으로 전환, 중복 제출 방지)
+    status = Column(String(16), nullable=False, default="started", server_default="started")
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
@@ -0,0 +1,25 @@
+from common.db.database import Base
+from sqlalchemy import (TIMESTAMP, Boolean, Column, ForeignKey, Integer,
+                        LargeBinary, String, Text)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql import func
+
+
+class QuizSnapshot(Base):
+    """게시(publish)된 퀴즈의 불변 스냅샷. 게시 후 사용자 조회 & 채점은 이 행만 사용"""
+    __tablename__ = "quiz_snapshot"
+
+    quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False)  # 게시 시점의 quiz.version (응시별 셔플 seed & ETag)
+    title = Column(String(255), nullable=False)
+    description = Column(Text)
+    is_random_questions = Column(Boolean, nullable=False)
+    is_random_choices = Column(Boolean, nullable=False)
+    questions_per_page = Column(Integer, nullable=False)
+    # 문제 id 순으로 직렬화한 문제 JSON 객체들 ({"id", "question_text", "choices": [{"id", "choice_text"}]},)
+    content = Column(LargeBinary, nullable=False)
+    # i번째 문제의 content 내 시작 바이트 위치 (마지막 원소는 content 길이). 페이지 구간은 이 배열로 계산
+    offsets = Column(ARRAY(Integer), nullable=False)
+    # 정답표는 사용자 응답 본문과 분리해 저장 {"question_id": [[choice_id, is_correct], ...]}
+    answer_key = Column(JSONB, nullable=False)
+    created_at = Column(TIMESTAMP, server_default=func.now())
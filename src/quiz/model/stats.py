@@ -0,0 +1,42 @@
+from common.db.database import Base
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer
+from sqlalchemy.sql import func
+
+
+class QuizStats(Base):
+    """퀴즈별 응시 통계 (제출 시점에 증분 갱신)"""
+    __tablename__ = "quiz_stats"
+
+    quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)  # 제출된 응시 수
+    score_sum = Column(Integer, nullable=False, default=0)  # 점수 합계 (평균 = score_sum / attempts)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+
+class QuizScoreBucket(Base):
+    """퀴즈별 점수 분포 (10점 단위 구간, 90~100점은 마지막 구간)"""
+    __tablename__ = "quiz_score_bucket"
+
+    quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), primary_key=True)
+    bucket = Column(Integer, primary_key=True)  # 0 ~ 9
+    count = Column(Integer, nullable=False, default=0)
+
+
+class QuestionStats(Base):
+    """문제별 정답률 집계"""
+    __tablename__ = "question_stats"
+
+    question_id = Column(Integer, ForeignKey("question.id", ondelete="CASCADE"), primary_key=True)
+    quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), nullable=False, index=True)
+    answered = Column(Integer, nullable=False, default=0)
+    correct = Column(Integer, nullable=False, default=0)
+
+
+class ChoiceStats(Base):
+    """선택지별 선택 횟수 집계"""
+    __tablename__ = "choice_stats"
+
+    choice_id = Column(Integer, ForeignKey("choice.id", ondelete="CASCADE"), primary_key=True)
+    question_id = Column(Integer, ForeignKey("question.id", ondelete="CASCADE"), nullable=False)
+    quiz_id = Column(Integer, ForeignKey("quiz.id", ondelete="CASCADE"), nullable=False, index=True)
+    picks = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,24 @@
+from common.db.database import Base
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+
+class SubmissionQueue(Base):
+    """비동기 채점 대기열 (SUBMIT_MODE=queue). 응시 기록당 1건"""
+    __tablename__ = "submission_queue"
+    __table_args__ = (
+        # 채점 워커가 대기 중인 작업만 id 순으로 가져가도록 부분 인덱스
+        Index("ix_submission_queue_pending", "id", postgresql_where=text("status = 'pending'")),
+    )
+
+    id = Column(Integer, primary_key=True)
+    quiz_record_id = Column(
+        Integer, ForeignKey("quiz_record.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    payload = Column(JSONB, nullable=False)  # {"answers": [{"question_id": ..., "choice_id": ...}]}
+    status = Column(String(16), nullable=False, default="pending", server_default="pending")  # pending/done/failed
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")  # 채점 시도 횟수
+    error = Column(Text)  # 실패 사유
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    processed_at = Column(TIMESTAMP)  # 채점 완료(또는 실패) 시각
@@ -0,0 +1,283 @@
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from common.db.database import SessionLocal
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from src.quiz.model.answer import Answer
+from src.quiz.model.quiz_record import QuizRecord
+
+logger = logging.getLogger(__name__)
+
+# 버퍼 백엔드 & 주기적 flush 설정 (none이면 버퍼 없이 요청 안에서 바로 저장, 멀티 워커 실행 시 기본값)
+ANSWER_BUFFER_BACKEND = os.getenv("ANSWER_BUFFER_BACKEND", "memory")
+ANSWER_BUFFER_FLUSH_INTERVAL = float(os.getenv("ANSWER_BUFFER_FLUSH_INTERVAL", "1.0"))
+ANSWER_BUFFER_BATCH_SIZE = int(os.getenv("ANSWER_BUFFER_BATCH_SIZE", "5000"))
+# 버퍼에 쌓인 답안 수 상한 (넘으면 요청 안에서 바로 저장)
+ANSWER_BUFFER_MAX_PENDING = int(os.getenv("ANSWER_BUFFER_MAX_PENDING", "200000"))
+# INSERT ... VALUES 한 문장에 넣을 행 수
+UPSERT_CHUNK_SIZE = 1000
+
+# {quiz_record_id: {question_id: choice_id}}
+PendingAnswers = Dict[int, Dict[int, int]]
+
+
+def lock_started_records(db: Session, record_ids) -> set:
+    """
+    아직 제출되지 않은(started) 응시 기록만 FOR SHARE로 잠가 id 반환
+    제출(started -> submitted UPDATE)과 동시에 실행되면 제출 트랜잭션이 끝날 때까지 기다린 뒤 상태를 다시 확인하므로,
+    제출 후에 늦게 도착한 임시 저장 답안이 이미 채점된 응시 기록에 들어가지 않음
+    """
+    return set(db.execute(
+        select(QuizRecord.id)
+        .where(QuizRecord.id.in_(sorted(record_ids)), QuizRecord.status == "started")
+        .order_by(QuizRecord.id)
+        .with_for_update(read=True)
+    ).scalars())
+
+
+def upsert_answers(db: Session, pending: PendingAnswers, started_only: bool = False) -> int:
+    """
+    답안 다중 행 upsert (커밋은 호출 측에서)
+    (quiz_record_id, question_id)가 같으면 choice_id만 교체. 교착 방지를 위해 키 순서로 정렬
+    started_only면 제출된 응시 기록의 답안은 버림 (임시 저장 경로)
+    """
+    if started_only and pending:
+        started = lock_started_records(db, pending)
+        late = sum(len(answers) for record_id, answers in pending.items() if record_id not in started)
+        if late:
+            logger.info("dropped %d buffered answers for already submitted records", late)
+        pending = {record_id: answers for record_id, answers in pending.items() if record_id in started}
+
+    rows = [
+        {"quiz_record_id": record_id, "question_id": question_id, "choice_id": choice_id}
+        for record_id in sorted(pending)
+        for question_id, choice_id in sorted(pending[record_id].items())
+    ]
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(Answer).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[Answer.quiz_record_id, Answer.question_id],
+            set_={"choice_id": stmt.excluded.choice_id, "updated_at": func.now()},
+        ))
+    return len(rows)
+
+
+class AnswerBuffer(ABC):
+    """
+    응시 중 답안 임시 저장소 인터페이스
+    같은 (응시 기록, 문제)에 대한 답안은 마지막 값으로 합쳐짐
+    """
+
+    @abstractmethod
+    def put(self, record_id: int, answers: Dict[int, int]) -> bool:
+        """답안 추가. 버퍼가 가득 차 받을 수 없으면 False"""
+
+    @abstractmethod
+    def take(self, max_answers: int) -> PendingAnswers:
+        """flush할 답안을 최대 max_answers개 꺼냄 (응시 기록 단위)"""
+
+    @abstractmethod
+    def drain(self, record_id: int) -> Dict[int, int]:
+        """응시 기록 하나의 남은 답안을 모두 꺼냄"""
+
+    @abstractmethod
+    def restore(self, pending: PendingAnswers) -> None:
+        """저장에 실패한 답안을 되돌려 놓음 (그 사이 들어온 새 답안이 우선)"""
+
+    @abstractmethod
+    def pending(self) -> int:
+        """버퍼에 남은 답안 수"""
+
+
+class InMemoryAnswerBuffer(AnswerBuffer):
+    """워커 프로세스 메모리 버퍼"""
+
+    def __init__(self, max_pending: int = ANSWER_BUFFER_MAX_PENDING):
+        self.max_pending = max_pending
+        self._data: PendingAnswers = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def put(self, record_id: int, answers: Dict[int, int]) -> bool:
+        with self._lock:
+            current = self._data.get(record_id, {})
+            added = sum(1 for question_id in answers if question_id not in current)
+            if self._count + added > self.max_pending:
+                return False
+            current.update(answers)
+            self._data[record_id] = current
+            self._count += added
+            return True
+
+    def take(self, max_answers: int) -> PendingAnswers:
+        taken: PendingAnswers = {}
+        with self._lock:
+            size = 0
+            # 먼저 들어온 응시 기록부터 (dict 삽입 순서)
+            for record_id in list(self._data):
+                if taken and size + len(self._data[record_id]) > max_answers:
+                    break
+                answers = self._data.pop(record_id)
+                taken[record_id] = answers
+                size += len(answers)
+            self._count -= size
+        return taken
+
+    def drain(self, record_id: int) -> Dict[int, int]:
+        with self._lock:
+            answers = self._data.pop(record_id, {})
+            self._count -= len(answers)
+            return answers
+
+    def restore(self, pending: PendingAnswers) -> None:
+        with self._lock:
+            for record_id, answers in pending.items():
+                current = self._data.setdefault(record_id, {})
+                for question_id, choice_id in answers.items():
+                    if question_id not in current:
+                        current[question_id] = choice_id
+                        self._count += 1
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._count
+
+
+class NoAnswerBuffer(AnswerBuffer):
+    """
+    버퍼 없음: put이 항상 False라 save_progress가 요청 안에서 바로 저장
+    워커 프로세스가 여러 개면 제출을 처리하는 워커가 다른 워커의 메모리 버퍼를 꺼낼 수 없으므로 이 백엔드 사용
+    """
+
+    def put(self, record_id: int, answers: Dict[int, int]) -> bool:
+        return False
+
+    def take(self, max_answers: int) -> PendingAnswers:
+        return {}
+
+    def drain(self, record_id: int) -> Dict[int, int]:
+        return {}
+
+    def restore(self, pending: PendingAnswers) -> None:
+        # 꺼내 준 답안이 없으므로 되돌릴 것도 없음
+        pass
+
+    def pending(self) -> int:
+        return 0
+
+
+ANSWER_BUFFER_BACKENDS = {
+    "memory": InMemoryAnswerBuffer,
+    "none": NoAnswerBuffer,
+}
+
+
+def create_answer_buffer(backend: str = ANSWER_BUFFER_BACKEND) -> AnswerBuffer:
+    try:
+        return ANSWER_BUFFER_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(f"지원하지 않는 ANSWER_BUFFER_BACKEND: {backend}")
+
+
+class AnswerBufferFlusher:
+    """
+    버퍼의 답안을 주기적으로 answer 테이블에 일괄 upsert하는 백그라운드 스레드
+    lock은 버퍼에서 꺼내는 동안만 잡고 DB 저장은 lock 밖에서 하므로, 제출(drained)이 flush를 기다리지 않음
+    저장 중인 답안은 inflight에 남겨 두어 그 사이 제출해도 채점에서 빠지지 않음
+    """
+
+    def __init__(self, buffer: AnswerBuffer, interval: float = ANSWER_BUFFER_FLUSH_INTERVAL,
+                 batch_size: int = ANSWER_BUFFER_BATCH_SIZE):
+        self.buffer = buffer
+        self.interval = interval
+        self.batch_size = batch_size
+        self.lock = threading.Lock()
+        # flush는 한 번에 하나만 (타이머 스레드 & 종료 시 flush)
+        self._flush_lock = threading.Lock()
+        self._inflight: PendingAnswers = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushed = 0
+        self.failures = 0
+
+    def flush(self) -> int:
+        """버퍼가 빌 때까지 batch_size 단위로 저장 (제출된 응시 기록의 답안은 버림). 저장한 답안 수 반환"""
+        total = 0
+        with self._flush_lock:
+            while True:
+                with self.lock:
+                    pending = self.buffer.take(self.batch_size)
+                    self._inflight.update(pending)
+                if not pending:
+                    break
+                db = SessionLocal()
+                try:
+                    count = upsert_answers(db, pending, started_only=True)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    self.buffer.restore(pending)
+                    self.failures += 1
+                    logger.exception("answer buffer flush failed (%d records)", len(pending))
+                    break
+                finally:
+                    db.close()
+                    with self.lock:
+                        for record_id in pending:
+                            self._inflight.pop(record_id, None)
+                total += count
+        self.flushed += total
+        return total
+
+    @contextmanager
+    def drained(self, record_id: int) -> Iterator[Dict[int, int]]:
+        """
+        제출 시 해당 응시 기록의 남은 답안 꺼내기 (버퍼 + 저장 중인 답안, 버퍼 쪽이 최신)
+        블록 안에서 예외가 나면(채점/커밋 실패로 롤백) 꺼낸 답안을 버퍼에 되돌림
+        """
+        with self.lock:
+            answers = dict(self._inflight.get(record_id, {}))
+            answers.update(self.buffer.drain(record_id))
+        try:
+            yield answers
+        except BaseException:
+            if answers:
+                self.buffer.restore({record_id: answers})
+            raise
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="answer-buffer-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스레드 종료 후 남은 답안 저장"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "backend": ANSWER_BUFFER_BACKEND,
+            "pending": self.buffer.pending(),
+            "flushed": self.flushed,
+            "failures": self.failures,
+        }
+
+
+answer_buffer = create_answer_buffer()
+answer_flusher = AnswerBufferFlusher(answer_buffer)
@@ -0,0 +1,57 @@
+import os
+from typing import Dict, FrozenSet
+
+from common.cache.cache import Cache, backend, invalidation
+
+ANSWER_KEY_CACHE_SIZE = int(os.getenv("ANSWER_KEY_CACHE_SIZE", "1024"))
+QUIZ_PAGE_CACHE_SIZE = int(os.getenv("QUIZ_PAGE_CACHE_SIZE", "4096"))
+QUIZ_CONTENT_CACHE_SIZE = int(os.getenv("QUIZ_CONTENT_CACHE_SIZE", "256"))
+QUIZ_SNAPSHOT_CACHE_SIZE = int(os.getenv("QUIZ_SNAPSHOT_CACHE_SIZE", "256"))
+
+
+class AnswerKey:
+    """퀴즈 하나의 정답표 (question_id -> 정답 choice_id 집합, choice_id -> question_id)"""
+
+    __slots__ = ("question_count", "correct_choices", "choice_question")
+
+    def __init__(
+        self,
+        question_count: int,
+        correct_choices: Dict[int, FrozenSet[int]],
+        choice_question: Dict[int, int],
+    ):
+        self.question_count = question_count
+        self.correct_choices = correct_choices
+        self.choice_question = choice_question
+
+    def is_valid(self, question_id: int, choice_id: int) -> bool:
+        return self.choice_question.get(choice_id) == question_id
+
+    def is_correct(self, question_id: int, choice_id: int) -> bool:
+        return choice_id in self.correct_choices.get(question_id, ())
+
+
+# 워커별 로컬 LRU 뒤에 CACHE_BACKEND 공유 저장소를 두어 여러 워커가 한 번 적재한 항목을 같이 사용
+# quiz_id -> 정답표. quiz_scope 세대 번호가 키에 포함되므로 invalidate_quiz로 모든 워커에서 무효화
+answer_key_cache = Cache("answer_key", ANSWER_KEY_CACHE_SIZE, backend, invalidation)
+# (quiz_id, version, page) -> 렌더링된 페이지. 버전이 키에 포함되므로 별도 무효화 불필요
+quiz_page_cache = Cache("quiz_page", QUIZ_PAGE_CACHE_SIZE, backend, invalidation)
+# (quiz_id, version) -> 퀴즈 전체 문제 id 목록 & 내용 (응시별 셔플 모드용)
+quiz_content_cache = Cache("quiz_content", QUIZ_CONTENT_CACHE_SIZE, backend, invalidation)
+# quiz_id -> 게시된 퀴즈 스냅샷. 게시 후에는 바뀌지 않으므로 무효화 불필요
+quiz_snapshot_cache = Cache("quiz_snapshot", QUIZ_SNAPSHOT_CACHE_SIZE, backend, invalidation)
+
+
+def quiz_scope(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}"
+
+
+def invalidate_quiz(quiz_id: int) -> None:
+    """퀴즈 내용/설정이 바뀌면 관련 캐시 세대 번호를 올리고 다른 워커에 무효화 메시지 전송"""
+    invalidation.invalidate(quiz_scope(quiz_id))
+
+
+def get_cache_stats() -> list:
+    return [
+        answer_key_cache.stats(), quiz_page_cache.stats(), quiz_content_cache.stats(), quiz_snapshot_cache.stats()
+    ]
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+from datetime import timedelta
+from typing import NamedTuple, Optional
+
+from fastapi.exceptions import HTTPException
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from src.quiz.model.idempotency_key import IdempotencyKey
+
+# purge-idempotency-keys 명령으로 지울 때의 기본 보관 기간
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+MAX_KEY_LENGTH = 255
+
+
+class StoredResponse(NamedTuple):
+    """같은 Idempotency-Key로 처리된 최초 응답"""
+    status_code: int
+    body: dict
+
+
+def request_fingerprint(body: Optional[dict] = None) -> str:
+    """요청 본문 해시 (키 재사용 시 같은 요청인지 확인)"""
+    canonical = json.dumps(body or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def check_key(key: str) -> None:
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Idempotency-Key는 1~{MAX_KEY_LENGTH}자여야 합니다.")
+
+
+def claim_statement(user_id: int, scope: str, key: str, fingerprint: str):
+    """
+    키 선점 INSERT (ON CONFLICT DO NOTHING RETURNING id)
+    같은 키의 요청이 동시에 들어오면 유니크 인덱스에서 먼저 들어온 트랜잭션의 커밋을 기다린 뒤 충돌 처리됨
+    CTE로 다른 INSERT와 묶어 한 문장으로 실행할 수 있도록 문장만 반환
+    """
+    return (
+        pg_insert(IdempotencyKey)
+        .values(user_id=user_id, scope=scope, key=key, request_hash=fingerprint)
+        .on_conflict_do_nothing(index_elements=["user_id", "scope", "key"])
+        .returning(IdempotencyKey.id)
+    )
+
+
+def save_response(db: Session, user_id: int, scope: str, key: str, status_code: int, body: dict) -> None:
+    """선점한 키에 응답 기록 (커밋은 호출 측 트랜잭션에서)"""
+    db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+        .values(status_code=status_code, response=body)
+    )
+
+
+def store_response(
+    db: Session, user_id: int, scope: str, key: str, fingerprint: str, status_code: int, body: dict
+) -> None:
+    """키와 응답을 한 번에 기록 (다른 조건부 문장으로 중복이 이미 걸러진 경우, 커밋은 호출 측에서)"""
+    db.execute(
+        pg_insert(IdempotencyKey)
+        .values(
+            user_id=user_id,
+            scope=scope,
+            key=key,
+            request_hash=fingerprint,
+            status_code=status_code,
+            response=body,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "scope", "key"])
+    )
+
+
+def get_stored_response(
+    db: Session, user_id: int, scope: str, key: str, fingerprint: str
+) -> Optional[StoredResponse]:
+    """저장된 응답 조회. 같은 키로 다른 요청을 보냈으면 422"""
+    row = db.execute(
+        select(IdempotencyKey.request_hash, IdempotencyKey.status_code, IdempotencyKey.response)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+    ).first()
+    if row is None or row.response is None:
+        return None
+    if row.request_hash != fingerprint:
+        raise HTTPException(status_code=422, detail="같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다.")
+    return StoredResponse(row.status_code, row.response)
+
+
+def purge_keys(db: Session, older_than_hours: int = IDEMPOTENCY_KEY_TTL_HOURS) -> int:
+    """보관 기간이 지난 키 삭제. 삭제한 행 수 반환"""
+    cutoff = func.now() - timedelta(hours=older_than_hours)
+    result = db.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff))
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,64 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from fastapi.exceptions import HTTPException
+from sqlalchemy import asc, desc, tuple_
+
+# 정렬 컬럼별 커서 값 타입 (그 외 정렬 키는 id 값을 씀)
+CURSOR_VALUE_TYPES = {
+    "created_at": datetime,
+    "updated_at": datetime,
+    "title": str,
+}
+
+
+def encode_cursor(sort_by: str, order: str, value: Any, row_id: int) -> str:
+    """(정렬 컬럼 값, id)를 불투명한 커서 문자열로 인코딩"""
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps([sort_by, order, value, row_id], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str) -> Tuple[Any, int]:
+    """
+    커서 문자열 -> (정렬 컬럼 값, id). 정렬 조건이 다르거나 형식이 잘못되면 400
+    값 타입도 정렬 컬럼에 맞는지 확인 (조작된 커서가 DB 오류(500)까지 가지 않도록)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort_by, cursor_order, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+    if cursor_sort_by != sort_by or cursor_order != order:
+        raise HTTPException(status_code=400, detail="커서의 정렬 조건이 요청과 다릅니다.")
+    # bool은 int의 하위 타입이므로 type()으로 비교
+    if type(value) is not CURSOR_VALUE_TYPES.get(sort_by, int) or type(row_id) is not int:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    return value, row_id
+
+
+def apply_keyset(query, sort_column, id_column, order: str, after: Optional[Tuple[Any, int]]):
+    """
+    (정렬 컬럼, id) 기준 keyset 페이지네이션 적용
+    id를 tiebreaker로 사용하므로 정렬 컬럼 값이 같아도 누락/중복 없이 이어서 조회
+    """
+    direction = desc if order == "desc" else asc
+    if after is not None:
+        value, row_id = after
+        if sort_column is id_column:
+            condition = id_column < row_id if order == "desc" else id_column > row_id
+        elif order == "desc":
+            condition = tuple_(sort_column, id_column) < tuple_(value, row_id)
+        else:
+            condition = tuple_(sort_column, id_column) > tuple_(value, row_id)
+        query = query.filter(condition)
+
+    if sort_column is id_column:
+        return query.order_by(direction(id_column))
+    return query.order_by(direction(sort_column), direction(id_column))
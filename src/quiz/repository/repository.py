@@ -1,16 +1,18 @@
 import random
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 
 import pytz
 from fastapi.exceptions import HTTPException
-from sqlalchemy import desc, func
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 from src.quiz.model import Choice, Question, Quiz
-from src.quiz.schema.schema import (ChoiceResponse, QuestionCreate,
-                                    QuestionResponse, QuizCreate,
-                                    QuizDetailResponse, QuizListResponse,
-                                    QuizResponse)
+from src.quiz.repository.cache import invalidate_quiz
+from src.quiz.repository.pagination import (apply_keyset, decode_cursor,
+                                            encode_cursor)
+from src.quiz.repository.snapshot import check_not_published
+from src.quiz.schema.schema import (QuestionCreate, QuizCreate,
+                                    QuizListResponse, QuizResponse)
 
 KST = pytz.timezone("Asia/Seoul")
 
@@ -18,30 +20,50 @@ def check_existing_quiz(db: Session, title: str):
     """이미 존재하는 퀴즈인지 확인"""
     return db.query(Quiz).filter(Quiz.title == title).first()
 
+def insert_questions(db: Session, quiz_id: int, questions: List[QuestionCreate]) -> List[int]:
+    """
+    문제 & 선택지 다중 행 INSERT (커밋은 호출 측에서)
+    문제 id는 RETURNING으로 한 번에 받아오므로 문제마다 flush하지 않음
+    """
+    if not questions:
+        return []
+
+    question_ids = db.execute(
+        insert(Question).returning(Question.id, sort_by_parameter_order=True),
+        [{"quiz_id": quiz_id, "question_text": question_data.question_text} for question_data in questions],
+    ).scalars().all()
+
+    choice_rows = [
+        {
+            "question_id": question_id,
+            "choice_text": choice_data.choice_text,
+            "is_correct": choice_data.is_correct,
+        }
+        for question_id, question_data in zip(question_ids, questions)
+        for choice_data in question_data.choices
+    ]
+    if choice_rows:
+        db.execute(insert(Choice), choice_rows)
+    return question_ids
+
 def create_quiz(db: Session, quiz_data: QuizCreate):
     """퀴즈 생성 (문제 & 선택지 포함)"""
     existing_quiz = check_existing_quiz(db, quiz_data.title)
     if existing_quiz:
         raise HTTPException(status_code=409, detail="이미 동일한 제목의 퀴즈가 존재합니다.")
 
-    new_quiz = Quiz(title=quiz_data.title, description=quiz_data.description)
+    new_quiz = Quiz(
+        title=quiz_data.title,
+        description=quiz_data.description,
+        num_questions=len(quiz_data.questions)
+    )
     db.add(new_quiz)
     db.flush()  # quiz.id 확보
 
-    for question_data in quiz_data.questions:
-        new_question = Question(quiz_id=new_quiz.id, question_text=question_data.question_text)
-        db.add(new_question)
-        db.flush()  # question.id 확보
-
-        for choice_data in question_data.choices:
-            new_choice = Choice(
-                question_id=new_question.id,
-                choice_text=choice_data.choice_text,
-                is_correct=choice_data.is_correct
-            )
-            db.add(new_choice)
+    insert_questions(db, new_quiz.id, quiz_data.questions)
 
     db.commit()
+    invalidate_quiz(new_quiz.id)
     db.refresh(new_quiz)
     return new_quiz
 
@@ -50,102 +72,168 @@ def get_quiz_by_id(db: Session, quiz_id: int):
     return db.query(Quiz).filter(Quiz.id == quiz_id).first()
 
 def add_questions_to_quiz(db: Session, quiz_id: int, questions: List[QuestionCreate]):
-    """기존 퀴즈에 문제 추가"""
-    quiz = get_quiz_by_id(db, quiz_id)
+    """기존 퀴즈에 문제 추가 (게시된 퀴즈는 409, quiz 행을 잠가 게시와 동시에 실행되지 않게 함)"""
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).with_for_update().first()
     if not quiz:
         raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+    check_not_published(quiz)
 
+    # 검증을 먼저 끝낸 뒤 다중 행 INSERT
     for question_data in questions:
-        # 문제 추가
-        new_question = Question(quiz_id=quiz.id, question_text=question_data.question_text)
-        db.add(new_question)
-        db.flush()  # question.id 확보
-
-        # 선택지 추가
         correct_count = sum(1 for choice in question_data.choices if choice.is_correct)
         if len(question_data.choices) < 2 or correct_count < 1:
             raise HTTPException(status_code=400, detail="각 문제는 최소 2개의 선택지를 가져야 하며, 정답이 1개 포함되어야 합니다.")
 
-        for choice_data in question_data.choices:
-            new_choice = Choice(
-                question_id=new_question.id,
-                choice_text=choice_data.choice_text,
-                is_correct=choice_data.is_correct
-            )
-            db.add(new_choice)
-            
+    insert_questions(db, quiz.id, questions)
+
     quiz.updated_at = datetime.now(KST)
+    quiz.num_questions = Quiz.num_questions + len(questions)  # 같은 트랜잭션에서 문제 개수 갱신
+    quiz.version = Quiz.version + 1  # 페이지 캐시 & ETag 무효화
     db.commit()
+    invalidate_quiz(quiz.id)
     return QuizResponse.from_orm(quiz)
 
+# 정렬 허용 컬럼 (keyset 페이지네이션은 모두 id를 tiebreaker로 사용)
+QUIZ_SORT_COLUMNS = {
+    "id": Quiz.id,
+    "title": Quiz.title,
+    "created_at": Quiz.created_at,
+    "updated_at": Quiz.updated_at,
+}
+QUESTION_SORT_COLUMNS = {
+    "id": Question.id,
+    "created_at": Question.created_at,
+    "updated_at": Question.updated_at,
+}
+
 def get_quiz_list(
-    db: Session, page: int = 1, page_size: int = 10, sort_by: str = "created_at", order: str = "desc"
-):
-    """관리자용 퀴즈 목록 조회 (페이징 지원)"""
-    sort_column = getattr(Quiz, sort_by, Quiz.created_at)
-    if order == "desc":
-        sort_column = desc(sort_column)
-
-    quizzes = (
-        db.query(
-            Quiz.id,
-            Quiz.title,
-            Quiz.description,
-            Quiz.created_at,
-            func.count(Question.id).label("num_questions")
-        )
-        .outerjoin(Question, Quiz.id == Question.quiz_id)
-        .group_by(Quiz.id)
-        .order_by(sort_column)
-        .limit(page_size)
-        .offset((page - 1) * page_size)
-        .all()
+    db: Session,
+    page: int = 1,
+    page_size: int = 10,
+    sort_by: str = "created_at",
+    order: str = "desc",
+    cursor: Optional[str] = None
+) -> Tuple[List[QuizListResponse], Optional[str]]:
+    """
+    관리자용 퀴즈 목록 조회 (페이징 지원)
+    cursor가 주어지면 OFFSET 대신 keyset 페이지네이션. (목록, 다음 페이지 커서) 반환
+    """
+    if sort_by not in QUIZ_SORT_COLUMNS:
+        sort_by = "created_at"
+    sort_column = QUIZ_SORT_COLUMNS[sort_by]
+
+    # 문제 개수는 quiz.num_questions 카운터 사용 (COUNT/GROUP BY 없음)
+    query = db.query(
+        Quiz.id,
+        Quiz.title,
+        Quiz.description,
+        Quiz.created_at,
+        Quiz.updated_at,
+        Quiz.num_questions
     )
 
-    return [QuizListResponse.from_orm(quiz) for quiz in quizzes]
+    after = decode_cursor(cursor, sort_by, order) if cursor else None
+    query = apply_keyset(query, sort_column, Quiz.id, order, after)
+    if after is None:
+        query = query.offset((page - 1) * page_size)
+    quizzes = query.limit(page_size).all()
+
+    next_cursor = None
+    if len(quizzes) == page_size:
+        last = quizzes[-1]
+        next_cursor = encode_cursor(sort_by, order, getattr(last, sort_by), last.id)
+
+    return [QuizListResponse.from_orm(quiz) for quiz in quizzes], next_cursor
 
 def get_quiz_detail(
-    db: Session, quiz_id: int, page: int, page_size: int, sort_by: str = "created_at", order: str = "desc"
-) -> QuizDetailResponse:
-    """퀴즈 상세 조회 (랜덤 배치 및 페이징 지원)"""
-    sort_column = getattr(Question, sort_by, Question.created_at)
-    if order == "desc":
-        sort_column = desc(sort_column)
-
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    db: Session,
+    quiz_id: int,
+    page: int,
+    page_size: int,
+    sort_by: str = "created_at",
+    order: str = "desc",
+    cursor: Optional[str] = None
+) -> dict:
+    """
+    퀴즈 상세 조회 (랜덤 배치 및 페이징 지원, cursor가 주어지면 keyset 페이지네이션)
+    ORM 객체 대신 결과 행에서 바로 QuizDetailResponse 형태의 dict를 만듦 (검증은 response_model 또는 생략)
+    """
+    if sort_by not in QUESTION_SORT_COLUMNS:
+        sort_by = "created_at"
+    sort_column = QUESTION_SORT_COLUMNS[sort_by]
+
+    quiz = db.execute(
+        select(Quiz.id, Quiz.title, Quiz.description, Quiz.created_at, Quiz.updated_at, Quiz.num_questions)
+        .where(Quiz.id == quiz_id)
+    ).first()
     if not quiz:
         raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
 
-    total_questions = db.query(func.count(Question.id)).filter(Question.quiz_id == quiz_id).scalar()
-
     # 퀴즈의 문제 목록 가져오기 (페이징 적용)
-    questions = (
-        db.query(Question)
-        .filter(Question.quiz_id == quiz_id)
-        .order_by(sort_column)
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    query = select(Question.id, Question.question_text, sort_column).where(Question.quiz_id == quiz_id)
+    after = decode_cursor(cursor, sort_by, order) if cursor else None
+    query = apply_keyset(query, sort_column, Question.id, order, after)
+    if after is None:
+        query = query.offset((page - 1) * page_size)
+    questions = db.execute(query.limit(page_size)).all()
+
+    # 선택지는 한 번의 IN 쿼리로 함께 조회 (문제 수와 무관하게 쿼리 수 고정)
+    choices = {question_id: [] for question_id, _, _ in questions}
+    if choices:
+        rows = db.execute(
+            select(Choice.question_id, Choice.id, Choice.choice_text, Choice.is_correct)
+            .where(Choice.question_id.in_(list(choices)))
+            .order_by(Choice.question_id, Choice.id)
+        )
+        for question_id, choice_id, choice_text, is_correct in rows:
+            choices[question_id].append({"id": choice_id, "choice_text": choice_text, "is_correct": is_correct})
+
+    next_cursor = None
+    if len(questions) == page_size:
+        last_id, _, last_value = questions[-1]
+        next_cursor = encode_cursor(sort_by, order, last_value, last_id)
+
+    return {
+        "id": quiz.id,
+        "title": quiz.title,
+        "description": quiz.description,
+        "created_at": quiz.created_at,
+        "updated_at": quiz.updated_at,
+        "total_questions": quiz.num_questions,
+        "questions": [
+            {"id": question_id, "question_text": question_text, "choices": choices[question_id]}
+            for question_id, question_text, _ in questions
+        ],
+        "next_cursor": next_cursor,
+    }
+
+def repair_question_counts(db: Session, fix: bool = True) -> List[Tuple[int, int, int]]:
+    """
+    quiz.num_questions 카운터와 실제 문제 개수를 비교해 어긋난 퀴즈 목록 반환
+    fix=True이면 실제 개수로 복구. [(quiz_id, 저장된 값, 실제 값)] 반환
+    """
+    actual_count = (
+        select(func.count(Question.id))
+        .where(Question.quiz_id == Quiz.id)
+        .correlate(Quiz)
+        .scalar_subquery()
     )
+    drifted = [
+        (row.id, row.num_questions, row.actual)
+        for row in db.query(Quiz.id, Quiz.num_questions, actual_count.label("actual"))
+        .filter(Quiz.num_questions != actual_count)
+        .order_by(Quiz.id)
+        .all()
+    ]
 
-    questions_data = []
-    for question in questions:
-        choices = db.query(Choice).filter(Choice.question_id == question.id).all()
-
-        question_response = QuestionResponse(
-            id=question.id,
-            question_text=question.question_text,
-            choices=[ChoiceResponse.from_orm(choice) for choice in choices]
+    if fix and drifted:
+        db.execute(
+            update(Quiz)
+            .where(Quiz.id.in_([quiz_id for quiz_id, _, _ in drifted]))
+            .values(num_questions=actual_count, version=Quiz.version + 1)
         )
-        questions_data.append(question_response)
-
-    return QuizDetailResponse(
-        id=quiz.id,
-        title=quiz.title,
-        description=quiz.description,
-        created_at=quiz.created_at,
-        updated_at=quiz.updated_at,
-        total_questions=total_questions,
-        questions=questions_data
-    )
+        db.commit()
+        for quiz_id, _, _ in drifted:
+            invalidate_quiz(quiz_id)
 
+    return drifted
@@ -0,0 +1,59 @@
+from typing import List, Sequence
+
+MASK64 = (1 << 64) - 1
+
+
+def mix64(x: int) -> int:
+    """splitmix64 finalizer (64비트 정수 해시)"""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def attempt_seed(attempt_id: int, version: int) -> int:
+    """(응시 기록, 퀴즈 버전) -> 셔플 seed"""
+    return mix64(mix64(attempt_id) ^ version)
+
+
+class IndexPermutation:
+    """
+    [0, n) 위의 seed 기반 순열 (4라운드 Feistel + cycle-walking)
+    전체 목록을 섞지 않고 i번째 위치의 값만 O(1)로 계산하므로, 한 페이지는 O(page_size)
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, n: int, seed: int):
+        bits = max(2, (n - 1).bit_length())
+        if bits % 2:
+            bits += 1
+        self.n = n
+        self.half = bits // 2
+        self.mask = (1 << self.half) - 1
+        self.keys = [mix64(seed + r) for r in range(self.ROUNDS)]
+
+    def _encrypt(self, x: int) -> int:
+        left, right = x >> self.half, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (mix64(key ^ right) & self.mask)
+        return (left << self.half) | right
+
+    def __getitem__(self, index: int) -> int:
+        if self.n <= 1:
+            return index
+        x = self._encrypt(index)
+        while x >= self.n:
+            x = self._encrypt(x)
+        return x
+
+
+def seeded_shuffle(items: Sequence, seed: int) -> List:
+    """seed 기반 Fisher-Yates 셔플 (선택지처럼 짧은 목록용)"""
+    result = list(items)
+    state = seed
+    for i in range(len(result) - 1, 0, -1):
+        state = mix64(state)
+        j = (state * (i + 1)) >> 64
+        result[i], result[j] = result[j], result[i]
+    return result
@@ -0,0 +1,203 @@
+import json
+import random
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+
+from fastapi.exceptions import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.quiz.model import Choice, Question, Quiz
+from src.quiz.model.quiz_snapshot import QuizSnapshot
+from src.quiz.repository.cache import AnswerKey, quiz_snapshot_cache
+from src.quiz.repository.shuffle import (IndexPermutation, attempt_seed,
+                                        mix64, seeded_shuffle)
+
+# 사용자 조회에 필요한 컬럼만 (정답표는 채점 시 따로 적재)
+SNAPSHOT_READ_COLUMNS = (
+    QuizSnapshot.quiz_id,
+    QuizSnapshot.version,
+    QuizSnapshot.title,
+    QuizSnapshot.description,
+    QuizSnapshot.is_random_questions,
+    QuizSnapshot.is_random_choices,
+    QuizSnapshot.questions_per_page,
+    QuizSnapshot.content,
+    QuizSnapshot.offsets,
+)
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class PublishedQuiz:
+    """
+    캐시에 올린 스냅샷 (불변이므로 무효화 없이 캐시, 공유 저장소에는 pickle로 저장)
+    페이지 본문은 content에서 문제별 바이트 구간을 잘라 이어 붙여 만들며, 선택지 셔플이 있을 때만 해당 문제를 파싱
+    id/version/is_random_* 속성은 Quiz와 같아 ETag 계산에 그대로 사용
+    """
+
+    __slots__ = (
+        "id", "version", "is_random_questions", "is_random_choices", "questions_per_page",
+        "content", "offsets", "_prefix",
+    )
+
+    def __init__(self, row):
+        self.id = row.quiz_id
+        self.version = row.version
+        self.is_random_questions = row.is_random_questions
+        self.is_random_choices = row.is_random_choices
+        self.questions_per_page = row.questions_per_page
+        self.content = bytes(row.content)
+        self.offsets = tuple(row.offsets)
+        header = _dumps({"id": row.quiz_id, "title": row.title, "description": row.description})
+        self._prefix = header[:-1] + b',"questions":['
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def total_pages(self) -> int:
+        return (self.total_questions + self.questions_per_page - 1) // self.questions_per_page
+
+    def _question(self, index: int) -> bytes:
+        return self.content[self.offsets[index]:self.offsets[index + 1]]
+
+    def _page_indices(self, page: int, seed: Optional[int]) -> List[int]:
+        total = self.total_questions
+        start = (page - 1) * self.questions_per_page
+        if page < 1 or start >= total:
+            return []
+        stop = min(start + self.questions_per_page, total)
+        if not self.is_random_questions:
+            return list(range(start, stop))
+        if seed is not None:
+            permutation = IndexPermutation(total, seed)
+            return [permutation[i] for i in range(start, stop)]
+        # 응시별 고정 순서가 아니면 기존처럼 페이지 안에서만 섞음
+        return random.sample(range(start, stop), stop - start)
+
+    def render_page(self, page: int, attempt_id: Optional[int] = None) -> bytes:
+        """UserQuizDetailResponse 형태의 JSON 본문. attempt_id가 주어지면 (attempt_id, version) seed로 고정 순서"""
+        seed = attempt_seed(attempt_id, self.version) if attempt_id is not None else None
+        questions = [self._question(index) for index in self._page_indices(page, seed)]
+        if self.is_random_choices:
+            questions = [self._shuffle_choices(question, seed) for question in questions]
+        suffix = f'],"current_page":{page},"total_pages":{self.total_pages}}}'.encode()
+        return self._prefix + b",".join(questions) + suffix
+
+    @staticmethod
+    def _shuffle_choices(question: bytes, seed: Optional[int]) -> bytes:
+        data = json.loads(question)
+        if seed is None:
+            random.shuffle(data["choices"])
+        else:
+            data["choices"] = seeded_shuffle(data["choices"], mix64(seed ^ data["id"]))
+        return _dumps(data)
+
+
+def compile_snapshot(db: Session, quiz: Quiz) -> QuizSnapshot:
+    """문제 & 선택지를 한 번의 쿼리로 읽어 스냅샷 생성 (문제/선택지 모두 id 순, 기존 조회 순서와 동일)"""
+    rows = db.execute(
+        select(Question.id, Question.question_text, Choice.id, Choice.choice_text, Choice.is_correct)
+        .outerjoin(Choice, Choice.question_id == Question.id)
+        .where(Question.quiz_id == quiz.id)
+        .order_by(Question.id, Choice.id)
+    )
+
+    questions = {}
+    answer_key = {}
+    for question_id, question_text, choice_id, choice_text, is_correct in rows:
+        question = questions.setdefault(question_id, {"id": question_id, "question_text": question_text, "choices": []})
+        choices = answer_key.setdefault(str(question_id), [])
+        if choice_id is not None:
+            question["choices"].append({"id": choice_id, "choice_text": choice_text})
+            choices.append([choice_id, is_correct])
+
+    content = bytearray()
+    offsets = []
+    for question in questions.values():
+        offsets.append(len(content))
+        content += _dumps(question)
+    offsets.append(len(content))
+
+    return QuizSnapshot(
+        quiz_id=quiz.id,
+        version=quiz.version,
+        title=quiz.title,
+        description=quiz.description,
+        is_random_questions=bool(quiz.is_random_questions),
+        is_random_choices=bool(quiz.is_random_choices),
+        questions_per_page=quiz.questions_per_page,
+        content=bytes(content),
+        offsets=offsets,
+        answer_key=answer_key,
+    )
+
+
+def publish_quiz(db: Session, quiz_id: int) -> Tuple[QuizSnapshot, datetime]:
+    """
+    퀴즈 게시: 스냅샷 저장 & published_at 기록 (한 트랜잭션)
+    quiz 행을 잠가 문제 추가/설정 변경과 동시에 실행되지 않게 하며, 게시 후에는 둘 다 409
+    """
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).with_for_update().first()
+    if not quiz:
+        raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+    if quiz.published_at is not None:
+        raise HTTPException(status_code=409, detail="이미 게시된 퀴즈입니다.")
+    if quiz.num_questions == 0:
+        raise HTTPException(status_code=400, detail="문제가 없는 퀴즈는 게시할 수 없습니다.")
+
+    snapshot = compile_snapshot(db, quiz)
+    db.add(snapshot)
+    quiz.published_at = func.now()
+    db.commit()
+    db.refresh(quiz)
+    return snapshot, quiz.published_at
+
+
+def check_not_published(quiz: Quiz) -> None:
+    if quiz.published_at is not None:
+        raise HTTPException(status_code=409, detail="게시된 퀴즈는 수정할 수 없습니다.")
+
+
+def get_quiz_for_read(db: Session, quiz_id: int) -> Union[Quiz, PublishedQuiz, None]:
+    """
+    사용자 조회용 퀴즈
+    게시된 퀴즈는 스냅샷 (로컬/공유 캐시에 있으면 DB 조회 없음), 아니면 quiz 행 (없으면 None)
+    """
+    published = quiz_snapshot_cache.get(quiz_id)
+    if published is not None:
+        return published
+
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    if quiz is None or quiz.published_at is None:
+        return quiz
+
+    row = db.execute(select(*SNAPSHOT_READ_COLUMNS).where(QuizSnapshot.quiz_id == quiz_id)).first()
+    if row is None:
+        return quiz
+    published = PublishedQuiz(row)
+    quiz_snapshot_cache.set(quiz_id, published)
+    return published
+
+
+def get_snapshot_answer_key(db: Session, quiz_id: int) -> Optional[AnswerKey]:
+    """게시된 퀴즈면 스냅샷의 정답표, 아니면 None"""
+    stored = db.execute(select(QuizSnapshot.answer_key).where(QuizSnapshot.quiz_id == quiz_id)).scalar()
+    if stored is None:
+        return None
+
+    correct_choices = {}
+    choice_question = {}
+    for question_id, choices in stored.items():
+        question_id = int(question_id)
+        correct_choices[question_id] = frozenset(choice_id for choice_id, is_correct in choices if is_correct)
+        for choice_id, _ in choices:
+            choice_question[choice_id] = question_id
+    return AnswerKey(
+        question_count=len(stored),
+        correct_choices=correct_choices,
+        choice_question=choice_question,
+    )
@@ -0,0 +1,197 @@
+from collections import Counter
+from typing import Iterator, List, Optional, Tuple
+
+from fastapi.exceptions import HTTPException
+from sqlalchemy import case, delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from src.quiz.model import Choice, Quiz
+from src.quiz.model.answer import Answer
+from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.model.stats import (ChoiceStats, QuestionStats, QuizScoreBucket,
+                                  QuizStats)
+from src.quiz.schema.schema import (ChoiceStatsResponse, QuestionStatsResponse,
+                                    QuizStatsResponse, ScoreBucketResponse)
+
+SCORE_BUCKETS = 10  # 10점 단위 (90~100점은 마지막 구간)
+
+
+def score_bucket(score: int) -> int:
+    return min(int(score) // 10, SCORE_BUCKETS - 1)
+
+
+def _upsert_add(db: Session, model, keys: List[str], counters: List[str], rows: List[dict]) -> None:
+    """기본 키가 겹치면 카운터 컬럼을 더하는 다중 행 upsert"""
+    if not rows:
+        return
+    stmt = pg_insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={column: getattr(model, column) + getattr(stmt.excluded, column) for column in counters},
+    )
+    db.execute(stmt, rows)
+
+
+def record_submission_stats(
+    db: Session, quiz_id: int, score: int, graded: List[Tuple[int, int, bool]]
+) -> None:
+    """
+    제출 1건을 통계에 증분 반영 (커밋은 호출 측 트랜잭션에서)
+    graded: [(question_id, choice_id, 정답 여부)]
+    같은 키가 한 문장에 두 번 나오지 않도록 메모리에서 먼저 합산
+    """
+    question_counts = Counter()
+    question_correct = Counter()
+    choice_counts = Counter()
+    for question_id, choice_id, is_correct in graded:
+        question_counts[question_id] += 1
+        question_correct[question_id] += int(is_correct)
+        choice_counts[(question_id, choice_id)] += 1
+
+    _upsert_add(db, QuizStats, ["quiz_id"], ["attempts", "score_sum"],
+                [{"quiz_id": quiz_id, "attempts": 1, "score_sum": int(score)}])
+    _upsert_add(db, QuizScoreBucket, ["quiz_id", "bucket"], ["count"],
+                [{"quiz_id": quiz_id, "bucket": score_bucket(score), "count": 1}])
+    _upsert_add(db, QuestionStats, ["question_id"], ["answered", "correct"], [
+        {"question_id": question_id, "quiz_id": quiz_id, "answered": count, "correct": question_correct[question_id]}
+        for question_id, count in question_counts.items()
+    ])
+    _upsert_add(db, ChoiceStats, ["choice_id"], ["picks"], [
+        {"choice_id": choice_id, "question_id": question_id, "quiz_id": quiz_id, "picks": count}
+        for (question_id, choice_id), count in choice_counts.items()
+    ])
+
+
+def get_quiz_stats(db: Session, quiz_id: int) -> QuizStatsResponse:
+    """미리 집계된 통계 테이블에서 퀴즈 통계 조회 (answer 테이블 스캔 없음)"""
+    if not db.query(exists().where(Quiz.id == quiz_id)).scalar():
+        raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+
+    quiz_stats = db.query(QuizStats).filter(QuizStats.quiz_id == quiz_id).first()
+    attempts = quiz_stats.attempts if quiz_stats else 0
+    score_sum = quiz_stats.score_sum if quiz_stats else 0
+
+    bucket_counts = dict(
+        db.query(QuizScoreBucket.bucket, QuizScoreBucket.count).filter(QuizScoreBucket.quiz_id == quiz_id).all()
+    )
+    choice_rows = (
+        db.query(ChoiceStats.question_id, ChoiceStats.choice_id, ChoiceStats.picks)
+        .filter(ChoiceStats.quiz_id == quiz_id)
+        .order_by(ChoiceStats.choice_id)
+        .all()
+    )
+    choices_by_question = {}
+    for row in choice_rows:
+        choices_by_question.setdefault(row.question_id, []).append(row)
+
+    questions = []
+    for row in db.query(QuestionStats).filter(QuestionStats.quiz_id == quiz_id).order_by(QuestionStats.question_id):
+        questions.append(QuestionStatsResponse(
+            question_id=row.question_id,
+            answered=row.answered,
+            correct=row.correct,
+            correct_rate=round(row.correct / row.answered, 4) if row.answered else 0.0,
+            choices=[
+                ChoiceStatsResponse(
+                    choice_id=choice.choice_id,
+                    picks=choice.picks,
+                    pick_rate=round(choice.picks / row.answered, 4) if row.answered else 0.0,
+                )
+                for choice in choices_by_question.get(row.question_id, [])
+            ],
+        ))
+
+    return QuizStatsResponse(
+        quiz_id=quiz_id,
+        attempts=attempts,
+        average_score=round(score_sum / attempts, 2) if attempts else 0.0,
+        score_distribution=[
+            ScoreBucketResponse(
+                min_score=bucket * 10,
+                max_score=100 if bucket == SCORE_BUCKETS - 1 else bucket * 10 + 9,
+                count=bucket_counts.get(bucket, 0),
+            )
+            for bucket in range(SCORE_BUCKETS)
+        ],
+        questions=questions,
+    )
+
+
+def _aggregate_records(db: Session, quiz_id: int, first_id: int, last_id: int) -> None:
+    """quiz_record id 구간 [first_id, last_id]의 제출 기록을 INSERT ... SELECT로 통계에 합산"""
+    submitted = (
+        (QuizRecord.quiz_id == quiz_id)
+        & QuizRecord.id.between(first_id, last_id)
+        & exists().where(Answer.quiz_record_id == QuizRecord.id)
+    )
+
+    def upsert_from(model, keys, counters, columns, query):
+        stmt = pg_insert(model).from_select(columns, query)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={column: getattr(model, column) + getattr(stmt.excluded, column) for column in counters},
+        )
+        db.execute(stmt)
+
+    upsert_from(
+        QuizStats, ["quiz_id"], ["attempts", "score_sum"], ["quiz_id", "attempts", "score_sum"],
+        select(literal(quiz_id), func.count(QuizRecord.id), func.coalesce(func.sum(QuizRecord.score), 0))
+        .where(submitted),
+    )
+    bucket = func.least(QuizRecord.score / 10, SCORE_BUCKETS - 1)
+    upsert_from(
+        QuizScoreBucket, ["quiz_id", "bucket"], ["count"], ["quiz_id", "bucket", "count"],
+        select(literal(quiz_id), bucket, func.count(QuizRecord.id)).where(submitted).group_by(bucket),
+    )
+    upsert_from(
+        QuestionStats, ["question_id"], ["answered", "correct"], ["question_id", "quiz_id", "answered", "correct"],
+        select(
+            Answer.question_id, literal(quiz_id), func.count(Answer.id),
+            func.sum(case((Choice.is_correct.is_(True), 1), else_=0)),
+        )
+        .join(QuizRecord, QuizRecord.id == Answer.quiz_record_id)
+        .join(Choice, Choice.id == Answer.choice_id)
+        .where(submitted)
+        .group_by(Answer.question_id),
+    )
+    upsert_from(
+        ChoiceStats, ["choice_id"], ["picks"], ["choice_id", "question_id", "quiz_id", "picks"],
+        select(Answer.choice_id, Answer.question_id, literal(quiz_id), func.count(Answer.id))
+        .join(QuizRecord, QuizRecord.id == Answer.quiz_record_id)
+        .where(submitted)
+        .group_by(Answer.choice_id, Answer.question_id),
+    )
+
+
+def rebuild_stats(db: Session, quiz_id: Optional[int] = None, chunk_size: int = 10000) -> Iterator[Tuple[int, int]]:
+    """
+    기존 quiz_record & answer 데이터로 통계를 다시 계산 (backfill)
+    퀴즈 하나를 한 트랜잭션으로 처리하되, 응시 기록은 chunk_size개씩 나눠 집계
+    퀴즈마다 (quiz_id, 처리한 응시 기록 수) yield
+    """
+    if quiz_id is not None:
+        quiz_ids = [quiz_id]
+    else:
+        quiz_ids = db.execute(select(Quiz.id).order_by(Quiz.id)).scalars().all()
+
+    for current_quiz_id in quiz_ids:
+        for model in (QuizStats, QuizScoreBucket, QuestionStats, ChoiceStats):
+            db.execute(delete(model).where(model.quiz_id == current_quiz_id))
+
+        processed = 0
+        last_id = 0
+        while True:
+            record_ids = db.execute(
+                select(QuizRecord.id)
+                .where(QuizRecord.quiz_id == current_quiz_id, QuizRecord.id > last_id)
+                .order_by(QuizRecord.id)
+                .limit(chunk_size)
+            ).scalars().all()
+            if not record_ids:
+                break
+            _aggregate_records(db, current_quiz_id, record_ids[0], record_ids[-1])
+            processed += len(record_ids)
+            last_id = record_ids[-1]
+
+        db.commit()
+        yield current_quiz_id, processed
@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+from common.db.database import SessionLocal
+from fastapi.exceptions import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.model.submission_queue import SubmissionQueue
+from src.quiz.repository.user_repository import grade_answers
+from src.quiz.schema.user_schema import SubmitAnswersRequest
+
+logger = logging.getLogger(__name__)
+
+# sync: 요청 안에서 바로 채점 / queue: 대기열에 넣고 202 응답, 채점 워커가 처리
+SUBMIT_MODE = os.getenv("SUBMIT_MODE", "sync")
+SUBMIT_WORKERS = int(os.getenv("SUBMIT_WORKERS", "2"))
+SUBMIT_BATCH_SIZE = int(os.getenv("SUBMIT_BATCH_SIZE", "50"))
+SUBMIT_POLL_INTERVAL = float(os.getenv("SUBMIT_POLL_INTERVAL", "0.5"))
+# 일시적인 DB 오류로 실패한 작업의 최대 시도 횟수
+SUBMIT_MAX_ATTEMPTS = int(os.getenv("SUBMIT_MAX_ATTEMPTS", "3"))
+
+if SUBMIT_MODE not in ("sync", "queue"):
+    raise ValueError(f"SUBMIT_MODE는 sync 또는 queue만 가능합니다: {SUBMIT_MODE}")
+
+# 같은 프로세스에서 작업이 들어오면 워커를 바로 깨움 (폴링 간격만큼 기다리지 않도록)
+_wakeup = threading.Event()
+
+
+def enqueue_submission(
+    db: Session, record: QuizRecord, answers: SubmitAnswersRequest, buffered: Optional[Dict[int, int]] = None
+) -> bool:
+    """
+    제출 답안을 대기열에 저장 (커밋은 호출 측에서, 커밋 후 notify_workers 호출)
+    이미 대기열에 있는 응시 기록이면 False
+    이 워커의 임시 저장 버퍼에서 꺼낸 답안(buffered)도 함께 담아, 다른 프로세스의 채점 워커가 처리해도 빠지지 않게 함
+    """
+    pending = dict(buffered or {})
+    pending.update((ans.question_id, ans.choice_id) for ans in answers.answers)
+    payload = {
+        "answers": [
+            {"question_id": question_id, "choice_id": choice_id}
+            for question_id, choice_id in sorted(pending.items())
+        ]
+    }
+    stmt = (
+        pg_insert(SubmissionQueue)
+        .values(quiz_record_id=record.id, payload=payload)
+        .on_conflict_do_nothing(index_elements=[SubmissionQueue.quiz_record_id])
+        .returning(SubmissionQueue.id)
+    )
+    return db.execute(stmt).scalar() is not None
+
+
+def notify_workers() -> None:
+    """같은 프로세스의 채점 워커를 바로 깨움"""
+    _wakeup.set()
+
+
+def get_submission_status(db: Session, record_id: int) -> Optional[str]:
+    """대기열 채점 상태 (pending / graded / failed). 대기열을 거치지 않은 응시 기록이면 None"""
+    status = db.execute(
+        select(SubmissionQueue.status).where(SubmissionQueue.quiz_record_id == record_id)
+    ).scalar()
+    if status is None:
+        return None
+    return "graded" if status == "done" else status
+
+
+def process_batch(db: Session, batch_size: int = SUBMIT_BATCH_SIZE) -> int:
+    """
+    대기 중인 작업을 최대 batch_size건 가져와 채점 (한 트랜잭션)
+    FOR UPDATE SKIP LOCKED로 워커끼리 같은 작업을 가져가지 않으며, 워커가 죽으면 롤백되어 다시 pending
+    작업마다 SAVEPOINT를 두어 한 건의 실패가 배치 전체를 되돌리지 않음
+    응시 기록이 없거나 payload가 잘못된 작업은 재시도하지 않고 failed
+    """
+    jobs: List[SubmissionQueue] = db.execute(
+        select(SubmissionQueue)
+        .where(SubmissionQueue.status == "pending")
+        .order_by(SubmissionQueue.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+
+    for job in jobs:
+        job.attempts += 1
+        try:
+            answers = SubmitAnswersRequest.parse_obj(job.payload)
+        except ValidationError as e:
+            job.status = "failed"
+            job.error = f"잘못된 제출 데이터입니다: {e}"
+            job.processed_at = func.now()
+            continue
+
+        try:
+            with db.begin_nested():
+                record = db.get(QuizRecord, job.quiz_record_id)
+                if record is None:
+                    raise HTTPException(status_code=404, detail="응시 기록을 찾을 수 없습니다.")
+                grade_answers(db, record, answers)
+            job.status = "done"
+        except HTTPException as e:
+            # 검증 실패 (채점 사이 퀴즈가 바뀐 경우 등)는 재시도해도 같은 결과
+            job.status = "failed"
+            job.error = str(e.detail)
+        except SQLAlchemyError as e:
+            logger.warning("submission %s grading failed (attempt %s): %s", job.id, job.attempts, e)
+            if job.attempts >= SUBMIT_MAX_ATTEMPTS:
+                job.status = "failed"
+                job.error = str(e)
+        except Exception as e:
+            # 예상하지 못한 오류는 SAVEPOINT만 되돌리고 이 작업만 failed (배치의 다른 작업은 그대로 커밋)
+            logger.exception("submission %s grading failed", job.id)
+            job.status = "failed"
+            job.error = str(e)
+        if job.status != "pending":
+            job.processed_at = func.now()
+
+    db.commit()
+    return len(jobs)
+
+
+class SubmissionWorkerPool:
+    """대기열을 비우는 채점 워커 스레드 풀"""
+
+    def __init__(self, workers: int = SUBMIT_WORKERS, batch_size: int = SUBMIT_BATCH_SIZE,
+                 poll_interval: float = SUBMIT_POLL_INTERVAL):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.processed = 0
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                count = process_batch(db, self.batch_size)
+            except Exception:
+                # 예상하지 못한 오류도 스레드가 죽지 않도록 롤백 후 다음 폴링에서 재시도
+                db.rollback()
+                logger.exception("submission worker batch failed")
+                count = 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self.processed += count
+            # 배치가 가득 찼으면 바로 다음 배치, 아니면 새 작업/폴링 간격까지 대기
+            if count < self.batch_size:
+                _wakeup.wait(self.poll_interval)
+                _wakeup.clear()
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"submission-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """진행 중인 배치를 마치면 종료 (남은 pending 작업은 다음 실행 시 처리)"""
+        self._stop.set()
+        _wakeup.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def stats(self) -> dict:
+        return {"workers": len(self._threads), "processed": self.processed}
+
+
+submission_workers = SubmissionWorkerPool()
@@ -1,84 +1,185 @@
 import random
-from typing import List
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import pytz
 from fastapi.exceptions import HTTPException
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, exists, func, insert, literal, select, update
+from sqlalchemy.orm import Session, selectinload
 from src.quiz.model import Choice, Question, Quiz
 from src.quiz.model.answer import Answer
 from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.repository.answer_buffer import answer_buffer, upsert_answers
+from src.quiz.repository.cache import (AnswerKey, answer_key_cache,
+                                      invalidate_quiz, quiz_content_cache,
+                                      quiz_page_cache, quiz_scope)
+from src.quiz.repository.idempotency import claim_statement
+from src.quiz.repository.pagination import (apply_keyset, decode_cursor,
+                                            encode_cursor)
+from src.quiz.repository.shuffle import (IndexPermutation, attempt_seed,
+                                        mix64, seeded_shuffle)
+from src.quiz.repository.snapshot import (check_not_published,
+                                         get_snapshot_answer_key)
+from src.quiz.repository.stats_repository import record_submission_stats
 from src.quiz.schema.schema import (UpdateQuizSettingsRequest,
                                     UpdateQuizSettingsResponse)
-from src.quiz.schema.user_schema import (SubmitAnswersRequest,
-                                         UserChoiceResponse,
-                                         UserQuestionResponse,
-                                         UserQuizDetailResponse,
+from src.quiz.schema.user_schema import (AnswerSubmit, SaveProgressRequest,
+                                         SubmitAnswersRequest,
                                          UserQuizListResponse)
 
 KST = pytz.timezone("Asia/Seoul")
 
 
-def get_user_quiz_detail(db: Session, quiz_id: int, page: int) -> UserQuizDetailResponse:
-    """사용자가 응시할 퀴즈 상세 조회 (정답 미포함 & 랜덤 배치)"""
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
-    if not quiz:
-        raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+def get_quiz_page_etag(quiz: Quiz, page: int, attempt_id: Optional[int] = None) -> Optional[str]:
+    """
+    페이지 응답의 strong ETag
+    응시별 셔플 모드는 순서가 (attempt_id, version)으로 결정되므로 항상 ETag 가능,
+    그 외 랜덤 배치 퀴즈는 응답이 매번 달라지므로 None
+    """
+    if attempt_id is not None:
+        return f'"quiz-{quiz.id}-v{quiz.version}-a{attempt_id}-p{page}"'
+    if quiz.is_random_questions or quiz.is_random_choices:
+        return None
+    return f'"quiz-{quiz.id}-v{quiz.version}-p{page}"'
 
+def get_quiz_page_content(db: Session, quiz: Quiz, page: int) -> tuple:
+    """
+    페이지의 원본(셔플 전) 문제/선택지 조회
+    (quiz_id, version, page) 단위로 캐시하므로 같은 페이지는 버전당 한 번만 DB에서 렌더링
+    """
+    return quiz_page_cache.get_or_load((quiz.id, quiz.version, page), lambda: load_quiz_page_content(db, quiz, page))
+
+def load_quiz_page_content(db: Session, quiz: Quiz, page: int) -> tuple:
     # 1) 페이지당 문항 수 확인
     page_size = quiz.questions_per_page
 
-    # 2) 전체 문항 개수
-    total_questions = db.query(func.count(Question.id))\
-                        .filter(Question.quiz_id == quiz_id)\
-                        .scalar()
+    # 2) 전체 문항 개수 (quiz.num_questions 카운터)
+    total_questions = quiz.num_questions
 
-    # 3) 문제 조회 (OFFSET + LIMIT)
+    # 3) 문제 조회 (OFFSET + LIMIT), 선택지는 selectinload로 일괄 로딩
     questions = (
         db.query(Question)
-        .filter(Question.quiz_id == quiz_id)
+        .options(selectinload(Question.choices))
+        .filter(Question.quiz_id == quiz.id)
+        .order_by(Question.id)
         .offset((page - 1) * page_size)
         .limit(page_size)
         .all()
     )
 
-    # 4) 관리자 랜덤 설정이 있으면 적용
+    # 4) total_pages 계산
+    total_pages = (total_questions + page_size - 1) // page_size
+
+    return (
+        tuple(
+            (
+                question.id,
+                question.question_text,
+                tuple((choice.id, choice.choice_text) for choice in question.choices),
+            )
+            for question in questions
+        ),
+        total_pages,
+    )
+
+def user_quiz_page(quiz: Quiz, page: int, total_pages: int, questions) -> dict:
+    """UserQuizDetailResponse 형태의 dict ((문제 id, 문제 내용, 선택지 목록) -> 응답, 모델 생성/검증 없음)"""
+    return {
+        "id": quiz.id,
+        "title": quiz.title,
+        "description": quiz.description,
+        "questions": [
+            {
+                "id": question_id,
+                "question_text": question_text,
+                "choices": [{"id": choice_id, "choice_text": choice_text} for choice_id, choice_text in choices],
+            }
+            for question_id, question_text, choices in questions
+        ],
+        "current_page": page,
+        "total_pages": total_pages,
+    }
+
+def get_user_quiz_detail(db: Session, quiz: Quiz, page: int) -> dict:
+    """사용자가 응시할 퀴즈 상세 조회 (정답 미포함 & 랜덤 배치)"""
+    questions, total_pages = get_quiz_page_content(db, quiz, page)
+
+    # 관리자 랜덤 설정이 있으면 캐시된 원본을 복사해서 적용
     if quiz.is_random_questions:
+        questions = list(questions)
         random.shuffle(questions)
 
-    questions_data = []
-    for question in questions:
-        choices = db.query(Choice).filter(Choice.question_id == question.id).all()
-        
-        if quiz.is_random_choices:
-            random.shuffle(choices)
+    if quiz.is_random_choices:
+        questions = [
+            (question_id, question_text, random.sample(choices, len(choices)))
+            for question_id, question_text, choices in questions
+        ]
 
-        question_response = UserQuestionResponse(
-            id=question.id,
-            question_text=question.question_text,
-            choices=[UserChoiceResponse(id=choice.id, choice_text=choice.choice_text) for choice in choices]
-        )
-        questions_data.append(question_response)
+    return user_quiz_page(quiz, page, total_pages, questions)
 
-    # 5) total_pages 계산
-    total_pages = (total_questions + page_size - 1) // page_size
+def get_quiz_content(db: Session, quiz: Quiz) -> tuple:
+    """
+    퀴즈 전체의 (문제 id 목록, 문제 id -> (문제 내용, 선택지 목록)) 조회
+    (quiz_id, version) 단위로 캐시하며, 버전당 한 번만 DB에서 적재
+    """
+    return quiz_content_cache.get_or_load((quiz.id, quiz.version), lambda: load_quiz_content(db, quiz))
 
-    return UserQuizDetailResponse(
-        id=quiz.id,
-        title=quiz.title,
-        description=quiz.description,
-        questions=questions_data,
-        current_page=page,
-        total_pages=total_pages
+def load_quiz_content(db: Session, quiz: Quiz) -> tuple:
+    questions = (
+        db.query(Question)
+        .options(selectinload(Question.choices))
+        .filter(Question.quiz_id == quiz.id)
+        .order_by(Question.id)
+        .all()
     )
+    return (
+        tuple(question.id for question in questions),
+        {
+            question.id: (
+                question.question_text,
+                tuple((choice.id, choice.choice_text) for choice in question.choices),
+            )
+            for question in questions
+        },
+    )
+
+def get_user_quiz_attempt_detail(db: Session, quiz: Quiz, page: int, attempt_id: int) -> dict:
+    """
+    응시별 고정 순서로 퀴즈 상세 조회
+    문제/선택지 순서는 (attempt_id, version) seed로 결정되어 새로고침해도 동일하며,
+    페이지는 OFFSET 쿼리 대신 캐시된 전체 문제 목록에 대한 순열의 구간으로 계산
+    """
+    question_ids, questions = get_quiz_content(db, quiz)
+    page_size = quiz.questions_per_page
+    total_questions = len(question_ids)
+    total_pages = (total_questions + page_size - 1) // page_size
+
+    seed = attempt_seed(attempt_id, quiz.version)
+    start = (page - 1) * page_size
+    stop = min(start + page_size, total_questions)
+    if quiz.is_random_questions:
+        permutation = IndexPermutation(total_questions, seed)
+        page_ids = [question_ids[permutation[i]] for i in range(start, stop)]
+    else:
+        page_ids = question_ids[start:stop]
+
+    page_questions = []
+    for question_id in page_ids:
+        question_text, choices = questions[question_id]
+        if quiz.is_random_choices:
+            choices = seeded_shuffle(choices, mix64(seed ^ question_id))
+        page_questions.append((question_id, question_text, choices))
+
+    return user_quiz_page(quiz, page, total_pages, page_questions)
 
 def update_quiz_settings(
     db: Session, quiz_id: int, settings: UpdateQuizSettingsRequest
 ) -> UpdateQuizSettingsResponse:
     """관리자가 퀴즈의 랜덤 설정 & 페이지당 문항수 등을 변경"""
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).with_for_update().first()
     if not quiz:
         raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+    check_not_published(quiz)
 
     if settings.is_random_questions is not None:
         quiz.is_random_questions = settings.is_random_questions
@@ -91,7 +192,9 @@ def update_quiz_settings(
             raise HTTPException(status_code=400, detail="페이지당 문항 수는 1 이상이어야 합니다.")
         quiz.questions_per_page = settings.questions_per_page
 
+    quiz.version = Quiz.version + 1  # 페이지 캐시 & ETag 무효화
     db.commit()
+    invalidate_quiz(quiz.id)
     db.refresh(quiz)
 
     return UpdateQuizSettingsResponse(
@@ -107,105 +210,242 @@ def create_quiz_record(db: Session, quiz_id: int, user_id: int) -> QuizRecord:
     record = QuizRecord(
         quiz_id=quiz_id,
         user_id=user_id,
-        score=0
+        score=0,
+        status="started"
     )
     db.add(record)
     db.commit()
     db.refresh(record)
     return record
 
+def create_quiz_record_once(db: Session, quiz_id: int, user_id: int, scope: str, key: str, fingerprint: str):
+    """
+    Idempotency-Key 선점 + 응시 기록 생성을 한 문장(CTE)으로 실행 (커밋은 호출 측에서)
+    이미 처리된 키면 응시 기록을 만들지 않고 None 반환
+    """
+    claim = claim_statement(user_id, scope, key, fingerprint).cte("claim")
+    stmt = (
+        insert(QuizRecord)
+        .from_select(
+            ["quiz_id", "user_id", "score", "status"],
+            select(literal(quiz_id), literal(user_id), literal(0), literal("started")).select_from(claim),
+        )
+        .returning(QuizRecord.id, QuizRecord.quiz_id, QuizRecord.user_id, QuizRecord.score, QuizRecord.status)
+    )
+    return db.execute(stmt).first()
+
+def mark_submitted(db: Session, record_id: int, quiz_id: int, user_id: int) -> Optional[QuizRecord]:
+    """
+    started -> submitted 조건부 전환 (UPDATE ... WHERE status='started' RETURNING, 커밋은 호출 측에서)
+    이미 제출됐거나 퀴즈/사용자가 다르면 None. 중복 제출은 이 한 문장으로 걸러짐
+    """
+    stmt = (
+        update(QuizRecord)
+        .where(
+            QuizRecord.id == record_id,
+            QuizRecord.quiz_id == quiz_id,
+            QuizRecord.user_id == user_id,
+            QuizRecord.status == "started",
+        )
+        .values(status="submitted", updated_at=func.now())
+        .returning(QuizRecord)
+    )
+    return db.execute(stmt).scalar_one_or_none()
+
 def get_quiz_record_by_id(db: Session, record_id: int) -> QuizRecord:
     """응시 기록 조회"""
     return db.query(QuizRecord).filter(QuizRecord.id == record_id).first()
 
-def submit_answers(db: Session, record: QuizRecord, answers: SubmitAnswersRequest) -> QuizRecord:
-    """답안 제출 -> 자동 채점 -> quiz_record 업데이트 (100점 만점 기준)"""
+def get_answer_key(db: Session, quiz_id: int) -> AnswerKey:
+    """퀴즈 정답표 조회 (캐시에 없으면 스냅샷 또는 한 번의 쿼리로 적재, 동시 적재는 한 번만)"""
+    return answer_key_cache.get_or_load(quiz_id, lambda: load_answer_key(db, quiz_id), scope=quiz_scope(quiz_id))
 
-    total_questions = db.query(Question).filter(Question.quiz_id == record.quiz_id).count()  
-    correct_answers = 0  
+def load_answer_key(db: Session, quiz_id: int) -> AnswerKey:
+    # 게시된 퀴즈는 스냅샷에 따로 저장된 정답표 사용 (문제/선택지 테이블 조회 없음)
+    answer_key = get_snapshot_answer_key(db, quiz_id)
+    if answer_key is not None:
+        return answer_key
 
-    for ans in answers.answers:
-        choice = db.query(Choice).filter(Choice.id == ans.choice_id, Choice.question_id == ans.question_id).first()
-        if not choice:
-            raise HTTPException(status_code=400, detail=f"잘못된 선택지: choice_id={ans.choice_id} (question_id={ans.question_id}에 속하지 않음)")
+    total_questions = db.query(Quiz.num_questions).filter(Quiz.id == quiz_id).scalar() or 0
+    rows = (
+        db.query(Choice.id, Choice.question_id, Choice.is_correct)
+        .join(Question, Question.id == Choice.question_id)
+        .filter(Question.quiz_id == quiz_id)
+        .all()
+    )
 
-        new_answer = Answer(
-            quiz_record_id=record.id,
-            question_id=ans.question_id,
-            choice_id=ans.choice_id
+    correct_choices = {}
+    choice_question = {}
+    for row in rows:
+        choice_question[row.id] = row.question_id
+        if row.is_correct:
+            correct_choices.setdefault(row.question_id, set()).add(row.id)
+
+    return AnswerKey(
+        question_count=total_questions,
+        correct_choices={question_id: frozenset(ids) for question_id, ids in correct_choices.items()},
+        choice_question=choice_question,
+    )
+
+def validate_answers(answer_key: AnswerKey, answers: List[AnswerSubmit]) -> None:
+    """선택지가 해당 문제에 속하는지 메모리에서 검증 (잘못된 쌍을 모두 모아 400)"""
+    invalid = [ans for ans in answers if not answer_key.is_valid(ans.question_id, ans.choice_id)]
+    if invalid:
+        detail = ", ".join(
+            f"choice_id={ans.choice_id} (question_id={ans.question_id}에 속하지 않음)" for ans in invalid
         )
-        db.add(new_answer)
+        raise HTTPException(status_code=400, detail=f"잘못된 선택지: {detail}")
 
-        if choice.is_correct:
-            correct_answers += 1
+def save_progress(db: Session, record: QuizRecord, answers: SaveProgressRequest) -> int:
+    """
+    응시 중 답안 임시 저장 (write-behind)
+    검증 후 버퍼에만 넣고, answer 테이블에는 백그라운드 flush가 묶어서 upsert
+    버퍼가 가득 차 있으면 요청 안에서 바로 upsert
+    상태 확인과 버퍼 추가 사이에 제출되면 그 답안은 flush 시 버려짐 (started인 응시 기록에만 저장)
+    """
+    if record.status != "started":
+        raise HTTPException(status_code=409, detail="이미 제출된 응시 기록입니다.")
+    validate_answers(get_answer_key(db, record.quiz_id), answers.answers)
+    pending = {ans.question_id: ans.choice_id for ans in answers.answers}
+    if pending and not answer_buffer.put(record.id, pending):
+        upsert_answers(db, {record.id: pending}, started_only=True)
+        db.commit()
+    return len(pending)
+
+def grade_answers(
+    db: Session, record: QuizRecord, answers: SubmitAnswersRequest, buffered: Optional[Dict[int, int]] = None
+) -> QuizRecord:
+    """
+    자동 채점 -> quiz_record 점수 갱신 (100점 만점 기준, 커밋은 호출 측에서)
+    버퍼에서 꺼낸 임시 저장 답안(buffered, answer_flusher.drained)과 제출 답안(우선)을 합쳐 upsert한 뒤,
+    저장된 전체 답안으로 채점
+    """
+
+    # 정답표는 캐시에서 가져와 메모리에서 검증 & 채점
+    answer_key = get_answer_key(db, record.quiz_id)
+    total_questions = answer_key.question_count
+    validate_answers(answer_key, answers.answers)
+
+    pending = dict(buffered or {})
+    pending.update((ans.question_id, ans.choice_id) for ans in answers.answers)
+    if pending:
+        upsert_answers(db, {record.id: pending})
+
+    # 이전에 flush된 답안까지 포함한 최종 답안 (문제당 1행)
+    saved = db.execute(
+        select(Answer.question_id, Answer.choice_id).where(Answer.quiz_record_id == record.id)
+    ).all()
+    graded = [
+        (question_id, choice_id, answer_key.is_correct(question_id, choice_id))
+        for question_id, choice_id in saved
+    ]
+    correct_answers = sum(1 for _, _, is_correct in graded if is_correct)
 
     record.score = round((correct_answers / total_questions) * 100, 2) if total_questions > 0 else 0
 
-    db.commit()
-    db.refresh(record)
+    # 통계 테이블 증분 갱신 (같은 트랜잭션)
+    record_submission_stats(db, record.quiz_id, record.score, graded)
     return record
 
 
-def get_user_quiz_list(db: Session, user_id: int, completed: bool) -> List[UserQuizListResponse]:
+def get_user_quiz_list(
+    db: Session,
+    user_id: int,
+    completed: bool,
+    page: int = 1,
+    page_size: int = 10,
+    cursor: Optional[str] = None,
+    score: str = "best"
+) -> Tuple[List[UserQuizListResponse], Optional[str]]:
     """
-    completed=true  -> 사용자가 이미 응시한 시험 목록 (quiz_record 존재)
-    completed=false -> 사용자가 응시하지 않은 시험 목록 (quiz_record 없음)
+    completed=true  -> 사용자가 이미 응시한 시험 목록 (퀴즈당 1행, score=best|latest)
+    completed=false -> 사용자가 응시하지 않은 시험 목록 (NOT EXISTS anti-join)
+    퀴즈 id 오름차순, cursor가 주어지면 keyset 페이지네이션. (목록, 다음 페이지 커서) 반환
     """
     if completed:
-        # 응시한 시험 목록
-        # SELECT q.*, r.score 
-        # FROM quiz_record r
-        # JOIN quiz q ON r.quiz_id = q.id
-        # WHERE r.user_id = :user_id
-        rows = db.query(
-            Quiz.id.label("quiz_id"),
-            Quiz.title.label("quiz_title"),
-            Quiz.description.label("quiz_desc"),
-            QuizRecord.score.label("quiz_score")
-        )\
-        .join(QuizRecord, QuizRecord.quiz_id == Quiz.id)\
-        .filter(QuizRecord.user_id == user_id)\
-        .all()
-
-        result = []
-        for row in rows:
-            result.append(
-                UserQuizListResponse(
-                    id=row.quiz_id,
-                    title=row.quiz_title,
-                    description=row.quiz_desc,
-                    score=row.quiz_score  # 응시한 시험이므로 점수 표시
-                )
+        # 퀴즈별 최고 점수 또는 가장 최근 응시의 점수
+        # (quiz_record (user_id, quiz_id) 인덱스로 해당 사용자의 기록만 읽음)
+        if score == "latest":
+            scores = (
+                select(QuizRecord.quiz_id, QuizRecord.score)
+                .where(QuizRecord.user_id == user_id)
+                .distinct(QuizRecord.quiz_id)
+                .order_by(QuizRecord.quiz_id, QuizRecord.id.desc())
+                .subquery()
             )
-        return result
-
-    else:
-        # 응시하지 않은 시험 목록
-        # SELECT q.* 
-        # FROM quiz q
-        # LEFT JOIN quiz_record r 
-        #   ON (q.id = r.quiz_id AND r.user_id = :user_id)
-        # WHERE r.id IS NULL
-        subq = db.query(Quiz.id)\
-            .join(QuizRecord, QuizRecord.quiz_id == Quiz.id)\
-            .filter(QuizRecord.user_id == user_id)\
-            .subquery()
-
-        # quiz.id NOT IN (subquery)
-        rows = db.query(Quiz)\
-            .filter(~Quiz.id.in_(subq))
-            # or .filter(Quiz.id.notin_(subq)) 
-        quizzes = rows.all()
-        
-        # 응시 안 한 시험 목록이므로 score=None
-        result = []
-        for q in quizzes:
-            result.append(
-                UserQuizListResponse(
-                    id=q.id,
-                    title=q.title,
-                    description=q.description,
-                    score=None
-                )
+        else:
+            scores = (
+                select(QuizRecord.quiz_id, func.max(QuizRecord.score).label("score"))
+                .where(QuizRecord.user_id == user_id)
+                .group_by(QuizRecord.quiz_id)
+                .subquery()
             )
-        return result
+        query = db.query(Quiz.id, Quiz.title, Quiz.description, scores.c.score)\
+            .join(scores, scores.c.quiz_id == Quiz.id)
+        cursor_key = f"completed:{score}"
+    else:
+        # SELECT q.* FROM quiz q
+        # WHERE NOT EXISTS (SELECT 1 FROM quiz_record r WHERE r.quiz_id = q.id AND r.user_id = :user_id)
+        attempted = exists().where(QuizRecord.quiz_id == Quiz.id, QuizRecord.user_id == user_id)
+        query = db.query(Quiz.id, Quiz.title, Quiz.description, literal(None).label("score"))\
+            .filter(~attempted)
+        cursor_key = "not_completed"
+
+    after = decode_cursor(cursor, cursor_key, "asc") if cursor else None
+    query = apply_keyset(query, Quiz.id, Quiz.id, "asc", after)
+    if after is None:
+        query = query.offset((page - 1) * page_size)
+    rows = query.limit(page_size).all()
+
+    next_cursor = None
+    if len(rows) == page_size:
+        next_cursor = encode_cursor(cursor_key, "asc", rows[-1].id, rows[-1].id)
+
+    # 응시 안 한 시험 목록이면 score=None
+    result = [
+        UserQuizListResponse(id=row.id, title=row.title, description=row.description, score=row.score)
+        for row in rows
+    ]
+    return result, next_cursor
+
+
+def iter_quiz_results(
+    db: Session,
+    quiz_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    batch_size: int = 5000
+) -> Iterator[list]:
+    """
+    응시 기록 & 답안을 batch_size 행 단위로 순회 (내보내기용)
+    yield_per로 서버 사이드 커서를 사용하므로 전체 결과를 메모리에 올리지 않음
+    답안이 없는 응시 기록도 answer 관련 컬럼이 NULL인 행으로 포함
+    """
+    stmt = (
+        select(
+            QuizRecord.id.label("record_id"),
+            QuizRecord.quiz_id,
+            QuizRecord.user_id,
+            QuizRecord.score,
+            QuizRecord.created_at.label("attempted_at"),
+            Answer.id.label("answer_id"),
+            Answer.question_id,
+            Answer.choice_id,
+            Choice.is_correct,
+            Answer.created_at.label("answered_at"),
+        )
+        .select_from(QuizRecord)
+        .outerjoin(Answer, Answer.quiz_record_id == QuizRecord.id)
+        .outerjoin(Choice, Choice.id == Answer.choice_id)
+        .order_by(QuizRecord.id, Answer.id)
+    )
+    if quiz_id is not None:
+        stmt = stmt.where(QuizRecord.quiz_id == quiz_id)
+    if start is not None:
+        stmt = stmt.where(QuizRecord.created_at >= start)
+    if end is not None:
+        stmt = stmt.where(QuizRecord.created_at < end)
+
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield partition
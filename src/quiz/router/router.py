@@ -1,26 +1,36 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from common.db.database import get_db
+from common.db.database import DBSession, get_session, run_db
 from common.middleware.auth import get_current_user
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from src.quiz.schema.schema import (QuestionCreate, QuizCreate,
+from common.middleware.metrics import MetricsRoute
+from common.response import fast_json
+from fastapi import APIRouter, Depends, Query, Request, Response
+from src.quiz.schema.schema import (CacheStatsResponse, PublishQuizResponse,
+                                    QuestionCreate, QuizCreate,
                                     QuizDetailRequest, QuizDetailResponse,
-                                    QuizListRequest, QuizListResponse,
-                                    QuizResponse, UpdateQuizSettingsRequest)
+                                    QuizImportResponse, QuizListRequest,
+                                    QuizListResponse, QuizResponse,
+                                    QuizStatsResponse,
+                                    UpdateQuizSettingsRequest)
+from src.quiz.service.export_service import export_results_service
+from src.quiz.service.import_service import import_questions_service
 from src.quiz.service.service import (add_questions_service,
                                       create_quiz_service,
+                                      get_cache_stats_service,
                                       get_quiz_detail_service,
                                       get_quiz_list_service,
+                                      get_quiz_stats_service,
+                                      publish_quiz_service,
                                       update_quiz_settings_service)
 from src.user.model import User
 
-router = APIRouter()
+router = APIRouter(route_class=MetricsRoute)
 
 @router.post("/create", response_model=QuizResponse)
-def create_quiz(
+async def create_quiz(
     quiz_data: QuizCreate,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -29,13 +39,13 @@ def create_quiz(
     - 제목, 설명을 포함한 퀴즈를 생성  
     - 문제는 생성 후 별도로 추가 가능  
     """
-    return create_quiz_service(db, quiz_data, current_user)
+    return await run_db(db, create_quiz_service, quiz_data, current_user)
 
 @router.put("/{quiz_id}/questions")
-def add_questions(
+async def add_questions(
     quiz_id: int,
     questions: list[QuestionCreate],
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -43,28 +53,120 @@ def add_questions(
     - **관리자만 호출 가능**  
     - 최소 2개 이상의 선택지를 가진 객관식 문제만 추가 가능  
     - 각 문제는 반드시 정답 1개 포함  
+    - 게시된 퀴즈에는 추가할 수 없음 (409)  
     """
-    return add_questions_service(db, quiz_id, questions, current_user)
+    return await run_db(db, add_questions_service, quiz_id, questions, current_user)
+
+@router.post("/{quiz_id}/publish", response_model=PublishQuizResponse)
+async def publish_quiz(
+    quiz_id: int,
+    db: DBSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **퀴즈 게시 API**  
+    - **관리자만 호출 가능**  
+    - 문제/선택지를 불변 스냅샷으로 저장하며, 이후 사용자 조회 & 채점은 스냅샷만 사용  
+    - 게시 후에는 문제 추가/일괄 등록/설정 변경 불가 (409)  
+    """
+    return await run_db(db, publish_quiz_service, quiz_id, current_user)
+
+@router.post(
+    "/{quiz_id}/import",
+    response_model=QuizImportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_questions(
+    quiz_id: int,
+    request: Request,
+    format: str = Query("jsonl", alias="format"),
+    db: DBSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **문제 일괄 등록 API**  
+    - **관리자만 호출 가능**  
+    - 요청 본문을 스트리밍으로 읽어 청크 단위로 검증 & 다중 행 INSERT (청크마다 커밋)  
+    - `format=jsonl`: 한 줄에 `{"question_text": ..., "choices": [{"choice_text": ..., "is_correct": ...}]}`  
+    - `format=csv`: 헤더 `question_text,choices,correct` (선택지와 정답 번호(1부터)는 `|`로 구분)  
+    - 등록/실패 건수와 실패한 행 번호 및 사유 반환  
+    """
+    return await import_questions_service(db, quiz_id, format, request.stream(), current_user)
 
 @router.get("/list", response_model=List[QuizListResponse])
-def get_quiz_list(
+async def get_quiz_list(
+    response: Response,
     request: QuizListRequest = Depends(QuizListRequest.as_query), 
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     **관리자용 퀴즈 목록 조회 API**  
     - **관리자만 호출 가능**  
     - 전체 퀴즈 목록을 조회 (페이징 처리)  
-    - 정렬 기준 및 정렬 방식 지정 가능  
+    - 정렬 기준(`id`, `title`, `created_at`, `updated_at`) 및 정렬 방식 지정 가능  
+    - 다음 페이지 커서는 `X-Next-Cursor` 헤더로 제공되며, `cursor`로 넘기면 keyset 방식으로 이어서 조회  
+    """
+    quizzes, next_cursor = await run_db(db, get_quiz_list_service, request, current_user)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return quizzes
+
+@router.get("/cache/stats", response_model=List[CacheStatsResponse])
+async def get_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **캐시 상태 조회 API**  
+    - **관리자만 호출 가능**  
+    - 현재 워커 프로세스의 정답표 캐시 hit/miss/eviction 카운터 조회  
+    """
+    return get_cache_stats_service(current_user)
+
+@router.get("/results/export")
+async def export_results(
+    format: str = Query("csv", alias="format"),
+    quiz_id: Optional[int] = Query(None, alias="quiz_id"),
+    start: Optional[datetime] = Query(None, alias="start"),
+    end: Optional[datetime] = Query(None, alias="end"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **응시 결과 내보내기 API**  
+    - **관리자만 호출 가능**  
+    - 응시 기록(quiz_record)과 제출 답안(answer)을 한 행씩 스트리밍 (`format=csv|ndjson|parquet`)  
+    - `quiz_id`로 특정 퀴즈, `start`/`end`로 응시 시작 시각 범위 지정 가능  
+    - 서버 사이드 커서로 읽으므로 데이터 양과 무관하게 메모리 사용량 일정  
+    """
+    return export_results_service(format, quiz_id, start, end, current_user)
+
+@router.get("/{quiz_id}/stats", response_model=QuizStatsResponse)
+async def get_quiz_stats(
+    quiz_id: int,
+    db: DBSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **퀴즈 통계 조회 API**  
+    - **관리자만 호출 가능**  
+    - 평균 점수, 점수 분포(10점 단위), 문제별 정답률, 선택지별 선택률  
+    - 답안 제출 시 증분 갱신되는 집계 테이블에서 조회  
     """
-    return get_quiz_list_service(db, request.page, request.page_size, request.sort_by, request.order, current_user)
+    return await run_db(db, get_quiz_stats_service, quiz_id, current_user)
 
 @router.get("/{quiz_id}", response_model=QuizDetailResponse)
-def get_quiz_detail(
+async def get_quiz_detail(
     quiz_id: int,
     request: QuizDetailRequest = Depends(QuizDetailRequest.as_query), 
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -72,14 +174,15 @@ def get_quiz_detail(
     - **관리자만 호출 가능**  
     - 특정 퀴즈의 문제 및 선택지 목록 조회  
     - 문제/선택지 순서는 관리자가 설정한 방식대로 정렬됨  
+    - 응답의 `next_cursor`를 `cursor`로 넘기면 keyset 방식으로 이어서 조회  
     """
-    return get_quiz_detail_service(db, quiz_id, request, current_user)
+    return fast_json(await run_db(db, get_quiz_detail_service, quiz_id, request, current_user))
 
 @router.patch("/{quiz_id}/settings", response_model=UpdateQuizSettingsRequest)
-def update_quiz_settings_api(
+async def update_quiz_settings_api(
     quiz_id: int,
     settings: UpdateQuizSettingsRequest,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -87,4 +190,4 @@ def update_quiz_settings_api(
     - **관리자만 호출 가능**  
     - 문제 랜덤 배치 여부, 선택지 랜덤 배치 여부, 한 페이지당 문제 개수 설정 가능  
     """
-    return update_quiz_settings_service(db, quiz_id, settings, current_user)
+    return await run_db(db, update_quiz_settings_service, quiz_id, settings, current_user)
@@ -1,10 +1,16 @@
-from typing import List
+from typing import List, Optional
 
-from common.db.database import get_db
+from common.db.database import DBSession, get_session, run_db
 from common.middleware.auth import get_current_user
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from common.middleware.metrics import MetricsRoute
+from common.response import fast_json
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import JSONResponse
+from src.quiz.repository.idempotency import StoredResponse
 from src.quiz.schema.user_schema import (QuizRecordResponse,
+                                         SaveProgressRequest,
+                                         SaveProgressResponse,
+                                         SubmissionAcceptedResponse,
                                          SubmitAnswersRequest,
                                          SubmitAnswersResponse,
                                          UserQuizDetailResponse,
@@ -12,32 +18,55 @@ from src.quiz.schema.user_schema import (QuizRecordResponse,
 from src.quiz.service.user_service import (get_quiz_record_service,
                                            get_user_quiz_detail_service,
                                            get_user_quiz_list_service,
+                                           save_progress_service,
                                            start_quiz_record_service,
                                            submit_answers_service)
 from src.user.model import User
 
-router = APIRouter()
+router = APIRouter(route_class=MetricsRoute)
+
+
+def replay_response(stored: StoredResponse) -> JSONResponse:
+    """같은 Idempotency-Key로 처리된 최초 응답 재전송"""
+    headers = {"Idempotent-Replayed": "true"}
+    if stored.status_code == 202:
+        headers["Location"] = stored.body["status_url"]
+    return JSONResponse(status_code=stored.status_code, content=stored.body, headers=headers)
 
 
 @router.get("/list", response_model=List[UserQuizListResponse])
-def get_user_quiz_list_api(
+async def get_user_quiz_list_api(
+    response: Response,
     completed: bool = Query(False, alias="completed"),
-    db: Session = Depends(get_db),
+    page: int = Query(1, alias="page"),
+    page_size: int = Query(10, alias="page_size"),
+    cursor: Optional[str] = Query(None, alias="cursor"),
+    score: str = Query("best", alias="score"),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     **사용자용 퀴즈 목록 조회 API**  
-    - `completed=true`  → '응시한 시험' 목록 조회  
+    - `completed=true`  → '응시한 시험' 목록 조회 (퀴즈당 1행, `score=best|latest`로 최고/최근 점수 선택)  
     - `completed=false` → '응시하지 않은 시험' 목록 조회  
-    - 응시 여부에 따라 필터링된 퀴즈 리스트 제공  
+    - 응시 여부에 따라 필터링된 퀴즈 리스트 제공 (퀴즈 id 순 페이징)  
+    - 다음 페이지 커서는 `X-Next-Cursor` 헤더로 제공되며, `cursor`로 넘기면 keyset 방식으로 이어서 조회  
     """
-    return get_user_quiz_list_service(db, completed, current_user)
+    quizzes, next_cursor = await run_db(
+        db, get_user_quiz_list_service, completed, page, page_size, cursor, score, current_user
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return quizzes
     
 @router.get("/{quiz_id}", response_model=UserQuizDetailResponse)
-def get_user_quiz_detail(
+async def get_user_quiz_detail(
     quiz_id: int,
     page: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    attempt_id: Optional[int] = Query(None, alias="attempt_id"),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -45,47 +74,97 @@ def get_user_quiz_detail(
     - **응시할 시험의 문제 및 선택지 제공**  
     - **정답 정보는 포함되지 않음**  
     - 관리자가 설정한 랜덤 배치에 따라 문제/선택지 순서가 변경될 수 있음  
+    - `attempt_id`를 주면 응시 기록별로 고정된 순서 제공 (새로고침해도 순서 유지)  
+    - 랜덤 배치가 없거나 `attempt_id`가 주어지면 `ETag`를 내려주며, `If-None-Match`가 일치하면 304 응답  
     """
-    return get_user_quiz_detail_service(db, quiz_id, page, current_user)
+    detail, etag = await run_db(
+        db, get_user_quiz_detail_service, quiz_id, page, current_user, request.headers.get("if-none-match"), attempt_id
+    )
+    headers = None
+    if etag:
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if detail is None:
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+    if isinstance(detail, bytes):
+        # 게시된 퀴즈: 스냅샷에서 만든 본문 그대로 전송
+        return Response(content=detail, media_type="application/json", headers=headers)
+    return fast_json(detail, headers)
 
 @router.post("/{quiz_id}/attempt", response_model=QuizRecordResponse)
-def start_quiz_record(
+async def start_quiz_record(
     quiz_id: int,
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     **퀴즈 응시 시작 API**  
     - **사용자가 퀴즈를 응시 시작하면 새로운 응시 기록(quiz_record) 생성**  
     - 퀴즈를 시작해야 답안을 제출할 수 있음  
+    - `Idempotency-Key` 헤더를 보내면 같은 키로 재시도해도 응시 기록은 한 번만 생성되고 최초 응답을 반환  
+    """
+    result = await run_db(db, start_quiz_record_service, quiz_id, current_user, idempotency_key)
+    if isinstance(result, StoredResponse):
+        return replay_response(result)
+    return result
+
+@router.put("/{quiz_id}/attempt/{attempt_id}/progress", response_model=SaveProgressResponse, status_code=202)
+async def save_quiz_progress(
+    quiz_id: int,
+    attempt_id: int,
+    request: SaveProgressRequest,
+    db: DBSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    **응시 중 답안 임시 저장 API**  
+    - 페이지 단위로 일부 답안을 보내면 검증 후 접수 (같은 문제는 마지막 답안으로 덮어씀)  
+    - 답안은 서버 버퍼에 모였다가 주기적으로 묶어서 저장되며, 최종 제출 시 남은 답안과 함께 채점됨  
     """
-    return start_quiz_record_service(db, quiz_id, current_user)
+    return await run_db(db, save_progress_service, quiz_id, attempt_id, request, current_user)
 
-@router.post("/{quiz_id}/attempt/{attempt_id}/submit", response_model=SubmitAnswersResponse)
-def submit_quiz_answers(
+@router.post(
+    "/{quiz_id}/attempt/{attempt_id}/submit",
+    response_model=SubmitAnswersResponse,
+    responses={202: {"model": SubmissionAcceptedResponse, "description": "대기열 채점 모드: 제출 접수"}},
+)
+async def submit_quiz_answers(
     quiz_id: int,
     attempt_id: int,
     request: SubmitAnswersRequest,
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     **퀴즈 답안 제출 API**  
     - 사용자가 답안을 제출하면 즉시 자동 채점됨  
+    - 임시 저장한 답안과 제출한 답안을 합쳐 채점 (같은 문제는 제출한 답안 우선)  
     - 점수는 `(정답 개수 / 전체 문제 수) * 100` 방식으로 계산됨  
     - 응시 기록(quiz_record)에 점수가 저장됨  
+    - 대기열 채점 모드(`SUBMIT_MODE=queue`)면 202 + `Location`(채점 상태 조회 경로) 응답  
+    - `Idempotency-Key` 헤더를 보내면 같은 키로 재시도해도 한 번만 채점되고 최초 응답을 반환  
     """
-    return submit_answers_service(db, quiz_id, attempt_id, request, current_user)
+    result = await run_db(
+        db, submit_answers_service, quiz_id, attempt_id, request, current_user, idempotency_key
+    )
+    if isinstance(result, StoredResponse):
+        return replay_response(result)
+    if isinstance(result, SubmissionAcceptedResponse):
+        return JSONResponse(status_code=202, content=result.dict(), headers={"Location": result.status_url})
+    return result
 
 @router.get("/attempt/{attempt_id}", response_model=QuizRecordResponse)
-def get_quiz_record(
+async def get_quiz_record(
     attempt_id: int,
-    db: Session = Depends(get_db),
+    db: DBSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     **퀴즈 응시 기록 조회 API**  
     - **사용자 본인의 응시 기록만 조회 가능**  
     - 응시한 퀴즈의 점수 및 제출한 답안 정보를 확인 가능  
+    - 대기열 채점 모드로 제출했다면 `grading_status`로 채점 상태(pending / graded / failed) 확인  
     """
-    return get_quiz_record_service(db, attempt_id, current_user)
+    return await run_db(db, get_quiz_record_service, attempt_id, current_user)
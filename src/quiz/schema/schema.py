@@ -44,6 +44,7 @@ class QuizListRequest(BaseModel):
     page_size: int = 10
     sort_by: str = "created_at"
     order: str = "desc"
+    cursor: Optional[str] = None  # 주어지면 page 대신 keyset 페이지네이션
     
     @classmethod
     def as_query(
@@ -52,9 +53,10 @@ class QuizListRequest(BaseModel):
         page_size: int = Query(10, alias="page_size"),
         sort_by: str = Query("created_at", alias="sort_by"),
         order: str = Query("desc", alias="order"),
+        cursor: Optional[str] = Query(None, alias="cursor"),
     ):
         """Query Parameters를 Pydantic 모델로 변환하는 헬퍼 메서드"""
-        return cls(page=page, page_size=page_size, sort_by=sort_by, order=order)
+        return cls(page=page, page_size=page_size, sort_by=sort_by, order=order, cursor=cursor)
 
 class QuizListResponse(BaseModel):
     id: int
@@ -73,6 +75,7 @@ class QuizDetailRequest(BaseModel):
     page_size: int = 10
     sort_by: str = "created_at"
     order: str = "desc"
+    cursor: Optional[str] = None  # 주어지면 page 대신 keyset 페이지네이션
 
     @classmethod
     def as_query(
@@ -81,8 +84,9 @@ class QuizDetailRequest(BaseModel):
         page_size: int = Query(10, alias="page_size"),
         sort_by: str = Query("created_at", alias="sort_by"),
         order: str = Query("desc", alias="order"),
+        cursor: Optional[str] = Query(None, alias="cursor"),
     ):
-        return cls(page=page, page_size=page_size, sort_by=sort_by, order=order)
+        return cls(page=page, page_size=page_size, sort_by=sort_by, order=order, cursor=cursor)
 
 class ChoiceResponse(BaseModel):
     """선택지 응답"""
@@ -113,6 +117,7 @@ class QuizDetailResponse(BaseModel):
     updated_at: datetime
     total_questions: int
     questions: List[QuestionResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
     class Config:
         orm_mode = True
@@ -135,3 +140,64 @@ class UpdateQuizSettingsResponse(BaseModel):
     class Config:
         orm_mode = True
         from_attributes=True
+
+class CacheStatsResponse(BaseModel):
+    """캐시 상태 (로컬 LRU의 hit/miss/eviction 카운터 & 공유 저장소 hit 수)"""
+    name: str
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    backend: str
+    shared_hits: int
+
+class PublishQuizResponse(BaseModel):
+    """퀴즈 게시 결과 (스냅샷 정보)"""
+    quiz_id: int
+    version: int
+    total_questions: int
+    total_pages: int
+    snapshot_bytes: int  # 직렬화된 문제/선택지 크기 (정답표 제외)
+    published_at: datetime
+
+class QuizImportError(BaseModel):
+    """문제 일괄 등록 중 실패한 행"""
+    line: int
+    error: str
+
+class QuizImportResponse(BaseModel):
+    """문제 일괄 등록 결과"""
+    quiz_id: int
+    imported: int
+    failed: int
+    chunks: int
+    errors: List[QuizImportError]  # 최대 IMPORT_MAX_ERRORS개까지 보고
+
+class ScoreBucketResponse(BaseModel):
+    """점수 분포 구간"""
+    min_score: int
+    max_score: int
+    count: int
+
+class ChoiceStatsResponse(BaseModel):
+    """선택지별 선택 통계"""
+    choice_id: int
+    picks: int
+    pick_rate: float  # 해당 문제 응답 중 이 선택지를 고른 비율
+
+class QuestionStatsResponse(BaseModel):
+    """문제별 정답률 통계"""
+    question_id: int
+    answered: int
+    correct: int
+    correct_rate: float
+    choices: List[ChoiceStatsResponse]
+
+class QuizStatsResponse(BaseModel):
+    """퀴즈 통계 (평균 점수, 점수 분포, 문제별 정답률, 선택지별 선택률)"""
+    quiz_id: int
+    attempts: int
+    average_score: float
+    score_distribution: List[ScoreBucketResponse]
+    questions: List[QuestionStatsResponse]
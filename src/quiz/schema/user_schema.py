@@ -37,6 +37,8 @@ class QuizRecordResponse(BaseModel):
     quiz_id: int
     user_id: int
     score: int
+    status: str = "started"  # started / submitted
+    grading_status: Optional[str] = None  # 대기열 채점 상태 (pending / graded / failed), 즉시 채점이면 None
 
     class Config:
         orm_mode = True
@@ -48,6 +50,23 @@ class AnswerSubmit(BaseModel):
 class SubmitAnswersRequest(BaseModel):
     answers: List[AnswerSubmit]
 
+class SubmissionAcceptedResponse(BaseModel):
+    """대기열 채점 모드(SUBMIT_MODE=queue)의 제출 접수 응답 (202)"""
+    id: int
+    quiz_id: int
+    user_id: int
+    grading_status: str
+    status_url: str  # 채점 상태/점수 조회 경로
+
+class SaveProgressRequest(BaseModel):
+    """응시 중 답안 임시 저장 요청 (한 페이지 분량의 일부 답안)"""
+    answers: List[AnswerSubmit]
+
+class SaveProgressResponse(BaseModel):
+    id: int
+    quiz_id: int
+    saved: int  # 접수된 답안 수 (문제당 마지막 값만 유지)
+
 class SubmitAnswersResponse(BaseModel):
     id: int
     quiz_id: int
@@ -0,0 +1,155 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Iterator, Optional
+
+from common.db.database import SessionLocal
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from src.quiz.repository.user_repository import iter_quiz_results
+from src.user.model import User
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "5000"))
+EXPORT_COLUMNS = (
+    "record_id", "quiz_id", "user_id", "score", "attempted_at",
+    "answer_id", "question_id", "choice_id", "is_correct", "answered_at",
+)
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _encode_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv_batches(batches: Iterator[list]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerows([_encode_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+def _ndjson_batches(batches: Iterator[list]) -> Iterator[bytes]:
+    for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, map(_encode_value, row))), ensure_ascii=False) + "\n"
+            for row in rows
+        ).encode()
+
+
+class _ChunkSink:
+    """pyarrow가 쓰는 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_batches(batches: Iterator[list]) -> Iterator[bytes]:
+    """배치마다 row group 하나씩 기록하며 바로 내보냄 (footer는 마지막에)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("record_id", pa.int64()), ("quiz_id", pa.int64()), ("user_id", pa.int64()),
+        ("score", pa.int64()), ("attempted_at", pa.timestamp("us")),
+        ("answer_id", pa.int64()), ("question_id", pa.int64()), ("choice_id", pa.int64()),
+        ("is_correct", pa.bool_()), ("answered_at", pa.timestamp("us")),
+    ])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for rows in batches:
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema
+            ))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def iter_export(
+    fmt: str,
+    quiz_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """
+    응시 기록 & 답안을 지정한 형식의 바이트 청크로 스트리밍
+    응답 스트리밍 동안 유지돼야 하므로 요청 의존성 세션이 아닌 별도 세션 사용
+    """
+    db = SessionLocal()
+    try:
+        batches = iter_quiz_results(db, quiz_id, start, end, batch_size)
+        if fmt == "csv":
+            yield from _csv_batches(batches)
+        elif fmt == "ndjson":
+            yield from _ndjson_batches(batches)
+        else:
+            yield from _parquet_batches(batches)
+    finally:
+        db.close()
+
+
+def check_export_format(fmt: str) -> None:
+    if fmt not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {fmt}")
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=400, detail="parquet 내보내기에는 pyarrow 설치가 필요합니다.")
+
+
+def export_results_service(
+    fmt: str,
+    quiz_id: Optional[int],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    current_user: User
+) -> StreamingResponse:
+    """관리자만 응시 결과 내보내기 가능"""
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=403, detail="관리자만 응시 결과를 내보낼 수 있습니다.")
+    check_export_format(fmt)
+
+    filename = f"quiz_{quiz_id}_results.{fmt}" if quiz_id is not None else f"quiz_results.{fmt}"
+    return StreamingResponse(
+        iter_export(fmt, quiz_id, start, end),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,191 @@
+import csv
+import json
+import logging
+import os
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+
+from common.db.database import DBSession, run_db
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from src.quiz.repository.repository import (add_questions_to_quiz,
+                                            get_quiz_by_id)
+from src.quiz.repository.snapshot import check_not_published
+from src.quiz.schema.schema import (ChoiceCreate, QuestionCreate,
+                                    QuizImportError, QuizImportResponse)
+from src.user.model import User
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))
+IMPORT_FORMATS = ("jsonl", "csv")
+
+
+def parse_jsonl_line(line: str) -> QuestionCreate:
+    """JSONL 한 줄: {"question_text": ..., "choices": [{"choice_text": ..., "is_correct": ...}]}"""
+    return QuestionCreate(**json.loads(line))
+
+
+def parse_csv_row(row: dict) -> QuestionCreate:
+    """
+    CSV 한 행: question_text, choices, correct
+    - choices: 선택지를 `|`로 구분
+    - correct: 정답 선택지 번호(1부터)를 `|`로 구분
+    """
+    choice_texts = (row.get("choices") or "").split("|")
+    correct = {int(index) for index in (row.get("correct") or "").split("|") if index.strip()}
+    if any(index < 1 or index > len(choice_texts) for index in correct):
+        raise ValueError("정답 번호가 선택지 범위를 벗어났습니다.")
+    return QuestionCreate(
+        question_text=row.get("question_text") or "",
+        choices=[
+            ChoiceCreate(choice_text=text, is_correct=(i + 1) in correct)
+            for i, text in enumerate(choice_texts)
+        ],
+    )
+
+
+class QuestionImporter:
+    """
+    JSONL/CSV 문제 은행을 청크 단위로 검증 & 다중 행 INSERT
+    입력 전체를 메모리에 올리지 않고 청크(줄 목록)를 하나씩 처리하며 진행 상황을 누적
+    """
+
+    def __init__(self, quiz_id: int, fmt: str):
+        if fmt not in IMPORT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {fmt}")
+        self.quiz_id = quiz_id
+        self.fmt = fmt
+        self.fieldnames: Optional[List[str]] = None
+        self.line_no = 0
+        self.imported = 0
+        self.failed = 0
+        self.chunks = 0
+        self.errors: List[QuizImportError] = []
+
+    def _add_error(self, line_no: int, error: Exception) -> None:
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append(QuizImportError(line=line_no, error=str(error)))
+
+    def _parse(self, lines: List[str]) -> List[QuestionCreate]:
+        valid = []
+        for line in lines:
+            self.line_no += 1
+            if self.line_no == 1:
+                line = line.lstrip("\ufeff")
+            if not is_valid_utf8(line):
+                self._add_error(self.line_no, ValueError("UTF-8로 읽을 수 없는 줄입니다."))
+                continue
+            if not line.strip():
+                continue
+            if self.fmt == "csv" and self.fieldnames is None:
+                self.fieldnames = next(csv.reader([line]))
+                continue
+            try:
+                if self.fmt == "jsonl":
+                    question = parse_jsonl_line(line)
+                else:
+                    question = parse_csv_row(dict(zip(self.fieldnames, next(csv.reader([line])))))
+                # QuestionCreate의 선택지 규칙 (2개 이상 & 정답 1개 이상) 재사용
+                QuestionCreate.validate_choices({"choices": question.choices})
+            except (ValueError, TypeError, KeyError) as e:
+                self._add_error(self.line_no, e)
+                continue
+            valid.append(question)
+        return valid
+
+    def process_chunk(self, db: Session, lines: List[str]) -> dict:
+        """청크 하나 검증 후 등록 (청크마다 커밋)"""
+        valid = self._parse(lines)
+        if valid:
+            add_questions_to_quiz(db, self.quiz_id, valid)
+            self.imported += len(valid)
+        self.chunks += 1
+        progress = {"chunk": self.chunks, "lines": self.line_no, "imported": self.imported, "failed": self.failed}
+        logger.info("quiz %s import progress: %s", self.quiz_id, progress)
+        return progress
+
+    def result(self) -> QuizImportResponse:
+        return QuizImportResponse(
+            quiz_id=self.quiz_id,
+            imported=self.imported,
+            failed=self.failed,
+            chunks=self.chunks,
+            errors=self.errors,
+        )
+
+
+def iter_line_chunks(lines: Iterable[str], chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[List[str]]:
+    """줄 스트림 -> chunk_size 줄씩 묶음"""
+    chunk = []
+    for line in lines:
+        chunk.append(line.rstrip("\r\n"))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def is_valid_utf8(line: str) -> bool:
+    """surrogateescape로 디코딩한 줄에 UTF-8이 아닌 바이트가 있었는지 확인"""
+    try:
+        line.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+async def aiter_line_chunks(stream: AsyncIterator[bytes], chunk_size: int = IMPORT_CHUNK_SIZE) -> AsyncIterator[List[str]]:
+    """
+    HTTP 요청 본문 바이트 스트림 -> chunk_size 줄씩 묶음
+    UTF-8이 아닌 줄도 surrogateescape로 그대로 넘겨 해당 줄만 오류로 처리 (전체 요청을 500으로 실패시키지 않음)
+    """
+    buffer = b""
+    chunk = []
+    async for data in stream:
+        buffer += data
+        *complete, buffer = buffer.split(b"\n")
+        for raw in complete:
+            chunk.append(raw.decode("utf-8", "surrogateescape").rstrip("\r"))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if buffer:
+        chunk.append(buffer.decode("utf-8", "surrogateescape").rstrip("\r"))
+    if chunk:
+        yield chunk
+
+
+def _check_quiz(db: Session, quiz_id: int) -> None:
+    quiz = get_quiz_by_id(db, quiz_id)
+    if not quiz:
+        raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+    # 본문을 읽기 전에 게시 여부 확인 (청크마다 add_questions_to_quiz에서도 다시 확인)
+    check_not_published(quiz)
+
+
+async def import_questions_service(
+    db: DBSession, quiz_id: int, fmt: str, stream: AsyncIterator[bytes], current_user: User
+) -> QuizImportResponse:
+    """관리자만 문제 일괄 등록 가능 (요청 본문을 스트리밍으로 청크 단위 처리)"""
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=403, detail="관리자만 문제를 등록할 수 있습니다.")
+
+    importer = QuestionImporter(quiz_id, fmt)
+    await run_db(db, _check_quiz, quiz_id)
+    async for lines in aiter_line_chunks(stream):
+        await run_db(db, importer.process_chunk, lines)
+    return importer.result()
+
+
+def import_questions_from_file(db: Session, quiz_id: int, fmt: str, lines: Iterable[str], progress=None) -> QuizImportResponse:
+    """CLI용 동기 일괄 등록 (progress 콜백으로 청크별 진행 상황 전달)"""
+    importer = QuestionImporter(quiz_id, fmt)
+    _check_quiz(db, quiz_id)
+    for chunk in iter_line_chunks(lines):
+        status = importer.process_chunk(db, chunk)
+        if progress:
+            progress(status)
+    return importer.result()
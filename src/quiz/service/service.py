@@ -1,11 +1,16 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from src.quiz.repository.cache import get_cache_stats
 from src.quiz.repository.repository import (add_questions_to_quiz, create_quiz,
                                             get_quiz_by_id, get_quiz_detail,
                                             get_quiz_list)
+from src.quiz.repository.snapshot import publish_quiz
+from src.quiz.repository.stats_repository import get_quiz_stats
 from src.quiz.repository.user_repository import update_quiz_settings
-from src.quiz.schema.schema import (QuestionCreate, QuizCreate,
-                                    QuizDetailRequest, QuizResponse,
+from src.quiz.schema.schema import (CacheStatsResponse, PublishQuizResponse,
+                                    QuestionCreate, QuizCreate,
+                                    QuizDetailRequest, QuizListRequest,
+                                    QuizResponse, QuizStatsResponse,
                                     UpdateQuizSettingsRequest,
                                     UpdateQuizSettingsResponse)
 from src.user.model import User
@@ -32,12 +37,36 @@ def add_questions_service(db: Session, quiz_id: int, questions: list[QuestionCre
     return add_questions_to_quiz(db, quiz_id, questions)
 
 
-def get_quiz_list_service(db: Session, page: int, page_size: int, sort_by: str, order: str, current_user: User):
-    """관리자만 전체 퀴즈 목록 조회 가능"""
+def publish_quiz_service(db: Session, quiz_id: int, current_user: User) -> PublishQuizResponse:
+    """관리자만 퀴즈 게시 가능 (게시 후 문제 추가/설정 변경 불가)"""
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=403, detail="관리자만 퀴즈를 게시할 수 있습니다.")
+
+    snapshot, published_at = publish_quiz(db, quiz_id)
+    total_questions = len(snapshot.offsets) - 1
+    return PublishQuizResponse(
+        quiz_id=snapshot.quiz_id,
+        version=snapshot.version,
+        total_questions=total_questions,
+        total_pages=(total_questions + snapshot.questions_per_page - 1) // snapshot.questions_per_page,
+        snapshot_bytes=len(snapshot.content),
+        published_at=published_at,
+    )
+
+
+def get_quiz_list_service(db: Session, request: QuizListRequest, current_user: User):
+    """관리자만 전체 퀴즈 목록 조회 가능. (목록, 다음 페이지 커서) 반환"""
     if not current_user["is_admin"]:
         raise HTTPException(status_code=403, detail="관리자만 퀴즈 목록을 조회할 수 있습니다.")
 
-    return get_quiz_list(db, page, page_size, sort_by, order)
+    return get_quiz_list(
+        db,
+        request.page,
+        request.page_size,
+        request.sort_by,
+        request.order,
+        request.cursor
+    )
 
 def get_quiz_detail_service(db: Session, quiz_id: int, request: QuizDetailRequest, current_user: User):
     """관리자만 퀴즈 상세 조회 가능"""
@@ -50,7 +79,8 @@ def get_quiz_detail_service(db: Session, quiz_id: int, request: QuizDetailReques
         request.page,
         request.page_size,
         request.sort_by,
-        request.order
+        request.order,
+        request.cursor
     )
 
 def update_quiz_settings_service(
@@ -61,3 +91,17 @@ def update_quiz_settings_service(
         raise HTTPException(status_code=403, detail="관리자만 설정을 변경할 수 있습니다.")
 
     return update_quiz_settings(db, quiz_id, settings)
+
+def get_cache_stats_service(current_user: User) -> list[CacheStatsResponse]:
+    """관리자만 캐시 상태 조회 가능"""
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=403, detail="관리자만 캐시 상태를 조회할 수 있습니다.")
+
+    return [CacheStatsResponse(**stats) for stats in get_cache_stats()]
+
+def get_quiz_stats_service(db: Session, quiz_id: int, current_user: User) -> QuizStatsResponse:
+    """관리자만 퀴즈 통계 조회 가능"""
+    if not current_user["is_admin"]:
+        raise HTTPException(status_code=403, detail="관리자만 퀴즈 통계를 조회할 수 있습니다.")
+
+    return get_quiz_stats(db, quiz_id)
@@ -1,14 +1,33 @@
-from typing import List
+from typing import List, Optional, Tuple, Union
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from src.quiz.model.quiz import Quiz
+from src.quiz.repository.answer_buffer import answer_flusher
+from src.quiz.repository.idempotency import (StoredResponse, check_key,
+                                             get_stored_response,
+                                             request_fingerprint,
+                                             save_response, store_response)
+from src.quiz.repository.snapshot import PublishedQuiz, get_quiz_for_read
+from src.quiz.repository.submission_queue import (SUBMIT_MODE,
+                                                  enqueue_submission,
+                                                  get_submission_status,
+                                                  notify_workers)
 from src.quiz.repository.user_repository import (create_quiz_record,
+                                                 create_quiz_record_once,
+                                                 get_answer_key,
+                                                 get_quiz_page_etag,
                                                  get_quiz_record_by_id,
+                                                 get_user_quiz_attempt_detail,
                                                  get_user_quiz_detail,
                                                  get_user_quiz_list,
-                                                 submit_answers)
+                                                 grade_answers, mark_submitted,
+                                                 save_progress,
+                                                 validate_answers)
 from src.quiz.schema.user_schema import (QuizRecordResponse,
+                                         SaveProgressRequest,
+                                         SaveProgressResponse,
+                                         SubmissionAcceptedResponse,
                                          SubmitAnswersRequest,
                                          SubmitAnswersResponse,
                                          UserQuizListResponse)
@@ -18,50 +37,196 @@ from src.user.model import User
 def get_user_quiz_list_service(
     db: Session,
     completed: bool,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    score: str,
     current_user: User
-) -> List[UserQuizListResponse]:
-    return get_user_quiz_list(db, current_user["user_id"], completed)
+) -> Tuple[List[UserQuizListResponse], Optional[str]]:
+    """사용자 퀴즈 목록 조회. (목록, 다음 페이지 커서) 반환"""
+    if score not in ("best", "latest"):
+        raise HTTPException(status_code=400, detail="score는 best 또는 latest만 가능합니다.")
+    return get_user_quiz_list(db, current_user["user_id"], completed, page, page_size, cursor, score)
 
-def get_user_quiz_detail_service(db: Session, quiz_id: int, page: int, current_user: User):
-    """사용자가 응시할 퀴즈 상세 조회 서비스 계층"""
-    return get_user_quiz_detail(db, quiz_id, page)
+def get_user_quiz_detail_service(
+    db: Session,
+    quiz_id: int,
+    page: int,
+    current_user: User,
+    if_none_match: Optional[str] = None,
+    attempt_id: Optional[int] = None
+) -> Tuple[Union[dict, bytes, None], Optional[str]]:
+    """
+    사용자가 응시할 퀴즈 상세 조회 서비스 계층
+    (응답, ETag) 반환. 클라이언트의 If-None-Match가 ETag와 일치하면 응답은 None (304)
+    게시된 퀴즈면 응답은 스냅샷에서 만든 JSON 본문(bytes)
+    attempt_id가 주어지면 응시별 고정 순서 모드 (이 퀴즈에 대한 본인 응시 기록이어야 함)
+    """
+    quiz = get_quiz_for_read(db, quiz_id)
+    if not quiz:
+        raise HTTPException(status_code=404, detail="해당 퀴즈를 찾을 수 없습니다.")
+
+    if attempt_id is not None:
+        record = get_quiz_record_by_id(db, attempt_id)
+        if not record or record.quiz_id != quiz_id:
+            raise HTTPException(status_code=404, detail="응시 기록을 찾을 수 없습니다.")
+        if record.user_id != current_user["user_id"]:
+            raise HTTPException(status_code=403, detail="본인 응시 기록이 아닙니다.")
 
-def start_quiz_record_service(db: Session, quiz_id: int, current_user: User) -> QuizRecordResponse:
-    """사용자가 퀴즈 응시를 시작"""
+    etag = get_quiz_page_etag(quiz, page, attempt_id)
+    if etag and if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        if etag in candidates or "*" in candidates:
+            return None, etag
+
+    # 게시된 퀴즈는 스냅샷에서 직렬화된 본문을 바로 잘라 씀
+    if isinstance(quiz, PublishedQuiz):
+        return quiz.render_page(page, attempt_id), etag
+    if attempt_id is not None:
+        return get_user_quiz_attempt_detail(db, quiz, page, attempt_id), etag
+    return get_user_quiz_detail(db, quiz, page), etag
+
+def start_quiz_record_service(
+    db: Session,
+    quiz_id: int,
+    current_user: User,
+    idempotency_key: Optional[str] = None
+) -> Union[QuizRecordResponse, StoredResponse]:
+    """
+    사용자가 퀴즈 응시를 시작
+    Idempotency-Key가 주어지면 같은 키로 재시도해도 응시 기록은 한 번만 만들고 최초 응답을 반환
+    """
     quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
     if not quiz:
         raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
 
-    record = create_quiz_record(db, quiz_id, current_user["user_id"])
-    return QuizRecordResponse(
-        id=record.id,
-        quiz_id=record.quiz_id,
-        user_id=record.user_id,
-        score=record.score
+    user_id = current_user["user_id"]
+    if idempotency_key is None:
+        record = create_quiz_record(db, quiz_id, user_id)
+        return QuizRecordResponse(
+            id=record.id,
+            quiz_id=record.quiz_id,
+            user_id=record.user_id,
+            score=record.score,
+            status=record.status
+        )
+
+    check_key(idempotency_key)
+    scope = f"attempt:{quiz_id}"
+    fingerprint = request_fingerprint()
+    row = create_quiz_record_once(db, quiz_id, user_id, scope, idempotency_key, fingerprint)
+    if row is None:
+        db.rollback()
+        stored = get_stored_response(db, user_id, scope, idempotency_key, fingerprint)
+        if stored is None:
+            raise HTTPException(status_code=409, detail="같은 Idempotency-Key의 요청을 처리 중입니다.")
+        return stored
+
+    response = QuizRecordResponse(
+        id=row.id,
+        quiz_id=row.quiz_id,
+        user_id=row.user_id,
+        score=row.score,
+        status=row.status
     )
+    save_response(db, user_id, scope, idempotency_key, 200, response.dict())
+    db.commit()
+    return response
 
-def submit_answers_service(
+def save_progress_service(
     db: Session,
     quiz_id: int,
     record_id: int,
-    answers: SubmitAnswersRequest,
+    answers: SaveProgressRequest,
     current_user: User
-) -> SubmitAnswersResponse:
-    """사용자가 답안을 제출 -> 자동 채점"""
+) -> SaveProgressResponse:
+    """응시 중 답안 임시 저장"""
     record = get_quiz_record_by_id(db, record_id)
     if not record or record.quiz_id != quiz_id:
         raise HTTPException(status_code=404, detail="응시 기록을 찾을 수 없습니다.")
     if record.user_id != current_user["user_id"]:
         raise HTTPException(status_code=403, detail="본인 응시 기록이 아닙니다.")
 
-    updated_record = submit_answers(db, record, answers)
+    saved = save_progress(db, record, answers)
+    return SaveProgressResponse(id=record.id, quiz_id=record.quiz_id, saved=saved)
 
-    return SubmitAnswersResponse(
-        id=updated_record.id,
-        quiz_id=updated_record.quiz_id,
-        user_id=updated_record.user_id,
-        score=updated_record.score,
-    )
+def raise_not_submittable(db: Session, quiz_id: int, record_id: int, user_id: int) -> None:
+    """조건부 UPDATE가 실패한 이유에 맞는 오류 (실패한 경우에만 조회)"""
+    record = get_quiz_record_by_id(db, record_id)
+    if not record or record.quiz_id != quiz_id:
+        raise HTTPException(status_code=404, detail="응시 기록을 찾을 수 없습니다.")
+    if record.user_id != user_id:
+        raise HTTPException(status_code=403, detail="본인 응시 기록이 아닙니다.")
+    raise HTTPException(status_code=409, detail="이미 제출된 응시 기록입니다.")
+
+def submit_answers_service(
+    db: Session,
+    quiz_id: int,
+    record_id: int,
+    answers: SubmitAnswersRequest,
+    current_user: User,
+    idempotency_key: Optional[str] = None
+) -> Union[SubmitAnswersResponse, SubmissionAcceptedResponse, StoredResponse]:
+    """
+    사용자가 답안을 제출 -> 자동 채점
+    SUBMIT_MODE=queue면 검증 후 대기열에 넣고 접수 응답만 반환 (채점은 워커가 처리)
+    응시 기록을 started -> submitted로 조건부 전환하므로 중복 제출은 UPDATE 한 번으로 거절되고,
+    Idempotency-Key가 주어졌다면 최초 응답을 그대로 반환
+    """
+    user_id = current_user["user_id"]
+    scope = f"submit:{record_id}"
+    fingerprint = None
+    if idempotency_key is not None:
+        check_key(idempotency_key)
+        fingerprint = request_fingerprint(answers.dict())
+
+    record = mark_submitted(db, record_id, quiz_id, user_id)
+    if record is None:
+        db.rollback()
+        if idempotency_key is not None:
+            stored = get_stored_response(db, user_id, scope, idempotency_key, fingerprint)
+            if stored is not None:
+                return stored
+        raise_not_submittable(db, quiz_id, record_id, user_id)
+
+    # 임시 저장 버퍼에서 꺼낸 답안은 커밋까지 실패하면(롤백되면) 버퍼에 되돌림
+    try:
+        with answer_flusher.drained(record.id) as buffered:
+            validate_answers(get_answer_key(db, quiz_id), answers.answers)
+            if SUBMIT_MODE == "queue":
+                if not enqueue_submission(db, record, answers, buffered):
+                    raise HTTPException(status_code=409, detail="이미 제출되어 채점 대기 중인 응시 기록입니다.")
+                response = SubmissionAcceptedResponse(
+                    id=record.id,
+                    quiz_id=record.quiz_id,
+                    user_id=record.user_id,
+                    grading_status="pending",
+                    status_url=f"/quiz/user/attempt/{record.id}",
+                )
+                status_code = 202
+            else:
+                grade_answers(db, record, answers, buffered)
+                db.flush()
+                db.refresh(record, ["score"])
+                response = SubmitAnswersResponse(
+                    id=record.id,
+                    quiz_id=record.quiz_id,
+                    user_id=record.user_id,
+                    score=record.score,
+                )
+                status_code = 200
+
+            if idempotency_key is not None:
+                store_response(db, user_id, scope, idempotency_key, fingerprint, status_code, response.dict())
+            db.commit()
+    except HTTPException:
+        # 검증 실패 시 submitted 전환도 되돌림
+        db.rollback()
+        raise
+
+    if status_code == 202:
+        notify_workers()
+    return response
 
 def get_quiz_record_service(db: Session, record_id: int, current_user: User) -> QuizRecordResponse:
     """응시 기록 조회 (본인만 가능)"""
@@ -76,4 +241,6 @@ def get_quiz_record_service(db: Session, record_id: int, current_user: User) ->
         quiz_id=record.quiz_id,
         user_id=record.user_id,
         score=record.score,
+        status=record.status,
+        grading_status=get_submission_status(db, record.id),
     )
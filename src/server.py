@@ -0,0 +1,260 @@
+"""
+운영용 실행 (워커 프로세스 여러 개가 한 소켓을 공유)
+
+    python -m src.server [--workers 4] [--host 0.0.0.0] [--port 8000] [--db-connections 60]
+
+- 부모 프로세스가 앱을 한 번 import(preload)한 뒤 워커를 fork (import 비용 & 메모리를 워커끼리 공유)
+- --db-connections(DB_MAX_CONNECTIONS)을 주면 워커 수로 나눠 워커당 DB_POOL_SIZE 설정 (max_overflow 0)
+  주지 않으면 DEFAULT_DB_CONNECTIONS를 워커 수로 나눠 워커당 풀 크기 결정 (DB_POOL_SIZE/DB_MAX_OVERFLOW를 직접 주면 그대로)
+- 워커가 2개 이상이면 워커 간 캐시 무효화 & 임시 저장 답안이 워커마다 따로 있으면 안 되므로
+  CACHE_BACKEND 기본값은 sqlite, ANSWER_BUFFER_BACKEND 기본값은 none (요청 안에서 바로 저장). memory를 직접 주면 시작 거부
+- 비밀번호 해시 프로세스 수(PASSWORD_HASH_WORKERS)는 CPU 코어 수 / (2 * 워커 수)
+- 워커는 커넥션/캐시/해시 프로세스를 준비한 뒤에 accept 시작 (WARM_UP), 준비되면 부모가 시작 시간 보고를 출력
+- SIGTERM/SIGINT: 새 연결을 받지 않고 처리 중 요청(제출 포함)을 --graceful-timeout초까지 기다린 뒤
+  채점 워커 정지, 임시 저장 답안 flush, 해시 프로세스 종료. 남은 워커는 여유 시간 후 SIGKILL
+- 워커가 비정상 종료하면 새로 fork
+"""
+import argparse
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import time
+
+# 준비된 워커의 시작 시간 보고를 기다리는 최대 시간 & 강제 종료 전 lifespan 종료(답안 flush 등) 여유 시간 (초)
+REPORT_TIMEOUT = 120
+DRAIN_MARGIN = 15
+# --db-connections를 주지 않았을 때 모든 워커가 나눠 쓸 DB 커넥션 수 (PostgreSQL 기본 max_connections 100에서 여유를 둠)
+# 워커당 상한은 단일 프로세스 기본값과 같은 5 + overflow 10
+DEFAULT_DB_CONNECTIONS = 80
+WORKER_POOL_SIZE = 5
+WORKER_MAX_CONNECTIONS = 15
+
+REPORT_COLUMNS = (
+    ("pid", "pid", "{:d}"),
+    ("ready_seconds", "ready_ms", "{:.0f}"),
+    ("connections_seconds", "conn_ms", "{:.0f}"),
+    ("caches_seconds", "cache_ms", "{:.0f}"),
+    ("password_pool_seconds", "hash_ms", "{:.0f}"),
+    ("connections", "conns", "{:.0f}"),
+    ("quizzes", "quizzes", "{:.0f}"),
+)
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """앱 import 전에 워커별 설정 (common.db.database 등은 import 시점에 환경 변수를 읽음)"""
+    if args.db_connections:
+        os.environ["DB_POOL_SIZE"] = str(max(1, args.db_connections // args.workers))
+        os.environ["DB_MAX_OVERFLOW"] = "0"
+    elif "DB_POOL_SIZE" not in os.environ and "DB_MAX_OVERFLOW" not in os.environ:
+        per_worker = max(1, min(WORKER_MAX_CONNECTIONS, DEFAULT_DB_CONNECTIONS // args.workers))
+        pool_size = min(WORKER_POOL_SIZE, per_worker)
+        os.environ["DB_POOL_SIZE"] = str(pool_size)
+        os.environ["DB_MAX_OVERFLOW"] = str(per_worker - pool_size)
+
+    # 워커끼리 나눠 쓰도록 해시 프로세스 수 조정 (워커마다 CPU 코어 수 / 2개씩 띄우지 않게)
+    os.environ.setdefault("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // (2 * args.workers))))
+
+    if args.workers > 1:
+        # 워커마다 따로인 캐시는 다른 워커의 퀴즈 수정(무효화)을 모르고,
+        # 메모리 버퍼의 임시 저장 답안은 다른 워커가 처리한 제출에서 빠짐
+        for name, default in (("CACHE_BACKEND", "sqlite"), ("ANSWER_BUFFER_BACKEND", "none")):
+            if os.environ.get(name) == "memory":
+                raise SystemExit(f"워커가 {args.workers}개일 때 {name}=memory는 사용할 수 없습니다 (기본값: {default})")
+            os.environ.setdefault(name, default)
+
+    if args.no_warm_up:
+        os.environ["WARM_UP"] = "false"
+    else:
+        os.environ.setdefault("WARM_UP", "true")
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def print_report(report: dict) -> None:
+    values = []
+    for key, _, fmt in REPORT_COLUMNS:
+        value = report.get(key)
+        if key.endswith("_seconds") and value is not None:
+            value *= 1000
+        values.append("-" if value is None else fmt.format(value))
+    print("  ".join(f"{value:>8s}" for value in values), flush=True)
+
+
+def run_worker(sock: socket.socket, args: argparse.Namespace, report_fd: int, forked_at: float) -> None:
+    """fork된 워커: 부모에서 만든 엔진의 커넥션을 버리고 uvicorn 실행"""
+    import uvicorn
+    from common.db.database import async_engine, engine
+    from src.main import app
+    from src.warmup import startup_report
+
+    # 부모에서 연 커넥션(있다면)을 자식이 닫지 않도록 풀만 새로 만듦
+    engine.dispose(close=False)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+
+    class WorkerServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            # lifespan 시작(warm-up)이 끝나고 accept를 시작한 시점
+            startup_report["ready_seconds"] = time.monotonic() - forked_at
+            os.write(report_fd, (json.dumps({"pid": os.getpid(), **startup_report}) + "\n").encode())
+
+    config = uvicorn.Config(
+        app,
+        lifespan="on",
+        log_level=args.log_level,
+        access_log=args.access_log,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        timeout_keep_alive=args.keep_alive,
+    )
+    WorkerServer(config).run(sockets=[sock])
+
+
+class Supervisor:
+    """워커 fork & 감시 & 종료"""
+
+    def __init__(self, sock: socket.socket, args: argparse.Namespace):
+        self.sock = sock
+        self.args = args
+        self.workers = {}
+        self.stopping = False
+        self.report_read, self.report_write = os.pipe()
+        self.reported = 0
+
+    def spawn(self) -> None:
+        forked_at = time.monotonic()
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                os.close(self.report_read)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                run_worker(self.sock, self.args, self.report_write, forked_at)
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        self.workers[pid] = forked_at
+
+    def stop(self, signum, frame) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        print(f"종료 신호 수신: 워커 {len(self.workers)}개 정리 중 (최대 {self.args.graceful_timeout}초)", flush=True)
+        for pid in self.workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def read_reports(self, timeout: float) -> None:
+        ready, _, _ = select.select([self.report_read], [], [], timeout)
+        if not ready:
+            return
+        for line in os.read(self.report_read, 65536).decode().splitlines():
+            if self.reported == 0:
+                print("  ".join(f"{title:>8s}" for _, title, _ in REPORT_COLUMNS), flush=True)
+            self.reported += 1
+            print_report(json.loads(line))
+            if self.reported == self.args.workers:
+                print(f"워커 {self.args.workers}개 준비 완료 (http://{self.args.host}:{self.args.port})", flush=True)
+
+    def reap(self) -> None:
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.workers.clear()
+                return
+            if pid == 0:
+                return
+            self.workers.pop(pid, None)
+            if not self.stopping:
+                print(f"워커 {pid} 비정상 종료 (status={status}), 다시 시작", flush=True)
+                self.spawn()
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.args.workers):
+            self.spawn()
+
+        started = time.monotonic()
+        deadline = None
+        while self.workers:
+            try:
+                self.read_reports(0.5)
+            except InterruptedError:
+                pass
+            self.reap()
+            if self.reported < self.args.workers and time.monotonic() - started > REPORT_TIMEOUT and not self.stopping:
+                print(f"경고: {REPORT_TIMEOUT}초 안에 준비된 워커 {self.reported}/{self.args.workers}개", flush=True)
+                started = float("inf")
+            if self.stopping:
+                deadline = deadline or time.monotonic() + self.args.graceful_timeout + DRAIN_MARGIN
+                if time.monotonic() > deadline:
+                    for pid in list(self.workers):
+                        print(f"워커 {pid} 강제 종료", flush=True)
+                        os.kill(pid, signal.SIGKILL)
+                    deadline = float("inf")
+        return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="운영용 멀티 워커 실행")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+                        help="워커 프로세스 수 (기본값: WEB_CONCURRENCY 또는 CPU 코어 수)")
+    parser.add_argument("--db-connections", type=int, default=int(os.getenv("DB_MAX_CONNECTIONS", "0")),
+                        help=f"모든 워커가 쓸 DB 커넥션 총수 (0이면 DB_POOL_SIZE/DB_MAX_OVERFLOW, 둘 다 없으면 {DEFAULT_DB_CONNECTIONS}을 워커 수로 나눔)")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.getenv("GRACEFUL_TIMEOUT", "30")),
+                        help="종료 시 처리 중 요청을 기다리는 최대 시간 (초)")
+    parser.add_argument("--keep-alive", type=int, default=5, help="HTTP keep-alive 유지 시간 (초)")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--no-warm-up", action="store_true", help="요청 수신 전 커넥션/캐시 준비 생략")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args()
+    args.workers = max(1, args.workers)
+
+    configure_environment(args)
+    sock = bind_socket(args.host, args.port, args.backlog)
+
+    # preload: 앱 & 의존 모듈 import, OpenAPI 스키마 생성을 부모에서 한 번만 (워커는 fork로 공유)
+    start = time.perf_counter()
+    from common.cache.backends import CACHE_BACKEND
+    from common.db.database import DB_MAX_OVERFLOW, DB_POOL_SIZE
+    from src.main import app
+    from src.quiz.repository.answer_buffer import ANSWER_BUFFER_BACKEND
+    from src.warmup import startup_report
+    from util.password import PASSWORD_HASH_WORKERS
+    app.openapi()
+    startup_report["import_seconds"] = time.perf_counter() - start
+    print(f"앱 preload {startup_report['import_seconds'] * 1000:.0f}ms, 워커 {args.workers}개 시작", flush=True)
+    print(
+        f"워커당 DB 풀 {DB_POOL_SIZE}+{DB_MAX_OVERFLOW}, 해시 프로세스 {PASSWORD_HASH_WORKERS}, "
+        f"캐시 {CACHE_BACKEND}, 임시 저장 버퍼 {ANSWER_BUFFER_BACKEND}",
+        flush=True,
+    )
+
+    sys.exit(Supervisor(sock, args).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,17 @@
 from sqlalchemy.orm import Session
 from src.user.model import User
 from src.user.schema.schema import UserCreate
-from passlib.context import CryptContext
 from datetime import datetime
 import pytz
 
 KST = pytz.timezone("Asia/Seoul")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def create_user(db: Session, user_data: UserCreate):
-    hashed_password = pwd_context.hash(user_data.password)
+def create_user(db: Session, user_data: UserCreate, password_hash: str):
+    """사용자 생성 (비밀번호 해시는 호출 측에서 해시 프로세스 풀로 계산해 전달)"""
     db_user = User(
         username=user_data.username, 
         email=user_data.email, 
-        password_hash=hashed_password, 
+        password_hash=password_hash, 
         is_admin=user_data.is_admin,
         created_at=datetime.now(KST),
         updated_at=datetime.now(KST))
@@ -24,3 +22,9 @@ def create_user(db: Session, user_data: UserCreate):
 
 def get_user_by_email(db: Session, email: str):
     return db.query(User).filter(User.email == email).first()
+
+def update_password_hash(db: Session, user: User, password_hash: str):
+    """비밀번호 해시 교체 (bcrypt cost 변경 시 로그인 과정에서 재해시)"""
+    user.password_hash = password_hash
+    user.updated_at = datetime.now(KST)
+    db.commit()
@@ -1,15 +1,15 @@
-from common.db.database import get_db  # DB 세션 의존성
+from common.db.database import DBSession, get_session  # DB 세션 의존성
+from common.middleware.metrics import MetricsRoute
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 from src.user.schema.schema import TokenResponse, UserCreate, UserLogin
 from src.user.service.service import authenticate_user, register_user
 
-router = APIRouter()
+router = APIRouter(route_class=MetricsRoute)
 
 @router.post(
     "/register"
 )
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: DBSession = Depends(get_session)):
     """
     ** 회원가입 API **
     - **새로운 사용자를 생성**합니다.  
@@ -18,13 +18,13 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     - 비밀번호는 해시화되어 저장됩니다.  
     - 성공 시, 생성된 사용자 정보 반환.
     """
-    return register_user(db, user_data)
+    return await register_user(db, user_data)
 
 @router.post(
     "/login",
     response_model=TokenResponse
 )
-def login(login_data: UserLogin, db: Session = Depends(get_db)):
+async def login(login_data: UserLogin, db: DBSession = Depends(get_session)):
     """  
     ** 로그인 API ** 
     - **등록된 사용자만 로그인 가능**합니다.  
@@ -32,5 +32,5 @@ def login(login_data: UserLogin, db: Session = Depends(get_db)):
     - 비밀번호 검증 후 **JWT 토큰 발급.**  
     - 발급된 토큰은 API 호출 시 **인증 헤더에 포함하여 사용.**
     """
-    return authenticate_user(db, login_data)
+    return await authenticate_user(db, login_data)
 
@@ -1,25 +1,33 @@
+from common.db.database import DBSession, run_db
+from util.password import hash_password, needs_rehash, verify_password
 from util.security import create_access_token
-from sqlalchemy.orm import Session
-from src.user.repository.repository import create_user, get_user_by_email
+from src.user.repository.repository import create_user, get_user_by_email, update_password_hash
 from src.user.schema.schema import TokenResponse, UserCreate, UserLogin, UserResponse
-from passlib.context import CryptContext
 from fastapi import HTTPException
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def register_user(db: Session, user_data: UserCreate) -> UserResponse:
-    existing_user = get_user_by_email(db, user_data.email)
+async def register_user(db: DBSession, user_data: UserCreate) -> UserResponse:
+    existing_user = await run_db(db, get_user_by_email, user_data.email)
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    new_user = create_user(db, user_data)
+    # bcrypt는 요청 스레드가 아닌 해시 전용 프로세스 풀에서 계산
+    password_hash = await hash_password(user_data.password)
+    new_user = await run_db(db, create_user, user_data, password_hash)
     return UserResponse(id=new_user.id, username=new_user.username, email=new_user.email)
 
-def authenticate_user(db: Session, login_data: UserLogin) -> TokenResponse:
+async def authenticate_user(db: DBSession, login_data: UserLogin) -> TokenResponse:
     """사용자 인증 후 JWT 토큰 발급"""
-    user = get_user_by_email(db, login_data.email)
-    if not user or not pwd_context.verify(login_data.password, user.password_hash):
+    user = await run_db(db, get_user_by_email, login_data.email)
+    if not user or not await verify_password(login_data.password, user.password_hash):
         raise HTTPException(status_code=400, detail="Invalid credentials")
+
+    # bcrypt cost가 바뀌었으면 로그인 성공 시점에 새 cost로 재해시 (실패해도 로그인은 진행)
+    if needs_rehash(user.password_hash):
+        try:
+            new_hash = await hash_password(login_data.password)
+            await run_db(db, update_password_hash, user, new_hash)
+        except HTTPException:
+            pass
     
     access_token = create_access_token(data={"sub": user.email, "user_id": user.id, "is_admin": user.is_admin})
     
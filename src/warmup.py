@@ -0,0 +1,89 @@
+import asyncio
+import os
+import time
+from typing import Dict
+
+from common.db.database import (DB_POOL_SIZE, SessionLocal, async_engine,
+                                engine)
+from sqlalchemy import select, text
+from src.quiz.model import Quiz
+from src.quiz.repository.snapshot import PublishedQuiz, get_quiz_for_read
+from src.quiz.repository.user_repository import (get_answer_key,
+                                                 get_quiz_page_content)
+from starlette.concurrency import run_in_threadpool
+from util.password import start_password_pool
+
+# true면 워커가 요청을 받기 전에 커넥션/캐시/해시 프로세스를 미리 준비 (python -m src.server는 기본 true)
+WARM_UP = os.getenv("WARM_UP", "false").lower() in ("1", "true", "yes")
+# 미리 캐시에 올릴 퀴즈 수 (최근 게시 순, 그다음 최근 생성 순)
+WARM_UP_QUIZZES = int(os.getenv("WARM_UP_QUIZZES", "20"))
+
+# 이 워커의 시작 단계별 소요 시간 (초) & 준비한 항목 수. /metrics와 시작 보고에 사용
+startup_report: Dict[str, float] = {}
+
+
+def warm_connections() -> int:
+    """풀 크기만큼 커넥션을 동시에 열어 SELECT 1 후 반납 (첫 요청이 connect/인증 비용을 내지 않게 함)"""
+    conns = []
+    try:
+        for _ in range(DB_POOL_SIZE):
+            conn = engine.connect()
+            conns.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            conn.close()
+    return len(conns)
+
+
+async def warm_async_connections() -> int:
+    async def open_connection():
+        conn = await async_engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    conns = await asyncio.gather(*(open_connection() for _ in range(DB_POOL_SIZE)))
+    for conn in conns:
+        await conn.close()
+    return len(conns)
+
+
+def warm_caches(limit: int) -> int:
+    """최근 퀴즈의 스냅샷(또는 첫 페이지) & 정답표를 캐시에 적재 (SQL 컴파일 캐시도 함께 채워짐)"""
+    db = SessionLocal()
+    try:
+        quiz_ids = db.execute(
+            select(Quiz.id)
+            .where(Quiz.num_questions > 0)
+            .order_by(Quiz.published_at.desc().nulls_last(), Quiz.id.desc())
+            .limit(limit)
+        ).scalars().all()
+        for quiz_id in quiz_ids:
+            quiz = get_quiz_for_read(db, quiz_id)
+            if quiz is None:
+                continue
+            if not isinstance(quiz, PublishedQuiz):
+                get_quiz_page_content(db, quiz, 1)
+            get_answer_key(db, quiz_id)
+        return len(quiz_ids)
+    finally:
+        db.close()
+
+
+async def warm_up() -> Dict[str, float]:
+    """요청을 받기 전 준비 단계 실행 & 단계별 시간 기록"""
+    start = time.perf_counter()
+    connections = await run_in_threadpool(warm_connections)
+    if async_engine is not None:
+        connections += await warm_async_connections()
+    startup_report["connections"] = connections
+    startup_report["connections_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    startup_report["quizzes"] = await run_in_threadpool(warm_caches, WARM_UP_QUIZZES)
+    startup_report["caches_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    startup_report["password_workers"] = await run_in_threadpool(start_password_pool)
+    startup_report["password_pool_seconds"] = time.perf_counter() - start
+    return startup_report
@@ -0,0 +1,81 @@
+"""
+테스트용 DB: Postgres 대신 임시 SQLite 파일 (JSONB/ARRAY는 JSON으로 생성)
+쓰기 가능한 CTE(Idempotency-Key로 응시 시작) 등 Postgres 전용 문장을 쓰는 경로는 여기서 검증하지 않음
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json(type_, compiler, **kw):
+    return "JSON"
+
+
+from common.db.database import Base  # noqa: E402
+from src.main import app  # noqa: E402,F401  (모든 모델 등록)
+from src.quiz.repository.cache import (answer_key_cache, quiz_content_cache,  # noqa: E402
+                                       quiz_page_cache, quiz_snapshot_cache)
+
+CACHES = (answer_key_cache, quiz_page_cache, quiz_content_cache, quiz_snapshot_cache)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'quiz.sqlite3'}")
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys(conn, _):
+        conn.execute("PRAGMA foreign_keys = ON")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # 테스트마다 DB가 새로 만들어지므로 같은 quiz id의 캐시가 남지 않게 비움
+    for cache in CACHES:
+        cache.clear()
+    yield
+    for cache in CACHES:
+        cache.clear()
+
+
+@pytest.fixture
+def statement_counter(engine):
+    """실행된 SQL 문장 수 세기: with statement_counter() as count: ... count()"""
+    class Counter:
+        def __init__(self):
+            self.statements = []
+
+        def __enter__(self):
+            event.listen(engine, "before_cursor_execute", self._record)
+            return self
+
+        def __exit__(self, *exc):
+            event.remove(engine, "before_cursor_execute", self._record)
+
+        def _record(self, conn, cursor, statement, parameters, context, executemany):
+            self.statements.append(statement)
+
+        def __call__(self) -> int:
+            return len(self.statements)
+
+    return Counter
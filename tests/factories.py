@@ -0,0 +1,28 @@
+from src.quiz.model import Choice, Question, Quiz
+
+
+def make_quiz(db, questions: int, choices: int = 4, per_page: int = 10) -> Quiz:
+    """문제마다 첫 번째 선택지가 정답인 퀴즈 생성"""
+    quiz = Quiz(title="퀴즈", description="테스트", num_questions=questions, questions_per_page=per_page)
+    db.add(quiz)
+    db.flush()
+    for i in range(questions):
+        question = Question(quiz_id=quiz.id, question_text=f"문제 {i + 1}")
+        db.add(question)
+        db.flush()
+        db.add_all(
+            Choice(question_id=question.id, choice_text=f"선택지 {j + 1}", is_correct=j == 0)
+            for j in range(choices)
+        )
+    db.commit()
+    return quiz
+
+
+def answer_sheet(db, quiz: Quiz, correct: int) -> list:
+    """앞의 correct개 문제는 정답, 나머지는 오답인 [{"question_id", "choice_id"}]"""
+    sheet = []
+    questions = db.query(Question).filter(Question.quiz_id == quiz.id).order_by(Question.id).all()
+    for i, question in enumerate(questions):
+        choice = sorted(question.choices, key=lambda c: c.id)[0 if i < correct else 1]
+        sheet.append({"question_id": question.id, "choice_id": choice.id})
+    return sheet
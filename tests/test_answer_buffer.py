@@ -0,0 +1,114 @@
+"""임시 저장 버퍼의 flush/제출 순서: 늦게 도착한 답안, 저장 중인 답안, 실패 시 되돌리기"""
+import pytest
+from src.quiz.model.answer import Answer
+from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.repository import answer_buffer as answer_buffer_module
+from src.quiz.repository import user_repository
+from src.quiz.repository.answer_buffer import AnswerBufferFlusher, InMemoryAnswerBuffer, NoAnswerBuffer
+from src.quiz.repository.user_repository import grade_answers
+from src.quiz.schema.user_schema import SaveProgressRequest, SubmitAnswersRequest
+from tests.factories import answer_sheet, make_quiz
+
+
+@pytest.fixture
+def flusher(monkeypatch, session_factory):
+    # flush는 자체 세션을 열므로 테스트 DB로 연결
+    monkeypatch.setattr(answer_buffer_module, "SessionLocal", session_factory)
+    return AnswerBufferFlusher(InMemoryAnswerBuffer())
+
+
+@pytest.fixture
+def attempt(db):
+    quiz = make_quiz(db, questions=4)
+    record = QuizRecord(quiz_id=quiz.id, user_id=1, score=0, status="started")
+    db.add(record)
+    db.commit()
+    sheet = {item["question_id"]: item["choice_id"] for item in answer_sheet(db, quiz, correct=4)}
+    return record.id, sheet
+
+
+def saved_answers(db, record_id: int) -> dict:
+    db.expire_all()
+    return {a.question_id: a.choice_id for a in db.query(Answer).filter(Answer.quiz_record_id == record_id)}
+
+
+def test_flush_saves_buffered_answers(db, flusher, attempt):
+    record_id, sheet = attempt
+    flusher.buffer.put(record_id, sheet)
+
+    assert flusher.flush() == len(sheet)
+    assert saved_answers(db, record_id) == sheet
+    assert flusher.buffer.pending() == 0
+
+
+def test_flush_drops_answers_for_submitted_record(db, flusher, attempt):
+    record_id, sheet = attempt
+    flusher.buffer.put(record_id, sheet)
+    db.get(QuizRecord, record_id).status = "submitted"
+    db.commit()
+
+    assert flusher.flush() == 0
+    assert saved_answers(db, record_id) == {}
+    assert flusher.buffer.pending() == 0
+
+
+def test_drained_sees_inflight_answers_without_waiting_for_flush(db, flusher, attempt, monkeypatch):
+    record_id, sheet = attempt
+    flusher.buffer.put(record_id, sheet)
+    upsert = answer_buffer_module.upsert_answers
+    seen = {}
+
+    def upsert_during_submit(session, pending, started_only=False):
+        # flush가 DB에 쓰는 동안 lock을 잡고 있지 않아야 하고, 제출은 저장 중인 답안도 가져가야 함
+        assert flusher.lock.acquire(timeout=1)
+        flusher.lock.release()
+        with flusher.drained(record_id) as buffered:
+            seen.update(buffered)
+        return upsert(session, pending, started_only)
+
+    monkeypatch.setattr(answer_buffer_module, "upsert_answers", upsert_during_submit)
+    flusher.flush()
+
+    assert seen == sheet
+    assert flusher._inflight == {}
+
+
+def test_drained_restores_answers_on_failure(flusher, attempt):
+    record_id, sheet = attempt
+    flusher.buffer.put(record_id, sheet)
+
+    with pytest.raises(RuntimeError):
+        with flusher.drained(record_id) as buffered:
+            assert buffered == sheet
+            raise RuntimeError("commit failed")
+
+    assert flusher.buffer.pending() == len(sheet)
+    with flusher.drained(record_id) as buffered:
+        assert buffered == sheet
+    assert flusher.buffer.pending() == 0
+
+
+def test_drained_answers_are_graded_with_submission(db, flusher, attempt):
+    record_id, sheet = attempt
+    first, *rest = sheet.items()
+    flusher.buffer.put(record_id, dict(rest))
+
+    record = db.get(QuizRecord, record_id)
+    answers = SubmitAnswersRequest(answers=[{"question_id": first[0], "choice_id": first[1]}])
+    with flusher.drained(record_id) as buffered:
+        grade_answers(db, record, answers, buffered)
+        db.commit()
+
+    assert db.get(QuizRecord, record_id).score == 100
+    assert saved_answers(db, record_id) == sheet
+    assert flusher.buffer.pending() == 0
+
+
+def test_save_progress_without_buffer_writes_directly(db, attempt, monkeypatch):
+    record_id, sheet = attempt
+    monkeypatch.setattr(user_repository, "answer_buffer", NoAnswerBuffer())
+
+    record = db.get(QuizRecord, record_id)
+    answers = SaveProgressRequest(answers=[{"question_id": q, "choice_id": c} for q, c in sheet.items()])
+    assert user_repository.save_progress(db, record, answers) == len(sheet)
+    assert saved_answers(db, record_id) == sheet
@@ -0,0 +1,49 @@
+"""응시별 고정 순서 조회: 본인 응시 기록만 seed로 사용"""
+import pytest
+from fastapi.exceptions import HTTPException
+from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.service.user_service import get_user_quiz_detail_service
+from tests.factories import make_quiz
+
+USER = {"user_id": 1, "is_admin": False}
+
+
+@pytest.fixture
+def quiz_with_attempt(db):
+    quiz = make_quiz(db, questions=6, per_page=3)
+    quiz.is_random_questions = True
+    quiz.is_random_choices = True
+    record = QuizRecord(quiz_id=quiz.id, user_id=USER["user_id"], score=0, status="started")
+    db.add(record)
+    db.commit()
+    return quiz.id, record.id
+
+
+def test_attempt_order_is_stable(db, quiz_with_attempt):
+    quiz_id, record_id = quiz_with_attempt
+
+    first, etag = get_user_quiz_detail_service(db, quiz_id, 1, USER, attempt_id=record_id)
+    again, _ = get_user_quiz_detail_service(db, quiz_id, 1, USER, attempt_id=record_id)
+    assert first == again
+    assert etag is not None
+
+
+def test_other_users_attempt_is_forbidden(db, quiz_with_attempt):
+    quiz_id, record_id = quiz_with_attempt
+
+    with pytest.raises(HTTPException) as exc:
+        get_user_quiz_detail_service(db, quiz_id, 1, {"user_id": 2, "is_admin": False}, attempt_id=record_id)
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.parametrize("other_quiz", [True, False])
+def test_unknown_attempt_is_not_found(db, quiz_with_attempt, other_quiz):
+    quiz_id, record_id = quiz_with_attempt
+    if other_quiz:
+        quiz_id = make_quiz(db, questions=2).id
+    else:
+        record_id += 100
+
+    with pytest.raises(HTTPException) as exc:
+        get_user_quiz_detail_service(db, quiz_id, 1, USER, attempt_id=record_id)
+    assert exc.value.status_code == 404
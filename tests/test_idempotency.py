@@ -0,0 +1,62 @@
+"""같은 Idempotency-Key로 제출을 재시도하면 다시 채점하지 않고 최초 응답을 반환하는지"""
+import pytest
+from fastapi.exceptions import HTTPException
+from src.quiz.model.idempotency_key import IdempotencyKey
+from src.quiz.model.quiz_record import QuizRecord
+from src.quiz.repository.idempotency import StoredResponse
+from src.quiz.schema.user_schema import SubmitAnswersRequest
+from src.quiz.service.user_service import start_quiz_record_service, submit_answers_service
+from tests.factories import answer_sheet, make_quiz
+
+USER = {"user_id": 1, "is_admin": False}
+
+
+@pytest.fixture
+def attempt(db):
+    quiz = make_quiz(db, questions=4)
+    record = start_quiz_record_service(db, quiz.id, USER)
+    return quiz.id, record.id, SubmitAnswersRequest(answers=answer_sheet(db, quiz, correct=3))
+
+
+def test_submit_replay_returns_first_response(db, attempt):
+    quiz_id, record_id, answers = attempt
+
+    first = submit_answers_service(db, quiz_id, record_id, answers, USER, idempotency_key="submit-1")
+    assert first.score == 75
+
+    replay = submit_answers_service(db, quiz_id, record_id, answers, USER, idempotency_key="submit-1")
+    assert replay == StoredResponse(status_code=200, body=first.dict())
+    assert db.query(IdempotencyKey).count() == 1
+    assert db.get(QuizRecord, record_id).status == "submitted"
+
+
+def test_submit_replay_with_different_body_is_rejected(db, attempt):
+    quiz_id, record_id, answers = attempt
+    submit_answers_service(db, quiz_id, record_id, answers, USER, idempotency_key="submit-1")
+
+    changed = SubmitAnswersRequest(answers=answers.answers[:1])
+    with pytest.raises(HTTPException) as exc:
+        submit_answers_service(db, quiz_id, record_id, changed, USER, idempotency_key="submit-1")
+    assert exc.value.status_code == 422
+
+
+def test_second_submit_without_key_is_conflict(db, attempt):
+    quiz_id, record_id, answers = attempt
+    submit_answers_service(db, quiz_id, record_id, answers, USER)
+
+    with pytest.raises(HTTPException) as exc:
+        submit_answers_service(db, quiz_id, record_id, answers, USER)
+    assert exc.value.status_code == 409
+
+
+def test_failed_validation_keeps_attempt_open(db, attempt):
+    quiz_id, record_id, answers = attempt
+    invalid = SubmitAnswersRequest(answers=[{"question_id": answers.answers[0].question_id, "choice_id": 999}])
+
+    with pytest.raises(HTTPException) as exc:
+        submit_answers_service(db, quiz_id, record_id, invalid, USER, idempotency_key="submit-1")
+    assert exc.value.status_code == 400
+
+    # 검증 실패는 submitted 전환과 키 저장을 모두 되돌리므로 같은 키로 다시 제출 가능
+    retry = submit_answers_service(db, quiz_id, record_id, answers, USER, idempotency_key="submit-1")
+    assert retry.score == 75
@@ -0,0 +1,55 @@
+"""keyset 커서: 조작된 커서는 DB까지 가지 않고 400"""
+import base64
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.exceptions import HTTPException
+from src.quiz.repository.pagination import decode_cursor, encode_cursor
+from src.quiz.repository.repository import get_quiz_detail
+from tests.factories import make_quiz
+
+
+def raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("sort_by, value", [
+    ("created_at", datetime(2025, 3, 1, 12, 30)),
+    ("updated_at", datetime(2025, 3, 1, 12, 30)),
+    ("title", "퀴즈"),
+    ("id", 7),
+])
+def test_cursor_round_trip(sort_by, value):
+    assert decode_cursor(encode_cursor(sort_by, "desc", value, 7), sort_by, "desc") == (value, 7)
+
+
+@pytest.mark.parametrize("cursor, sort_by", [
+    (raw_cursor(["created_at", "desc", "abc", 1]), "created_at"),
+    (raw_cursor(["created_at", "desc", 5, 1]), "created_at"),
+    (raw_cursor(["title", "desc", 5, 1]), "title"),
+    (raw_cursor(["id", "desc", "5", 5]), "id"),
+    (raw_cursor(["id", "desc", True, 5]), "id"),
+    (raw_cursor(["id", "desc", 5, "5"]), "id"),
+    (raw_cursor(["id", "desc", 5, "abc"]), "id"),
+    (raw_cursor(["created_at", "desc", {"dt": "not a date"}, 1]), "created_at"),
+    (raw_cursor(["id", "desc", 5]), "id"),
+    ("!!not base64!!", "id"),
+])
+def test_tampered_cursor_is_bad_request(cursor, sort_by):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, sort_by, "desc")
+    assert exc.value.status_code == 400
+
+
+def test_question_keyset_pages_cover_every_question(db):
+    quiz_id = make_quiz(db, questions=7).id
+
+    seen, cursor = [], None
+    for _ in range(5):
+        detail = get_quiz_detail(db, quiz_id, page=1, page_size=3, sort_by="id", cursor=cursor)
+        seen += [question["id"] for question in detail["questions"]]
+        cursor = detail["next_cursor"]
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 7
@@ -0,0 +1,44 @@
+"""문제/선택지 조회 쿼리 수가 페이지 크기와 무관하게 고정인지 (N+1 회귀 방지)"""
+import pytest
+from src.quiz.repository.repository import get_quiz_detail
+from src.quiz.repository.user_repository import get_user_quiz_detail
+from tests.factories import make_quiz
+
+PAGE_SIZES = (1, 10, 50)
+
+
+def test_admin_quiz_detail_query_count_is_constant(db, statement_counter):
+    quiz_id = make_quiz(db, questions=50, choices=5).id
+
+    counts = {}
+    for page_size in PAGE_SIZES:
+        with statement_counter() as count:
+            detail = get_quiz_detail(db, quiz_id, page=1, page_size=page_size)
+        assert len(detail["questions"]) == page_size
+        assert all(len(question["choices"]) == 5 for question in detail["questions"])
+        counts[page_size] = count()
+
+    assert len(set(counts.values())) == 1, counts
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+def test_user_quiz_detail_query_count_is_constant(db, statement_counter, page_size):
+    quiz = make_quiz(db, questions=50, choices=5, per_page=page_size)
+    one_question = make_quiz(db, questions=1, choices=5, per_page=1)
+
+    with statement_counter() as baseline:
+        get_user_quiz_detail(db, one_question, 1)
+    with statement_counter() as count:
+        detail = get_user_quiz_detail(db, quiz, 1)
+
+    assert len(detail["questions"]) == page_size
+    assert count() == baseline()
+
+
+def test_user_quiz_detail_page_is_cached(db, statement_counter):
+    quiz = make_quiz(db, questions=20, choices=4, per_page=10)
+    get_user_quiz_detail(db, quiz, 1)
+
+    with statement_counter() as count:
+        get_user_quiz_detail(db, quiz, 1)
+    assert count() == 0
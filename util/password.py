@@ -0,0 +1,101 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+# bcrypt cost (값을 바꾸면 기존 해시는 다음 로그인 시 새 cost로 재해시됨)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# 해시 전용 프로세스 수 & 대기열 상한 (상한을 넘으면 503 + Retry-After)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "64"))
+PASSWORD_HASH_RETRY_AFTER = os.getenv("PASSWORD_HASH_RETRY_AFTER", "1")
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_pending = 0
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    return pwd_context.verify(password, password_hash)
+
+
+def _warm() -> int:
+    # 해시 프로세스에서 passlib & bcrypt 백엔드 로드
+    pwd_context.handler("bcrypt").get_backend()
+    return os.getpid()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            # 스레드가 떠 있는 서버 프로세스에서 fork하지 않도록 spawn 사용
+            _executor = ProcessPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+async def _run(fn, *args):
+    """해시 프로세스 풀에서 실행. 대기열이 가득 차면 바로 503으로 거절 (backpressure)"""
+    global _pending
+    with _lock:
+        if _pending >= PASSWORD_HASH_QUEUE_LIMIT:
+            raise HTTPException(
+                status_code=503,
+                detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": PASSWORD_HASH_RETRY_AFTER},
+            )
+        _pending += 1
+    try:
+        return await asyncio.wrap_future(_get_executor().submit(fn, *args))
+    finally:
+        with _lock:
+            _pending -= 1
+
+
+async def hash_password(password: str) -> str:
+    """비밀번호 해시 (현재 BCRYPT_ROUNDS 적용)"""
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """비밀번호 검증"""
+    return await _run(_verify, password, password_hash)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """해시의 cost가 현재 BCRYPT_ROUNDS와 다르거나 deprecated 스킴이면 True"""
+    try:
+        rounds = int(password_hash.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != BCRYPT_ROUNDS or pwd_context.needs_update(password_hash)
+
+
+def start_password_pool() -> int:
+    """해시 프로세스를 미리 띄워 첫 로그인 요청이 프로세스 생성(spawn) 비용을 내지 않게 함. 띄운 프로세스 수 반환"""
+    executor = _get_executor()
+    futures = [executor.submit(_warm) for _ in range(PASSWORD_HASH_WORKERS)]
+    return len({future.result() for future in futures})
+
+
+def shutdown_password_pool() -> None:
+    """해시 프로세스 풀 종료"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)